@@ -0,0 +1,11 @@
+# =============================================================================
+# Twitwi Benchmarks
+# =============================================================================
+#
+# Scripts measuring the throughput of the library's hot paths. They are not
+# shipped with the package and can be run from the repository's root, e.g.:
+#
+#   python -m bench run -o results.json
+#   python -m bench compare before.json results.json
+#   python -m bench.dates
+#
@@ -0,0 +1,79 @@
+# =============================================================================
+# Twitwi Columnar Export Benchmark
+# =============================================================================
+#
+# Compares the peak memory & time of building columns by hand from a list of
+# normalized tweets with streaming them through `twitwi.columnar` row groups,
+# memory being traced with `tracemalloc`, which slows normalization down.
+#
+#   python -m bench.columnar [--size N] [--row-group-size N] [--numpy]
+#
+import tracemalloc
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+
+from twitwi import normalize_tweet
+from twitwi.columnar import iter_row_groups, get_column_types
+
+from bench.generators import generate_v1_tweets
+
+
+def normalize_all(payloads):
+    for payload in payloads:
+        yield normalize_tweet(payload, collection_source="bench")
+
+
+def by_hand(payloads, row_group_size, numpy):
+    tweets = list(normalize_all(payloads))
+    columns = {field: [tweet.get(field) for tweet in tweets] for field in tweets[0]}
+
+    return len(columns)
+
+
+def streamed(payloads, row_group_size, numpy):
+    groups = 0
+
+    for _ in iter_row_groups(
+        normalize_all(payloads), row_group_size=row_group_size, numpy=numpy
+    ):
+        groups += 1
+
+    return groups
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = timer()
+    fn(*args)
+    elapsed = timer() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark twitwi's columnar export")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--row-group-size", type=int, default=8192)
+    parser.add_argument("--numpy", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        "Building %i columns from %i tweets"
+        % (len(get_column_types("tweet")), args.size)
+    )
+    print()
+
+    # NOTE: payloads are generated beforehand, so that only the memory
+    # allocated on top of them is measured
+    payloads = generate_v1_tweets(args.size, args.seed)
+
+    for name, fn in [("by hand", by_hand), ("row groups", streamed)]:
+        elapsed, peak = measure(fn, payloads, args.row_group_size, args.numpy)
+        print("%-12s %8.2fs   peak: %8.1f MiB" % (name, elapsed, peak / 1024**2))
+
+
+if __name__ == "__main__":
+    main()
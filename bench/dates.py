@@ -0,0 +1,96 @@
+# =============================================================================
+# Twitwi Date Parsing Benchmark
+# =============================================================================
+#
+# Compares the reference strptime/dateutil implementation of `get_dates` with
+# the fast-path engine, on every date string found in the test resources.
+#
+#   python -m bench.dates [--rounds N]
+#
+import re
+import glob
+from argparse import ArgumentParser
+from os.path import join, dirname
+from timeit import default_timer as timer
+
+from pytz import timezone
+
+from twitwi.dates import fallback_get_dates, parse_dates, clear_dates_cache
+from twitwi.utils import get_dates
+
+RESOURCES_DIR = join(dirname(dirname(__file__)), "test", "resources")
+
+DATE_KEYS = {
+    "created_at": None,
+    "createdAt": "bluesky",
+    "indexedAt": "bluesky",
+}
+
+V1_DATE_PATTERN = re.compile(r"^[A-Z][a-z]{2} [A-Z][a-z]{2} ")
+
+
+def collect_dates():
+    dates = []
+
+    for path in sorted(glob.glob(join(RESOURCES_DIR, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+
+        for key, source in DATE_KEYS.items():
+            for date_str in re.findall(r'"%s": "([^"]+)"' % key, content):
+                if source is None:
+                    dates.append(
+                        (date_str, "v1" if V1_DATE_PATTERN.match(date_str) else "v2")
+                    )
+                else:
+                    dates.append((date_str, source))
+
+    return dates
+
+
+def bench(fn, dates, locale, rounds):
+    start = timer()
+
+    for _ in range(rounds):
+        for date_str, source in dates:
+            try:
+                fn(date_str, locale, source, False)
+            except ValueError:
+                pass
+
+    return timer() - start
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark twitwi's date parsing engine")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    dates = collect_dates()
+    total = len(dates) * args.rounds
+
+    print("Parsing %i date strings %i times" % (len(dates), args.rounds))
+
+    for locale in [None, timezone("Europe/Paris")]:
+        print()
+        print("locale: %s" % (locale or "UTC"))
+
+        reference = bench(fallback_get_dates, dates, locale, args.rounds)
+        fast = bench(parse_dates, dates, locale, args.rounds)
+
+        clear_dates_cache()
+        memoized = bench(get_dates, dates, locale, args.rounds)
+
+        for name, elapsed in [
+            ("strptime/dateutil", reference),
+            ("fast path", fast),
+            ("fast path + memo", memoized),
+        ]:
+            print(
+                "  %-18s %8.3fs %10i dates/s  x%.1f"
+                % (name, elapsed, total / elapsed, reference / elapsed)
+            )
+
+
+if __name__ == "__main__":
+    main()
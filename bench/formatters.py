@@ -0,0 +1,197 @@
+# =============================================================================
+# Twitwi CSV Row Formatters Benchmark
+# =============================================================================
+#
+# Compares the former per-field csv row formatters with the ones compiled
+# once per schema, for every kind of normalized record, checking that they
+# produce identical rows.
+#
+#   python -m bench.formatters [--size N] [--rounds N]
+#
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+
+from twitwi import normalize_tweet, normalize_user
+from twitwi.bluesky import (
+    normalize_post,
+    normalize_partial_post,
+    normalize_profile,
+    normalize_partial_profile,
+)
+from twitwi.constants import (
+    TWEET_FIELDS,
+    TWEET_PLURAL_FIELDS,
+    TWEET_BOOLEAN_FIELDS,
+    USER_FIELDS,
+    USER_PLURAL_FIELDS,
+    USER_BOOLEAN_FIELDS,
+)
+from twitwi.bluesky.constants import (
+    POST_FIELDS,
+    POST_PLURAL_FIELDS,
+    POST_BOOLEAN_FIELDS,
+    PARTIAL_POST_FIELDS,
+    PARTIAL_POST_PLURAL_FIELDS,
+    PARTIAL_POST_BOOLEAN_FIELDS,
+    PROFILE_FIELDS,
+    PARTIAL_PROFILE_FIELDS,
+)
+from twitwi.formatters import make_format_as_csv_row
+
+from bench.generators import (
+    generate_v1_tweets,
+    generate_v1_users,
+    generate_bluesky_posts,
+    generate_jetstream_posts,
+    generate_bluesky_profiles,
+    generate_bluesky_partial_profiles,
+)
+
+
+def make_reference_format_as_csv_row(fields, plural_fields, boolean_fields):
+    def format_field_for_csv(
+        field, item, item_id=None, plural_separator="|", allow_erroneous_plurals=False
+    ):
+        if field == "id" and item_id is not None:
+            return item_id
+
+        if field in plural_fields:
+            v = item.get(field, [])
+
+            if field == "links":
+                v = item.get("proper_links", v)
+
+            if allow_erroneous_plurals:
+                v = [element if element is not None else "" for element in v]
+
+            return plural_separator.join(v)
+
+        if field in boolean_fields:
+            return int(item[field]) if field in item else ""
+
+        return item.get(field, "")
+
+    def format_item_as_csv_row(
+        item, item_id=None, plural_separator="|", allow_erroneous_plurals=False
+    ):
+        return [
+            format_field_for_csv(
+                field,
+                item,
+                item_id=item_id,
+                plural_separator=plural_separator,
+                allow_erroneous_plurals=allow_erroneous_plurals,
+            )
+            for field in fields
+        ]
+
+    return format_item_as_csv_row
+
+
+def partial_firehose_post(payload):
+    return normalize_partial_post(payload, collection_source="firehose")
+
+
+SCHEMAS = [
+    (
+        "tweet",
+        (TWEET_FIELDS, TWEET_PLURAL_FIELDS, TWEET_BOOLEAN_FIELDS),
+        generate_v1_tweets,
+        normalize_tweet,
+    ),
+    (
+        "user",
+        (USER_FIELDS, USER_PLURAL_FIELDS, USER_BOOLEAN_FIELDS),
+        generate_v1_users,
+        normalize_user,
+    ),
+    (
+        "post",
+        (POST_FIELDS, POST_PLURAL_FIELDS, POST_BOOLEAN_FIELDS),
+        generate_bluesky_posts,
+        normalize_post,
+    ),
+    (
+        "partial_post",
+        (PARTIAL_POST_FIELDS, PARTIAL_POST_PLURAL_FIELDS, PARTIAL_POST_BOOLEAN_FIELDS),
+        generate_jetstream_posts,
+        partial_firehose_post,
+    ),
+    (
+        "profile",
+        (PROFILE_FIELDS, [], []),
+        generate_bluesky_profiles,
+        normalize_profile,
+    ),
+    (
+        "partial_profile",
+        (PARTIAL_PROFILE_FIELDS, [], []),
+        generate_bluesky_partial_profiles,
+        normalize_partial_profile,
+    ),
+]
+
+
+def format_or_error(fn, item, **kwargs):
+    try:
+        return fn(item, **kwargs)
+    except TypeError as e:
+        return repr(e)
+
+
+def bench(fn, items, rounds, **kwargs):
+    best = None
+
+    for _ in range(rounds):
+        start = timer()
+
+        for item in items:
+            fn(item, **kwargs)
+
+        elapsed = timer() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark twitwi's csv row formatters")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    print("Formatting %i records of each kind as csv rows" % args.size)
+    print()
+
+    for name, schema, generate, normalize in SCHEMAS:
+        items = [normalize(payload) for payload in generate(args.size, args.seed)]
+
+        reference_formatter = make_reference_format_as_csv_row(*schema)
+        formatter = make_format_as_csv_row(*schema)
+
+        for item in items:
+            for kwargs in [
+                {},
+                {"plural_separator": "§", "allow_erroneous_plurals": True},
+            ]:
+                assert format_or_error(reference_formatter, item, **kwargs) == (
+                    format_or_error(formatter, item, **kwargs)
+                )
+
+        # NOTE: some Bluesky records hold None values in their plural fields
+        reference = bench(
+            reference_formatter, items, args.rounds, allow_erroneous_plurals=True
+        )
+        fast = bench(formatter, items, args.rounds, allow_erroneous_plurals=True)
+
+        print(
+            "%-16s per-field: %10.0f rows/s   compiled: %10.0f rows/s   x%.2f"
+            % (name, len(items) / reference, len(items) / fast, reference / fast)
+        )
+
+
+if __name__ == "__main__":
+    main()
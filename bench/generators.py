@@ -0,0 +1,192 @@
+# =============================================================================
+# Twitwi Benchmark Payload Generators
+# =============================================================================
+#
+# Functions generating arbitrary numbers of realistic payloads, seeded from the
+# shapes found in the test resources. Each generated payload is a copy of a
+# randomly picked template whose ids (tweet ids, Bluesky record keys) are
+# consistently remapped to new ones and whose dates are shifted by a random
+# delay, so that caches are exercised as they would be on real collections.
+#
+import re
+import json
+from datetime import datetime, timedelta
+from os.path import join, dirname
+from random import Random
+
+from twitwi.bluesky.utils import encode_tid
+from twitwi.constants import (
+    OFFSET_TIMESTAMP,
+    SOURCE_DATETIME_FORMAT,
+)
+
+RESOURCES_DIR = join(dirname(dirname(__file__)), "test", "resources")
+
+V2_PAYLOAD_RESOURCES = [
+    "payload-v2.json",
+    "payload-v2-geo.json",
+    "payload-v2-tweet-retweet.json",
+    "payload-v2-video.json",
+    "payload-v2-singletweet.json",
+    "alternative-payload-v2.json",
+]
+
+# NOTE: tweet ids are remapped whenever they appear as long digit runs, which
+# also covers ids within urls, media keys etc.
+TWEET_ID_PATTERN = re.compile(r"(?<![\d.])\d{15,20}(?![\d.])")
+
+# NOTE: Bluesky record keys are remapped when found at the end of an uri path
+# or as a standalone string, such as Jetstream's rkey field
+TID_PATTERN = re.compile(r'(?<=[/"])[234567a-j][234567a-z]{12}(?=["/#?])')
+
+V1_DATE_PATTERN = re.compile(
+    r"[A-Z][a-z]{2} [A-Z][a-z]{2} \d{2} \d{2}:\d{2}:\d{2} \+0000 \d{4}"
+)
+ISO_DATE_PATTERN = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})((?:\.\d+)?(?:Z|[+-]\d{2}:\d{2}))"
+)
+ISO_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Generated dates are shifted up to a year back in time
+MAX_SHIFT = 365 * 24 * 3600
+
+
+def load_resource(name):
+    with open(join(RESOURCES_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def shift_v1_date(match, delta):
+    try:
+        date = datetime.strptime(match.group(0), SOURCE_DATETIME_FORMAT)
+    except ValueError:
+        return match.group(0)
+
+    return (date + delta).strftime(SOURCE_DATETIME_FORMAT)
+
+
+def shift_iso_date(match, delta):
+    try:
+        date = datetime.strptime(match.group(1), ISO_DATE_FORMAT)
+    except ValueError:
+        return match.group(0)
+
+    if date.year < 1000:
+        return match.group(0)
+
+    return (date + delta).strftime(ISO_DATE_FORMAT) + match.group(2)
+
+
+class PayloadGenerator(object):
+    """
+    Generator of payloads copied from the given templates, remapping the ids
+    matched by `id_pattern` using `generate_id`.
+    """
+
+    def __init__(self, templates, id_pattern, generate_id, seed=0):
+        self.templates = [json.dumps(template) for template in templates]
+        self.id_pattern = id_pattern
+        self.generate_id = generate_id
+        self.rng = Random(seed)
+
+    def generate_one(self):
+        rng = self.rng
+        text = rng.choice(self.templates)
+
+        ids = {}
+
+        def remap(match):
+            old_id = match.group(0)
+            new_id = ids.get(old_id)
+
+            if new_id is None:
+                new_id = self.generate_id(rng)
+                ids[old_id] = new_id
+
+            return new_id
+
+        delta = timedelta(seconds=-rng.randrange(MAX_SHIFT))
+
+        text = self.id_pattern.sub(remap, text)
+        text = V1_DATE_PATTERN.sub(lambda m: shift_v1_date(m, delta), text)
+        text = ISO_DATE_PATTERN.sub(lambda m: shift_iso_date(m, delta), text)
+
+        return json.loads(text)
+
+    def generate(self, n):
+        return [self.generate_one() for _ in range(n)]
+
+
+def generate_tweet_id(rng):
+    # Snowflake ids posted between 2015 & 2023
+    timestamp = rng.randrange(1420070400000, 1672531200000) - OFFSET_TIMESTAMP
+
+    return str((timestamp << 22) | rng.getrandbits(22))
+
+
+def generate_tid(rng):
+    # TIDs created between 2023 & 2026
+    timestamp_us = rng.randrange(1672531200000000, 1767225600000000)
+
+    return encode_tid(timestamp_us, rng.randrange(1024))
+
+
+def generate_v1_tweets(n, seed=0):
+    """Generate v1 tweets, including retweets & quotes."""
+    templates = [test["source"] for test in load_resource("normalization.json")]
+
+    for source in ["search", "show", "stream"]:
+        payload = load_resource("normalization-payload-%s.json" % source)
+        templates.extend(payload if isinstance(payload, list) else [payload])
+
+    return PayloadGenerator(
+        templates, TWEET_ID_PATTERN, generate_tweet_id, seed
+    ).generate(n)
+
+
+def generate_v1_users(n, seed=0):
+    templates = load_resource("api-users-v1.json")
+
+    return PayloadGenerator(
+        templates, TWEET_ID_PATTERN, generate_tweet_id, seed
+    ).generate(n)
+
+
+def generate_v2_payloads(n, seed=0):
+    """Generate v2 pages, with their includes."""
+    templates = [load_resource(name) for name in V2_PAYLOAD_RESOURCES]
+
+    return PayloadGenerator(
+        templates, TWEET_ID_PATTERN, generate_tweet_id, seed
+    ).generate(n)
+
+
+def generate_bluesky_posts(n, seed=0):
+    """Generate Bluesky posts & feed items, with facets, embeds & quotes."""
+    templates = load_resource("bluesky-posts.json")
+
+    return PayloadGenerator(templates, TID_PATTERN, generate_tid, seed).generate(n)
+
+
+def generate_jetstream_posts(n, seed=0):
+    templates = load_resource("bluesky-firehose-posts.json")
+
+    return PayloadGenerator(templates, TID_PATTERN, generate_tid, seed).generate(n)
+
+
+def generate_tap_posts(n, seed=0):
+    templates = load_resource("bluesky-tap-posts.json")
+
+    return PayloadGenerator(templates, TID_PATTERN, generate_tid, seed).generate(n)
+
+
+def generate_bluesky_profiles(n, seed=0):
+    templates = load_resource("bluesky-profiles.json")
+
+    return PayloadGenerator(templates, TID_PATTERN, generate_tid, seed).generate(n)
+
+
+def generate_bluesky_partial_profiles(n, seed=0):
+    templates = load_resource("bluesky-partial-profiles.json")
+
+    return PayloadGenerator(templates, TID_PATTERN, generate_tid, seed).generate(n)
@@ -0,0 +1,82 @@
+# =============================================================================
+# Twitwi Parallel Normalization Benchmark
+# =============================================================================
+#
+# Measures how `twitwi.parallel.normalize_many` scales from 1 to N workers on
+# generated payloads.
+#
+#   python -m bench.parallel [--kind KIND] [--size N] [--max-workers N]
+#
+import os
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+
+from twitwi.parallel import normalize_many
+from twitwi.constants import PARALLEL_CHUNK_SIZE
+
+from bench.generators import (
+    generate_v1_tweets,
+    generate_v2_payloads,
+    generate_bluesky_posts,
+    generate_jetstream_posts,
+    generate_bluesky_profiles,
+)
+from bench.suite import V2_PAGE_RATIO
+
+GENERATORS = {
+    "tweet": (generate_v1_tweets, {}),
+    "tweets_payload_v2": (
+        lambda size, seed: generate_v2_payloads(max(1, size // V2_PAGE_RATIO), seed),
+        {},
+    ),
+    "post": (generate_bluesky_posts, {}),
+    "partial_post": (generate_jetstream_posts, {"collection_source": "firehose"}),
+    "profile": (generate_bluesky_profiles, {}),
+}
+
+
+def bench(payloads, kind, workers, chunksize, kwargs):
+    start = timer()
+
+    for _ in normalize_many(
+        payloads, kind=kind, workers=workers, chunksize=chunksize, **kwargs
+    ):
+        pass
+
+    return timer() - start
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark twitwi's parallel normalization")
+    parser.add_argument("--kind", choices=list(GENERATORS), default="tweet")
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunksize", type=int, default=PARALLEL_CHUNK_SIZE)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    generate, kwargs = GENERATORS[args.kind]
+    payloads = generate(args.size, args.seed)
+
+    print(
+        "Normalizing %i %s payloads by chunks of %i"
+        % (len(payloads), args.kind, args.chunksize)
+    )
+    print()
+
+    reference = None
+
+    for workers in range(1, args.max_workers + 1):
+        elapsed = bench(payloads, args.kind, workers, args.chunksize, kwargs)
+
+        if reference is None:
+            reference = elapsed
+
+        print(
+            "%3i workers %12.0f payloads/s   x%.2f"
+            % (workers, len(payloads) / elapsed, reference / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
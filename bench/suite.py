@@ -0,0 +1,362 @@
+# =============================================================================
+# Twitwi Benchmark Suite
+# =============================================================================
+#
+# Measures the throughput (records/s) and peak memory of every normalizer and
+# csv formatter on generated payloads, and writes machine-readable results so
+# that two versions of the library can be compared:
+#
+#   python -m bench run [--size N] [--rounds N] [--only NAME] [-o results.json]
+#   python -m bench compare before.json after.json
+#
+import gc
+import sys
+import json
+import platform
+import subprocess
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime
+from os.path import dirname
+from timeit import default_timer as timer
+
+from twitwi import (
+    normalize_tweet,
+    normalize_user,
+    normalize_tweets_payload_v2,
+    format_tweet_as_csv_row,
+    format_user_as_csv_row,
+)
+from twitwi.bluesky import (
+    normalize_post,
+    normalize_partial_post,
+    normalize_profile,
+    normalize_partial_profile,
+    format_post_as_csv_row,
+    format_partial_post_as_csv_row,
+    format_profile_as_csv_row,
+    format_partial_profile_as_csv_row,
+)
+from twitwi.dates import clear_dates_cache
+from twitwi.utils import clear_url_cache
+
+from bench.generators import (
+    generate_v1_tweets,
+    generate_v1_users,
+    generate_v2_payloads,
+    generate_bluesky_posts,
+    generate_jetstream_posts,
+    generate_tap_posts,
+    generate_bluesky_profiles,
+    generate_bluesky_partial_profiles,
+)
+
+RESULTS_FORMAT_VERSION = 1
+
+# NOTE: v2 pages hold several tweets, so they are generated in smaller numbers
+V2_PAGE_RATIO = 20
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a benchmark. The decorated function takes the size & seed
+    of the run and returns a (fn, items, records) tuple, where `fn` is
+    called on each item and `records` is the number of records processed
+    by a whole pass over the items.
+    """
+
+    def decorate(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorate
+
+
+@benchmark("normalize_tweet")
+def bench_normalize_tweet(size, seed):
+    return normalize_tweet, generate_v1_tweets(size, seed), size
+
+
+@benchmark("normalize_user")
+def bench_normalize_user(size, seed):
+    return normalize_user, generate_v1_users(size, seed), size
+
+
+@benchmark("normalize_tweets_payload_v2")
+def bench_normalize_tweets_payload_v2(size, seed):
+    payloads = generate_v2_payloads(max(1, size // V2_PAGE_RATIO), seed)
+
+    return (
+        normalize_tweets_payload_v2,
+        payloads,
+        sum(len(payload["data"]) for payload in payloads),
+    )
+
+
+@benchmark("normalize_post")
+def bench_normalize_post(size, seed):
+    return normalize_post, generate_bluesky_posts(size, seed), size
+
+
+@benchmark("normalize_partial_post[firehose]")
+def bench_normalize_partial_post_firehose(size, seed):
+    def fn(payload):
+        return normalize_partial_post(payload, collection_source="firehose")
+
+    return fn, generate_jetstream_posts(size, seed), size
+
+
+@benchmark("normalize_partial_post[tap]")
+def bench_normalize_partial_post_tap(size, seed):
+    def fn(payload):
+        return normalize_partial_post(payload, collection_source="tap")
+
+    return fn, generate_tap_posts(size, seed), size
+
+
+@benchmark("normalize_profile")
+def bench_normalize_profile(size, seed):
+    return normalize_profile, generate_bluesky_profiles(size, seed), size
+
+
+@benchmark("normalize_partial_profile")
+def bench_normalize_partial_profile(size, seed):
+    return (
+        normalize_partial_profile,
+        generate_bluesky_partial_profiles(size, seed),
+        size,
+    )
+
+
+@benchmark("format_tweet_as_csv_row")
+def bench_format_tweet_as_csv_row(size, seed):
+    tweets = [normalize_tweet(tweet) for tweet in generate_v1_tweets(size, seed)]
+
+    return format_tweet_as_csv_row, tweets, size
+
+
+@benchmark("format_user_as_csv_row")
+def bench_format_user_as_csv_row(size, seed):
+    users = [normalize_user(user) for user in generate_v1_users(size, seed)]
+
+    return format_user_as_csv_row, users, size
+
+
+@benchmark("format_post_as_csv_row")
+def bench_format_post_as_csv_row(size, seed):
+    posts = [normalize_post(post) for post in generate_bluesky_posts(size, seed)]
+
+    # NOTE: some posts have unresolvable domains, as in the unit tests
+    def fn(post):
+        return format_post_as_csv_row(post, allow_erroneous_plurals=True)
+
+    return fn, posts, size
+
+
+@benchmark("format_partial_post_as_csv_row")
+def bench_format_partial_post_as_csv_row(size, seed):
+    posts = [
+        normalize_partial_post(post, collection_source="firehose")
+        for post in generate_jetstream_posts(size // 2, seed)
+    ]
+    posts.extend(
+        normalize_partial_post(post, collection_source="tap")
+        for post in generate_tap_posts(size - len(posts), seed)
+    )
+
+    return format_partial_post_as_csv_row, posts, size
+
+
+@benchmark("format_profile_as_csv_row")
+def bench_format_profile_as_csv_row(size, seed):
+    profiles = [
+        normalize_profile(profile) for profile in generate_bluesky_profiles(size, seed)
+    ]
+
+    return format_profile_as_csv_row, profiles, size
+
+
+@benchmark("format_partial_profile_as_csv_row")
+def bench_format_partial_profile_as_csv_row(size, seed):
+    profiles = [
+        normalize_partial_profile(profile)
+        for profile in generate_bluesky_partial_profiles(size, seed)
+    ]
+
+    return format_partial_profile_as_csv_row, profiles, size
+
+
+def clear_caches():
+    clear_dates_cache()
+    clear_url_cache()
+
+
+def run_pass(fn, items):
+    start = timer()
+
+    for item in items:
+        fn(item)
+
+    return timer() - start
+
+
+def measure(fn, items, records, rounds):
+    """
+    Returns the best time over the given number of rounds, and the peak
+    memory allocated during a separate traced pass, caches being cleared
+    before each pass so that they are comparable.
+    """
+    times = []
+
+    for _ in range(rounds):
+        clear_caches()
+        gc.collect()
+        times.append(run_pass(fn, items))
+
+    clear_caches()
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        run_pass(fn, items)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+
+    return {
+        "records": records,
+        "seconds": best,
+        "records_per_second": records / best if best else None,
+        "peak_memory": peak_memory,
+    }
+
+
+def get_revision():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "describe", "--always", "--dirty"],
+                cwd=dirname(dirname(__file__)),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names=None, size=1000, seed=0, rounds=3, log=None):
+    results = {}
+
+    for name, setup in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+
+        fn, items, records = setup(size, seed)
+        results[name] = measure(fn, items, records, rounds)
+
+        if log is not None:
+            log(name, results[name])
+
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "meta": {
+            "revision": get_revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.now().isoformat(),
+            "size": size,
+            "seed": seed,
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+
+
+def print_result(name, result):
+    print(
+        "%-36s %12.0f records/s %10.1f KiB peak"
+        % (name, result["records_per_second"], result["peak_memory"] / 1024)
+    )
+
+
+def compare(before, after):
+    """
+    Returns, for each benchmark found in both results, the speedup and the
+    peak memory ratio of the second run over the first one.
+    """
+    comparison = {}
+
+    for name, result in after["results"].items():
+        reference = before["results"].get(name)
+
+        if reference is None:
+            continue
+
+        comparison[name] = {
+            "speedup": result["records_per_second"] / reference["records_per_second"],
+            "memory_ratio": result["peak_memory"] / reference["peak_memory"]
+            if reference["peak_memory"]
+            else None,
+        }
+
+    return comparison
+
+
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="python -m bench", description="Benchmark twitwi's hot paths"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--size", type=int, default=1000)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--rounds", type=int, default=3)
+    run_parser.add_argument(
+        "--only", action="append", choices=list(BENCHMARKS), help="can be repeated"
+    )
+    run_parser.add_argument("-o", "--output", help="path of the json results")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two results")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.only, args.size, args.seed, args.rounds, print_result)
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+        return
+
+    with open(args.before, encoding="utf-8") as f:
+        before = json.load(f)
+
+    with open(args.after, encoding="utf-8") as f:
+        after = json.load(f)
+
+    for name, ratios in compare(before, after).items():
+        memory_ratio = ratios["memory_ratio"]
+
+        print(
+            "%-36s x%6.2f speed   x%6s memory"
+            % (
+                name,
+                ratios["speedup"],
+                "%.2f" % memory_ratio if memory_ratio is not None else "n/a",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
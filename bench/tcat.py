@@ -0,0 +1,95 @@
+# =============================================================================
+# Twitwi TCAT Export Benchmark
+# =============================================================================
+#
+# Compares the throughput of exporting normalized tweets in DMI-TCAT's format
+# using `apply_tcat_format` & a `csv.DictWriter` with the `TweetTCATWriter`,
+# whose row formatter is compiled once.
+#
+#   python -m bench.tcat [--size N] [--rounds N] [--tsv]
+#
+import io
+import csv
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+
+from twitwi import normalize_tweet, apply_tcat_format, TweetTCATWriter
+from twitwi.constants import TWEET_FIELDS_TCAT
+
+from bench.generators import generate_v1_tweets
+
+
+def export_with_dict_writer(tweets, delimiter):
+    output = io.StringIO()
+    writer = csv.DictWriter(
+        output,
+        fieldnames=TWEET_FIELDS_TCAT,
+        restval="",
+        extrasaction="ignore",
+        delimiter=delimiter,
+    )
+    writer.writeheader()
+
+    for tweet in tweets:
+        writer.writerow(apply_tcat_format(tweet))
+
+    return len(output.getvalue().encode("utf-8"))
+
+
+def export_with_tcat_writer(tweets, delimiter):
+    output = io.BytesIO()
+
+    with TweetTCATWriter(output, delimiter=delimiter) as writer:
+        writer.writerows(iter(tweets))
+
+    return writer.bytes_written
+
+
+def bench(fn, tweets, delimiter, rounds):
+    best = None
+
+    for _ in range(rounds):
+        start = timer()
+        fn(tweets, delimiter)
+        elapsed = timer() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark twitwi's TCAT export")
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--tsv", action="store_true")
+    args = parser.parse_args()
+
+    delimiter = "\t" if args.tsv else ","
+    tweets = [
+        normalize_tweet(payload, collection_source="bench")
+        for payload in generate_v1_tweets(args.size, args.seed)
+    ]
+
+    print("Exporting %i tweets in TCAT format" % len(tweets))
+    print()
+
+    reference = bench(export_with_dict_writer, tweets, delimiter, args.rounds)
+    fast = bench(export_with_tcat_writer, tweets, delimiter, args.rounds)
+
+    print("apply_tcat_format + DictWriter: %10.0f rows/s" % (len(tweets) / reference))
+    print(
+        "TweetTCATWriter:                %10.0f rows/s   x%.2f"
+        % (len(tweets) / fast, reference / fast)
+    )
+    print()
+    print(
+        "NOTE: the DictWriter export only fills the mapped columns and does not "
+        "convert plural & boolean fields"
+    )
+
+
+if __name__ == "__main__":
+    main()
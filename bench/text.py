@@ -0,0 +1,78 @@
+# =============================================================================
+# Twitwi Hashtags & Mentions Extraction Benchmark
+# =============================================================================
+#
+# Compares the former two-pass split-based extraction of hashtags & mentions
+# from tweets' text with the single-pass extractor, on an archive-sized corpus
+# built from the texts of generated tweets.
+#
+#   python -m bench.text [--size N] [--rounds N]
+#
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+
+from twitwi.normalizers import (
+    extract_items_from_text,
+    extract_hashtags_and_mentions_from_text,
+)
+
+from bench.generators import generate_v1_tweets
+
+
+def split_extraction(text):
+    return extract_items_from_text(text, "#"), extract_items_from_text(text, "@")
+
+
+def collect_texts(size, seed):
+    texts = []
+
+    for tweet in generate_v1_tweets(size, seed):
+        tweet = tweet.get("extended_tweet", tweet)
+        texts.append(tweet.get("full_text") or tweet.get("text") or "")
+
+    return texts
+
+
+def bench(fn, texts, rounds):
+    best = None
+
+    for _ in range(rounds):
+        start = timer()
+
+        for text in texts:
+            fn(text)
+
+        elapsed = timer() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def main():
+    parser = ArgumentParser(
+        description="Benchmark twitwi's hashtags & mentions extraction"
+    )
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = collect_texts(args.size, args.seed)
+
+    for text in texts:
+        assert split_extraction(text) == extract_hashtags_and_mentions_from_text(text)
+
+    print("Extracting hashtags & mentions from %i texts" % len(texts))
+    print()
+
+    reference = bench(split_extraction, texts, args.rounds)
+    fast = bench(extract_hashtags_and_mentions_from_text, texts, args.rounds)
+
+    print("split:       %12.0f texts/s" % (len(texts) / reference))
+    print("single-pass: %12.0f texts/s   x%.2f" % (len(texts) / fast, reference / fast))
+
+
+if __name__ == "__main__":
+    main()
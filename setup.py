@@ -15,8 +15,9 @@ setup(
     author_email="guillaume.plique@sciencespo.fr",
     keywords="twitter",
     python_requires=">=3.8",
-    packages=find_packages(exclude=["scripts", "test"]),
+    packages=find_packages(exclude=["bench", "scripts", "test"]),
     package_data={"docs": ["README.md"]},
     install_requires=["pytz>=2019.3", "ural>=0.31.1", "python-dateutil>=2.9.0"],
+    extras_require={"numpy": ["numpy"]},
     zip_safe=True,
 )
@@ -2,13 +2,18 @@
 # Twitwi Anonymizers Unit Tests
 # =============================================================================
 import csv
+import json
+import pytest
+from copy import deepcopy
 from io import StringIO
 
 from test.utils import get_json_resource
 
 from twitwi.constants import TWEET_FIELDS
 from twitwi.anonymizers import (
+    Pseudonymizer,
     anonymize_normalized_tweet,
+    iter_pseudonymized,
     redact_quoted_text,
     redact_rt_text,
 )
@@ -360,3 +365,159 @@ class TestAnonymizers(object):
                 "",
             ],
         ]
+
+    def test_pseudonymizer(self):
+        with pytest.raises(TypeError):
+            Pseudonymizer(42)
+
+        with pytest.raises(ValueError):
+            Pseudonymizer("")
+
+        with pytest.raises(ValueError):
+            Pseudonymizer("secret", schema="toot")
+
+        pseudonymizer = Pseudonymizer("secret", length=12)
+
+        pseudonym = pseudonymizer.pseudonym("screen_name", "Bidule")
+
+        assert len(pseudonym) == 12
+        assert pseudonym == pseudonymizer.pseudonym("screen_name", "bidule")
+        assert pseudonym == Pseudonymizer(b"secret", length=12).pseudonym(
+            "screen_name", "bidule"
+        )
+        assert pseudonym != Pseudonymizer("other", length=12).pseudonym(
+            "screen_name", "bidule"
+        )
+        assert pseudonym != pseudonymizer.pseudonym("user", "bidule")
+
+        assert pseudonymizer.pseudonymize_text(
+            "@Bidule see https://twitter.com/bidule/status/1 mail@bidule.fr"
+        ) == "@%s see https://twitter.com/%s/status/%s mail@bidule.fr" % (
+            pseudonym,
+            pseudonym,
+            pseudonymizer.pseudonym("tweet", "1"),
+        )
+
+        # Profile links are pseudonymized too, but not Twitter's own pages
+        assert pseudonymizer.pseudonymize_text(
+            "https://x.com/Bidule https://twitter.com/i/web/status/1 "
+            "https://twitter.com/hashtag/test"
+        ) == (
+            "https://x.com/%s https://twitter.com/i/web/status/%s "
+            "https://twitter.com/hashtag/test"
+            % (pseudonym, pseudonymizer.pseudonym("tweet", "1"))
+        )
+
+        pseudonymizer = Pseudonymizer("secret", schema="post")
+
+        did = "did:plc:n5pm4vggu475okayqvqipkoh"
+        handle = "bidule.bsky.social"
+
+        assert pseudonymizer.pseudonymize_text(
+            "https://cdn.bsky.app/img/feed_thumbnail/plain/%s/bafk@jpeg "
+            "https://bsky.app/starter-pack/%s/3m2n2daaflt25 (%s) @%s."
+            % (did, handle, did, handle)
+        ) == (
+            "https://cdn.bsky.app/img/feed_thumbnail/plain/%s/bafk@jpeg "
+            "https://bsky.app/starter-pack/%s/3m2n2daaflt25 (%s) @%s."
+            % (
+                pseudonymizer.pseudonym("did", did),
+                pseudonymizer.pseudonym("handle", handle),
+                pseudonymizer.pseudonym("did", did),
+                pseudonymizer.pseudonym("handle", handle),
+            )
+        )
+
+    def test_pseudonymize_tweets(self):
+        tweets = get_json_resource("normalized-tweets-v2-all.json")
+        original_tweets = deepcopy(tweets)
+
+        pseudonymizer = Pseudonymizer("secret", delete=["source_url"])
+        pseudonymized = list(pseudonymizer.anonymize_many(iter(tweets)))
+
+        assert tweets == original_tweets
+        assert pseudonymized == list(
+            iter_pseudonymized(tweets, "secret", delete=["source_url"])
+        )
+
+        pseudonym = pseudonymizer.pseudonym
+        index = {tweet["id"]: tweet for tweet in pseudonymized}
+
+        for tweet, original in zip(pseudonymized, tweets):
+            assert tweet["id"] == pseudonym("tweet", original["id"])
+            assert tweet["user_id"] == pseudonym("user", original["user_id"])
+            assert tweet["user_screen_name"] == pseudonym(
+                "screen_name", original["user_screen_name"]
+            )
+            assert tweet["mentioned_ids"] == [
+                pseudonym("user", user_id) for user_id in original["mentioned_ids"]
+            ]
+            assert original["user_screen_name"] not in tweet["url"]
+
+            for field in ["user_name", "user_description", "lat", "source_url"]:
+                assert field not in tweet
+
+            for name in original["mentioned_names"]:
+                assert "@" + name not in tweet["text"]
+
+            # Replies & retweets are still linked to their authors
+            if tweet.get("to_tweetid") in index:
+                assert tweet["to_userid"] == index[tweet["to_tweetid"]]["user_id"]
+
+            if tweet.get("retweeted_id") is not None:
+                assert tweet["retweeted_user_id"] in tweet["mentioned_ids"]
+
+    def test_pseudonymize_posts(self):
+        posts = [
+            post
+            for posts in get_json_resource("bluesky-normalized-posts.json")
+            for post in posts
+        ]
+        original_posts = deepcopy(posts)
+
+        pseudonymizer = Pseudonymizer("secret", schema="post")
+        pseudonymized = list(pseudonymizer.anonymize_many(posts))
+
+        assert posts == original_posts
+
+        pseudonym = pseudonymizer.pseudonym
+
+        for post, original in zip(pseudonymized, posts):
+            did = pseudonym("did", original["user_did"])
+            handle = pseudonym("handle", original["user_handle"])
+
+            assert post["user_did"] == did
+            assert post["user_handle"] == handle
+            assert post["uri"].startswith("at://%s/" % did)
+            assert post["url"].startswith(
+                tuple("https://bsky.app/profile/%s/" % p for p in (handle, did))
+            )
+            assert post["mentioned_user_dids"] == [
+                pseudonym("did", mention) for mention in original["mentioned_user_dids"]
+            ]
+            assert "user_display_name" not in post
+            assert "user_avatar" not in post
+
+            for mention in original["mentioned_user_handles"]:
+                assert "@" + mention not in post["text"]
+
+            if original.get("quoted_user_handle"):
+                assert original["quoted_user_handle"] not in post["text"]
+
+        partial = Pseudonymizer("secret", schema="partial_post")
+
+        for post, original in zip(pseudonymized, posts):
+            assert partial.anonymize(original)["user_did"] == post["user_did"]
+
+        # The accounts of the posts cannot be found anywhere in them
+        for schema in ["post", "partial_post"]:
+            pseudonymizer = Pseudonymizer("secret", schema=schema)
+
+            for original in posts:
+                post = pseudonymizer.anonymize(original)
+                values = json.dumps(list(post.values()), ensure_ascii=False).lower()
+
+                assert original["user_did"] not in values
+
+                if original["user_handle"] != "handle.invalid":
+                    assert original["user_handle"].lower() not in values
@@ -1,4 +1,5 @@
 import csv
+from copy import deepcopy
 from io import StringIO
 from twitwi.bluesky import (
     format_profile_as_csv_row,
@@ -9,6 +10,11 @@ from twitwi.bluesky import (
     transform_partial_profile_into_csv_dict,
     transform_post_into_csv_dict,
     transform_partial_post_into_csv_dict,
+    format_post_as_csv_dict,
+    format_posts_as_csv_dicts,
+    format_partial_posts_as_csv_dicts,
+    format_profiles_as_csv_dicts,
+    format_partial_profiles_as_csv_dicts,
 )
 from twitwi.bluesky.constants import (
     PROFILE_FIELDS,
@@ -201,3 +207,62 @@ class TestFormatters:
         with open_resource("bluesky-firehose-posts-export.csv") as f:
             buffer.seek(0)
             assert list(csv.DictReader(buffer)) == list(csv.DictReader(f))
+
+    def test_format_post_as_csv_dict(self):
+        posts = [
+            post
+            for source in get_json_resource("bluesky-normalized-posts.json")
+            for post in source
+        ]
+        original_posts = deepcopy(posts)
+
+        for post in posts:
+            row = format_post_as_csv_dict(post, allow_erroneous_plurals=True)
+
+            expected = deepcopy(post)
+            transform_post_into_csv_dict(expected, allow_erroneous_plurals=True)
+
+            assert row == expected
+
+        assert posts == original_posts
+
+        for format_items, transform, name in [
+            (
+                format_posts_as_csv_dicts,
+                transform_post_into_csv_dict,
+                "bluesky-normalized-posts.json",
+            ),
+            (
+                format_partial_posts_as_csv_dicts,
+                transform_partial_post_into_csv_dict,
+                "bluesky-normalized-firehose-posts.json",
+            ),
+            (
+                format_profiles_as_csv_dicts,
+                transform_profile_into_csv_dict,
+                "bluesky-normalized-profiles.json",
+            ),
+            (
+                format_partial_profiles_as_csv_dicts,
+                transform_partial_profile_into_csv_dict,
+                "bluesky-normalized-partial-profiles.json",
+            ),
+        ]:
+            items = get_json_resource(name)
+
+            if items and isinstance(items[0], list):
+                items = [item for source in items for item in source]
+
+            original_items = deepcopy(items)
+            rows = list(format_items(iter(items), allow_erroneous_plurals=True))
+
+            assert items == original_items
+
+            for row, item in zip(rows, original_items):
+                transform(item, allow_erroneous_plurals=True)
+
+                # NOTE: the mutating version adds an empty links field to profiles
+                if "links" not in row:
+                    del item["links"]
+
+                assert row == item
@@ -0,0 +1,132 @@
+# =============================================================================
+# Twitwi Bluesky Readers Unit Tests
+# =============================================================================
+import io
+import csv
+import gzip
+import json
+from os.path import join
+
+from twitwi.bluesky import (
+    normalize_profile,
+    normalize_partial_profile,
+    normalize_post,
+    normalize_partial_post,
+    iter_normalized_profiles,
+    iter_normalized_partial_profiles,
+    iter_normalized_posts,
+    iter_normalized_partial_posts,
+    iter_posts_from_csv,
+    iter_partial_posts_from_csv,
+    iter_profiles_from_csv,
+    iter_partial_profiles_from_csv,
+    format_post_as_csv_row,
+    format_partial_post_as_csv_row,
+    format_profile_as_csv_row,
+    format_partial_profile_as_csv_row,
+)
+from twitwi.utils import collection_clock
+
+from test.utils import get_json_resource, RESOURCES_DIR
+
+FAKE_COLLECTION_TIME = "2025-01-01T00:00:00.000000"
+
+
+def open_jsonl(payloads):
+    data = "".join(json.dumps(payload) + "\n" for payload in payloads)
+
+    return io.BytesIO(gzip.compress(data.encode("utf-8")))
+
+
+class TestReaders(object):
+    def test_iter_normalized_posts(self):
+        posts = get_json_resource("bluesky-posts.json")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [
+                normalized
+                for post in posts
+                for normalized in normalize_post(post, extract_referenced_posts=True)
+            ]
+
+            assert (
+                list(
+                    iter_normalized_posts(
+                        open_jsonl(posts), extract_referenced_posts=True
+                    )
+                )
+                == expected
+            )
+
+    def test_iter_normalized_partial_posts(self):
+        with collection_clock(FAKE_COLLECTION_TIME):
+            for source in ["firehose", "tap"]:
+                posts = get_json_resource("bluesky-%s-posts.json" % source)
+
+                assert list(
+                    iter_normalized_partial_posts(
+                        open_jsonl(posts), collection_source=source
+                    )
+                ) == [
+                    normalize_partial_post(post, collection_source=source)
+                    for post in posts
+                ]
+
+    def test_iter_normalized_profiles(self):
+        profiles = get_json_resource("bluesky-profiles.json")
+        partial_profiles = get_json_resource("bluesky-partial-profiles.json")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            assert list(iter_normalized_profiles(open_jsonl(profiles))) == [
+                normalize_profile(profile) for profile in profiles
+            ]
+            assert list(
+                iter_normalized_partial_profiles(open_jsonl(partial_profiles))
+            ) == [normalize_partial_profile(profile) for profile in partial_profiles]
+
+    def test_iter_posts_from_csv(self):
+        for read, format_row, name in [
+            (iter_posts_from_csv, format_post_as_csv_row, "bluesky-posts-export.csv"),
+            (
+                iter_partial_posts_from_csv,
+                format_partial_post_as_csv_row,
+                "bluesky-firehose-posts-export.csv",
+            ),
+            (
+                iter_profiles_from_csv,
+                format_profile_as_csv_row,
+                "bluesky-profiles-export.csv",
+            ),
+            (
+                iter_partial_profiles_from_csv,
+                format_partial_profile_as_csv_row,
+                "bluesky-partial-profiles-export.csv",
+            ),
+        ]:
+            path = join(RESOURCES_DIR, name)
+
+            with open(path, encoding="utf-8", newline="") as f:
+                rows = list(csv.reader(f))[1:]
+
+            records = list(read(path))
+
+            assert len(records) == len(rows)
+
+            for record, row in zip(records, rows):
+                assert [
+                    "" if value is None else str(value) for value in format_row(record)
+                ] == row
+
+        posts = list(
+            iter_posts_from_csv(
+                join(RESOURCES_DIR, "bluesky-posts-export.csv"),
+                fields=["uri", "like_count", "hashtags", "match_query"],
+            )
+        )
+
+        assert posts[0] == {
+            "uri": "at://did:plc:crmrddqmbqzyqd24yjlpibz2/app.bsky.feed.post/3lkicuf37nc2v",
+            "like_count": 77,
+            "hashtags": ["esr", "hceres"],
+            "match_query": False,
+        }
@@ -0,0 +1,114 @@
+# =============================================================================
+# Twitwi Bluesky Utilities Unit Tests
+# =============================================================================
+import pytest
+from datetime import datetime
+from pytz import timezone
+
+from twitwi.bluesky.utils import (
+    decode_tid,
+    encode_tid,
+    get_timestamp_from_tid,
+    get_dates_from_tid,
+    get_timestamps_from_tids,
+    get_tid_range_from_dates,
+    get_backdating_delay,
+)
+
+from test.utils import get_json_resource
+
+
+TID_TESTS = [
+    ("3lkicuf37nc2v", (1742116928657000, 27)),
+    ("3lkd73d7zlj2w", (1741941067939375, 28)),
+    ("2222222222222", (0, 0)),
+]
+
+INVALID_TIDS = [
+    "",
+    "3lkhaibfxv22",
+    "3lkhaibfxv22bb",
+    "zzzzzzzzzzzzz",
+    "3lkhaibfxv22A",
+    "3lkhaibfxv221",
+    "self",
+    None,
+]
+
+
+class TestUtils:
+    def test_decode_tid(self):
+        for tid, result in TID_TESTS:
+            assert decode_tid(tid) == result
+            assert encode_tid(*result) == tid
+
+        for tid in INVALID_TIDS:
+            assert decode_tid(tid) is None
+            assert get_timestamp_from_tid(tid) is None
+            assert get_dates_from_tid(tid) is None
+
+        with pytest.raises(ValueError):
+            encode_tid(-1)
+
+        with pytest.raises(ValueError):
+            encode_tid(0, 1024)
+
+    def test_get_dates_from_tid(self):
+        assert get_timestamp_from_tid("3lkicuf37nc2v") == 1742116928
+        assert get_timestamp_from_tid("3lkicuf37nc2v", True) == 1742116928657
+
+        assert get_dates_from_tid("3lkicuf37nc2v") == (
+            1742116928,
+            "2025-03-16T09:22:08.657000",
+        )
+        assert get_dates_from_tid("3lkicuf37nc2v", timezone("Europe/Paris")) == (
+            1742116928,
+            "2025-03-16T10:22:08.657000",
+        )
+
+    def test_get_timestamps_from_tids(self):
+        tids = [tid for tid, _ in TID_TESTS] + INVALID_TIDS[:-1]
+        expected = [result[0] // 1000 for _, result in TID_TESTS] + [None] * (
+            len(INVALID_TIDS) - 1
+        )
+
+        assert get_timestamps_from_tids(tids, millisecond_timestamp=True) == expected
+
+        np = pytest.importorskip("numpy")
+
+        timestamps = get_timestamps_from_tids(np.array(tids), True)
+
+        assert timestamps.dtype == np.int64
+        assert timestamps.tolist() == expected
+
+        timestamps = get_timestamps_from_tids(np.array(tids, dtype=object))
+
+        assert timestamps.tolist() == get_timestamps_from_tids(tids)
+
+    def test_get_tid_range_from_dates(self):
+        min_tid, max_tid = get_tid_range_from_dates(
+            datetime(2025, 3, 16, 9, 22, 8, 657000), 1742116928.657
+        )
+
+        assert min_tid <= "3lkicuf37nc2v" <= max_tid
+
+        min_tid, max_tid = get_tid_range_from_dates(
+            datetime(2025, 3, 16, 9, 22, 8), datetime(2025, 3, 16, 9, 22, 8, 656000)
+        )
+
+        assert not (min_tid <= "3lkicuf37nc2v" <= max_tid)
+
+        with pytest.raises(ValueError):
+            get_tid_range_from_dates(1742116928, 1742116927)
+
+    def test_get_backdating_delay(self):
+        posts = get_json_resource("bluesky-normalized-posts.json")
+
+        for post_list in posts:
+            for post in post_list:
+                timestamp = get_timestamp_from_tid(post["did"])
+
+                assert timestamp is not None
+                assert get_backdating_delay(post) == timestamp - post["timestamp_utc"]
+
+        assert get_backdating_delay({"did": "self", "timestamp_utc": 0}) is None
@@ -0,0 +1,53 @@
+import csv
+from io import StringIO
+from twitwi.bluesky import (
+    PostCSVWriter,
+    PartialPostCSVWriter,
+    ProfileCSVWriter,
+    PartialProfileCSVWriter,
+)
+from test.utils import get_json_resource, open_resource
+
+
+class TestWriters:
+    def test_csv_writers(self):
+        tests = [
+            (
+                ProfileCSVWriter,
+                "bluesky-normalized-profiles.json",
+                "bluesky-profiles-export.csv",
+            ),
+            (
+                PartialProfileCSVWriter,
+                "bluesky-normalized-partial-profiles.json",
+                "bluesky-partial-profiles-export.csv",
+            ),
+            (
+                PostCSVWriter,
+                "bluesky-normalized-posts.json",
+                "bluesky-posts-export.csv",
+            ),
+            (
+                PartialPostCSVWriter,
+                "bluesky-normalized-firehose-posts.json",
+                "bluesky-firehose-posts-export.csv",
+            ),
+        ]
+
+        for writer_class, normalized, export in tests:
+            items = get_json_resource(normalized)
+
+            # NOTE: posts are stored along with their referenced posts
+            if writer_class is PostCSVWriter:
+                items = [post for source in items for post in source]
+
+            buffer = StringIO(newline=None)
+
+            with writer_class(buffer, allow_erroneous_plurals=True) as writer:
+                writer.writerows(items)
+
+            assert writer.rows_written == len(items)
+
+            with open_resource(export) as f:
+                buffer.seek(0)
+                assert list(csv.reader(buffer)) == list(csv.reader(f))
@@ -0,0 +1,159 @@
+# =============================================================================
+# Twitwi Columnar Export Unit Tests
+# =============================================================================
+import pytest
+from array import array
+from test.utils import get_json_resource
+
+from twitwi.columnar import (
+    ColumnarBuilder,
+    get_column_types,
+    iter_row_groups,
+    to_columns,
+)
+from twitwi.normalizers import normalize_tweet
+from twitwi.utils import collection_clock
+
+FAKE_COLLECTION_TIME = "2025-01-01T00:00:00.000000"
+
+
+def get_expected_column(records, field, type):
+    values = []
+
+    for record in records:
+        value = record.get(field)
+
+        if field == "links":
+            value = record.get("proper_links", value)
+
+        if type == "str" and value is not None:
+            value = str(value)
+
+        values.append(value)
+
+    return values
+
+
+class TestColumnar(object):
+    def test_get_column_types(self):
+        types = get_column_types("tweet", fields=["id", "lat", "hashtags"])
+
+        assert types == {"id": "str", "lat": "float", "hashtags": "list"}
+
+        types = get_column_types("post")
+
+        assert types["like_count"] == "int"
+        assert types["match_query"] == "bool"
+        assert types["quoted_created_at"] == "str"
+
+        with pytest.raises(ValueError):
+            get_column_types("toot")
+
+        with pytest.raises(TypeError):
+            get_column_types("tweet", fields=["id", "unknown"])
+
+    def test_to_columns(self):
+        with collection_clock(FAKE_COLLECTION_TIME):
+            tweets = [
+                normalize_tweet(test["source"], collection_source="api")
+                for test in get_json_resource("normalization.json")
+            ]
+
+        columns = to_columns(iter(tweets))
+        types = get_column_types("tweet")
+
+        assert list(columns) == list(types)
+
+        for field, column in columns.items():
+            assert len(column) == len(tweets)
+            assert column.to_list() == get_expected_column(tweets, field, types[field])
+
+        timestamps = columns["timestamp_utc"]
+
+        assert isinstance(timestamps.values, array)
+        assert timestamps.values.typecode == "q"
+        assert list(timestamps.values) == [tweet["timestamp_utc"] for tweet in tweets]
+
+        retweeted = columns["retweeted_timestamp_utc"]
+
+        assert list(retweeted.mask) == [
+            int(tweet.get("retweeted_timestamp_utc") is None) for tweet in tweets
+        ]
+
+        hashtags = columns["hashtags"]
+
+        assert hashtags.offsets[-1] == len(hashtags.child)
+        assert hashtags.child.data == "".join(
+            "".join(tweet["hashtags"]) for tweet in tweets
+        ).encode("utf-8")
+
+    def test_bluesky(self):
+        posts = [
+            post
+            for posts in get_json_resource("bluesky-normalized-posts.json")
+            for post in posts
+        ]
+
+        columns = to_columns(posts, schema="post", fields=["uri", "like_count"])
+        types = get_column_types("post")
+
+        assert list(columns) == ["uri", "like_count"]
+
+        for field, column in columns.items():
+            assert column.to_list() == get_expected_column(posts, field, types[field])
+
+    def test_row_groups(self):
+        profiles = get_json_resource("bluesky-normalized-profiles.json")
+        expected = to_columns(profiles, schema="profile")
+
+        with pytest.raises(ValueError):
+            iter_row_groups(profiles, schema="profile", row_group_size=0)
+
+        groups = list(
+            iter_row_groups(iter(profiles), schema="profile", row_group_size=2)
+        )
+
+        assert [len(group["did"]) for group in groups] == [
+            min(2, len(profiles) - i) for i in range(0, len(profiles), 2)
+        ]
+
+        for field, column in expected.items():
+            assert column.to_list() == [
+                value for group in groups for value in group[field].to_list()
+            ]
+
+        builder = ColumnarBuilder("profile")
+        builder.extend(profiles)
+
+        assert len(builder) == len(profiles)
+
+        builder.flush()
+
+        assert len(builder) == 0
+        assert len(builder.flush()["did"]) == 0
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            tweets = [
+                normalize_tweet(test["source"], collection_source="api")
+                for test in get_json_resource("normalization.json")
+            ]
+
+        columns = to_columns(tweets, numpy=True)
+
+        for field, column in columns.items():
+            assert (
+                column.to_list() == to_columns(tweets, fields=[field])[field].to_list()
+            )
+
+        retweeted = columns["retweeted_timestamp_utc"]
+
+        assert isinstance(retweeted.values, np.ma.MaskedArray)
+        assert retweeted.values.dtype == np.int64
+        assert retweeted.values.count() == sum(
+            tweet.get("retweeted_timestamp_utc") is not None for tweet in tweets
+        )
+        assert columns["possibly_sensitive"].values.dtype == np.bool_
+        assert columns["hashtags"].offsets.dtype == np.int64
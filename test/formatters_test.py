@@ -4,16 +4,23 @@
 import ndjson
 import csv
 import pytest
+from copy import deepcopy
 from io import StringIO
 from test.utils import open_resource, get_json_resource, get_jsonl_resource
 
-from twitwi.constants import TWEET_FIELDS, USER_FIELDS
+from twitwi.constants import TWEET_FIELDS, TWEET_FIELDS_TCAT, USER_FIELDS
 from twitwi.normalizers import normalize_tweet
 from twitwi.formatters import (
     transform_tweet_into_csv_dict,
     format_tweet_as_csv_row,
+    format_tweet_as_csv_dict,
+    format_tweets_as_csv_dicts,
     transform_user_into_csv_dict,
     format_user_as_csv_row,
+    format_users_as_csv_dicts,
+    format_tweet_as_tcat_row,
+    apply_tcat_format,
+    compile_csv_row_formatter,
 )
 
 
@@ -121,3 +128,133 @@ class TestFormatters(object):
         with open_resource("user-export.csv") as f:
             output.seek(0)
             assert list(csv.reader(output)) == list(csv.reader(f))
+
+    def test_compile_csv_row_formatter(self):
+        formatter = compile_csv_row_formatter(
+            ["id", "links", "hashtags", "possibly_sensitive", "name", "weird \"field'"],
+            ["links", "hashtags"],
+            ["possibly_sensitive"],
+            plural_separator="§",
+            allow_erroneous_plurals=True,
+        )
+
+        item = {
+            "id": "1",
+            "links": ["https://a.fr"],
+            "proper_links": ["https://b.fr"],
+            "hashtags": ["a", None],
+            "possibly_sensitive": True,
+            "weird \"field'": 3,
+        }
+
+        assert formatter(item) == ["1", "https://b.fr", "a§", 1, "", 3]
+        assert formatter({}, item_id="2") == ["2", "", "", "", "", ""]
+
+        # Rows are identical for every option
+        with open_resource("tweet-export.jsonl") as f:
+            for item in ndjson.reader(f):
+                tweet = item["_source"]
+                tweet["collected_via"] = ["search", None]
+
+                row = format_tweet_as_csv_row(
+                    tweet, plural_separator="§", allow_erroneous_plurals=True
+                )
+
+                assert row[TWEET_FIELDS.index("collected_via")] == "search§"
+                assert row[TWEET_FIELDS.index("hashtags")] == "§".join(
+                    tweet.get("hashtags", [])
+                )
+
+    def test_format_tweet_as_tcat_row(self):
+        tweets = [
+            normalize_tweet(test["source"], collection_source="api")
+            for test in get_json_resource("normalization.json")
+        ]
+
+        for tweet in tweets:
+            row = format_tweet_as_tcat_row(tweet)
+
+            assert len(row) == len(TWEET_FIELDS_TCAT)
+
+            formatted = dict(zip(TWEET_FIELDS_TCAT, row))
+
+            for field, value in apply_tcat_format(tweet).items():
+                if field not in formatted:
+                    continue
+
+                if isinstance(value, list):
+                    value = "|".join(value)
+                elif isinstance(value, bool):
+                    value = int(value)
+
+                assert formatted[field] == value
+
+            assert formatted["filter_level"] == ""
+            assert formatted["HTTP status code"] == ""
+
+        row = format_tweet_as_tcat_row(
+            {"id": "1", "hashtags": ["a", "b"], "user_verified": True},
+            item_id="2",
+            plural_separator=";",
+        )
+
+        assert row[:4] == ["2", "", "", ""]
+        assert row[TWEET_FIELDS_TCAT.index("hashtags")] == "a;b"
+        assert row[TWEET_FIELDS_TCAT.index("from_user_verified")] == 1
+        assert row[TWEET_FIELDS_TCAT.index("source")] == ""
+
+    def test_format_tweet_as_csv_dict(self):
+        with open_resource("tweet-export.jsonl") as f:
+            items = list(ndjson.reader(f))
+
+        original_items = deepcopy(items)
+
+        output = StringIO()
+        writer = csv.DictWriter(
+            output,
+            fieldnames=TWEET_FIELDS,
+            extrasaction="ignore",
+            restval="",
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        writer.writeheader()
+
+        for item in items:
+            tweet = item["_source"]
+            row = format_tweet_as_csv_dict(tweet, item_id=item["_id"])
+
+            expected = deepcopy(tweet)
+            transform_tweet_into_csv_dict(expected, item_id=item["_id"])
+
+            assert row == expected
+            assert row["text"] is tweet["text"]
+
+            writer.writerow(row)
+
+        assert items == original_items
+
+        with open_resource("tweet-export.csv") as f:
+            output.seek(0)
+            assert list(csv.DictReader(output)) == list(csv.DictReader(f))
+
+        tweets = [item["_source"] for item in items]
+        rows = list(format_tweets_as_csv_dicts(iter(tweets), plural_separator="§"))
+
+        assert rows == [
+            format_tweet_as_csv_dict(tweet, plural_separator="§") for tweet in tweets
+        ]
+        assert items == original_items
+
+        users = get_json_resource("normalized-users.json")
+        original_users = deepcopy(users)
+        rows = list(format_users_as_csv_dicts(users))
+
+        assert users == original_users
+
+        for row, user in zip(rows, original_users):
+            transform_user_into_csv_dict(user)
+
+            # NOTE: the mutating version also adds an empty links field
+            del user["links"]
+
+            assert row == user
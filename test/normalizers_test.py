@@ -9,12 +9,23 @@ from ebbe import sorted_uniq
 from operator import itemgetter
 from test.utils import get_json_resource
 
+from twitwi.anonymizers import anonymize_normalized_tweet
 from twitwi.exceptions import TwitterPayloadV2IncompleteIncludesError
+from twitwi.formatters import format_tweet_as_csv_row
+from twitwi.lazy import LazyNormalizedTweet
 from twitwi.normalizers import (
     normalize_tweet,
+    normalize_tweets,
     normalize_user,
     normalize_tweets_payload_v2,
+    PayloadV2Normalizer,
+    expand_urls,
+    extract_items_from_text,
+    extract_hashtags_and_mentions_from_text,
+    get_payload_v2_items,
 )
+from twitwi.stats import NormalizationStats
+from twitwi.utils import collection_clock, get_collection_time
 
 
 def compare_tweets(_id, t1, t2, ignore_fields=[]):
@@ -109,6 +120,301 @@ class TestNormalizers(object):
 
         assert tweet == original_arg
 
+        # NOTE: purity is free, so even pure=False does not mutate
+        for test in get_json_resource("normalization.json"):
+            tweet = test["source"]
+            original_arg = deepcopy(tweet)
+
+            normalize_tweet(tweet, extract_referenced_tweets=True, pure=False)
+
+            assert tweet == original_arg
+
+    def test_normalize_tweets(self):
+        tz = timezone("Europe/Paris")
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+
+        with pytest.raises(Exception):
+            normalize_tweets(tweets, source_version="v2")
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            expected = [
+                normalize_tweet(tweet, locale=tz, collection_source="api")
+                for tweet in tweets
+            ]
+
+            assert (
+                list(normalize_tweets(tweets, locale=tz, collection_source="api"))
+                == expected
+            )
+
+            # Referenced tweets are deduplicated & their collection sources merged
+            retweet = next(tweet for tweet in tweets if "retweeted_status" in tweet)
+            retweet_id = retweet["retweeted_status"]["id_str"]
+
+            normalized_tweets = list(
+                normalize_tweets(
+                    [retweet, retweet["retweeted_status"], retweet],
+                    extract_referenced_tweets=True,
+                    collection_source="api",
+                )
+            )
+
+            assert [tweet["id"] for tweet in normalized_tweets] == [
+                retweet_id,
+                retweet["id_str"],
+            ]
+            assert normalized_tweets[0]["collected_via"] == ["retweet", "api"]
+            assert normalized_tweets[1] == normalize_tweet(
+                retweet, collection_source="api"
+            )
+
+            # Mutating yielded tweets does not corrupt the next ones
+            expected = {}
+
+            for tweet in normalize_tweets(
+                tweets * 2, extract_referenced_tweets=True, cache_size=0
+            ):
+                expected.setdefault(tweet["id"], tweet)
+
+            normalized_tweets = []
+
+            for tweet in normalize_tweets(tweets * 2, extract_referenced_tweets=True):
+                normalized_tweets.append(deepcopy(tweet))
+                anonymize_normalized_tweet(tweet)
+                tweet["text"] = "MUTATED"
+                tweet["hashtags"].append("mutated")
+
+            assert normalized_tweets == list(expected.values())
+
+        # Repeated referenced tweets are only normalized once
+        stats = NormalizationStats()
+        list(normalize_tweets([retweet] * 10, stats=stats))
+
+        assert stats.as_dict()["retweet"]["calls"] == 10
+        assert stats.as_dict()["entities"]["calls"] == 11
+
+        stats = NormalizationStats()
+        list(normalize_tweets([retweet] * 10, cache_size=0, stats=stats))
+
+        assert stats.as_dict()["entities"]["calls"] == 20
+
+    def test_fields(self):
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+        payload = get_json_resource("payload-v2-tweet-retweet.json")
+
+        with pytest.raises(TypeError):
+            normalize_tweet(tweets[0], fields=["id", "unknown"])
+
+        with pytest.raises(TypeError):
+            normalize_tweets_payload_v2(payload, fields="id")
+
+        fields_to_test = [
+            ["id", "timestamp_utc", "user_id", "retweeted_id", "links"],
+            ["domains", "quoted_timestamp_utc", "retweet_count"],
+            ["hashtags", "mentioned_ids", "media_files", "user_created_at"],
+            ["text", "place_name", "source_name", "collected_via"],
+        ]
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            for fields in fields_to_test:
+                # NOTE: "id" & dependencies are always included
+                expected_fields = set(fields) | {"id"}
+
+                if "domains" in fields:
+                    expected_fields.add("links")
+
+                if "hashtags" in fields:
+                    expected_fields.add("text")
+
+                for tweet in tweets:
+                    expected = normalize_tweet(tweet, collection_source="api")
+                    normalized = normalize_tweet(
+                        tweet, collection_source="api", fields=fields
+                    )
+
+                    assert normalized == {
+                        k: v for k, v in expected.items() if k in expected_fields
+                    }
+
+                    # Referenced tweets hold at least the requested fields
+                    expected = normalize_tweet(tweet, extract_referenced_tweets=True)
+                    normalized = normalize_tweet(
+                        tweet, extract_referenced_tweets=True, fields=fields
+                    )
+
+                    assert len(normalized) == len(expected)
+
+                    for a, b in zip(normalized, expected):
+                        assert a.items() <= b.items()
+                        assert expected_fields & b.keys() <= a.keys()
+
+                expected = normalize_tweets_payload_v2(payload)
+                normalized = normalize_tweets_payload_v2(payload, fields=fields)
+
+                assert normalized == [
+                    {k: v for k, v in tweet.items() if k in expected_fields}
+                    for tweet in expected
+                ]
+
+    def test_lazy(self):
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+        payload = get_json_resource("alternative-payload-v2.json")
+
+        with pytest.raises(TypeError):
+            normalize_tweet(tweets[0], lazy=True, fields=["id"])
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            for tweet in tweets:
+                expected = normalize_tweet(tweet, collection_source="api")
+                lazy = normalize_tweet(tweet, collection_source="api", lazy=True)
+
+                assert isinstance(lazy, LazyNormalizedTweet)
+                assert lazy["id"] == expected["id"]
+                assert lazy["text"] == expected["text"]
+                assert lazy.get("lat") == expected.get("lat")
+                assert format_tweet_as_csv_row(lazy) == format_tweet_as_csv_row(
+                    expected
+                )
+
+                materialized = lazy.materialize()
+
+                assert materialized == expected
+                assert list(materialized) == list(expected)
+
+                expected = normalize_tweet(tweet, extract_referenced_tweets=True)
+                lazy = normalize_tweet(tweet, extract_referenced_tweets=True, lazy=True)
+
+                assert lazy == expected
+
+            # NOTE: deduplicated tweets still merge their collection sources
+            expected = normalize_tweets_payload_v2(
+                payload, extract_referenced_tweets=True, collection_source="api"
+            )
+            lazy = normalize_tweets_payload_v2(
+                payload,
+                extract_referenced_tweets=True,
+                collection_source="api",
+                lazy=True,
+            )
+
+            assert [t["collected_via"] for t in lazy] == [
+                t["collected_via"] for t in expected
+            ]
+            assert [t.materialize() for t in lazy] == expected
+
+        # Reading lazy tweets does not change the current collection clock
+        with collection_clock("2025-01-02T00:00:00.000000"):
+            lazy = [normalize_tweet(tweets[0], lazy=True)]
+            lazy.extend(normalize_tweets_payload_v2(payload, lazy=True))
+
+        with collection_clock("2025-01-03T00:00:00.000000"):
+            for tweet in lazy:
+                assert tweet["text"]
+                assert tweet["collection_time"] == "2025-01-02T00:00:00.000000"
+                assert get_collection_time() == "2025-01-03T00:00:00.000000"
+
+        seen = []
+
+        def normalize(fields, collection_time):
+            seen.append((collection_time, get_collection_time()))
+
+            return {"id": "1", "collection_time": collection_time}
+
+        with collection_clock("2025-01-02T00:00:00.000000"):
+            lazy = LazyNormalizedTweet(normalize, "1")
+
+        with collection_clock("2025-01-03T00:00:00.000000"):
+            assert lazy["collection_time"] == "2025-01-02T00:00:00.000000"
+
+        assert seen == [("2025-01-02T00:00:00.000000", "2025-01-03T00:00:00.000000")]
+
+        # A second missing group of fields computes the whole tweet
+        expected = normalize_tweet(tweets[0])
+        calls = []
+
+        def normalize(fields, collection_time):
+            calls.append(fields)
+
+            if fields is None:
+                return expected
+
+            return {k: v for k, v in expected.items() if k in fields}
+
+        lazy = LazyNormalizedTweet(normalize, expected["id"])
+
+        assert lazy["text"] == expected["text"]
+        assert lazy["hashtags"] == expected["hashtags"]
+        assert len(calls) == 1 and "text" in calls[0]
+
+        assert lazy["links"] == expected["links"]
+        assert lazy["lang"] == expected["lang"]
+        assert lazy.materialize() == expected
+        assert calls[1:] == [None]
+
+    def test_expand_urls(self):
+        text = "See https://t.co/a and https://t.co/ab https://t.co/m"
+
+        replacements = [
+            ("https://t.co/ab", "https://example.com/ab", 24, 39),
+            ("https://t.co/a", "https://example.com/a", 4, 18),
+            ("https://t.co/m", "https://twitter.com/photo/1", 40, 54),
+            ("https://t.co/m", "https://twitter.com/photo/1", 40, 54),
+        ]
+
+        # NOTE: replacing "https://t.co/a" first would break "https://t.co/ab"
+        assert expand_urls(text, replacements) == (
+            "See https://example.com/a and https://example.com/ab "
+            "https://twitter.com/photo/1"
+        )
+
+        # Missing or inconsistent indices fall back to replacing the url
+        assert expand_urls(
+            text,
+            [
+                ("https://t.co/m", "https://twitter.com/photo/1", None, None),
+                ("https://t.co/a", "https://example.com/a", 0, 14),
+            ],
+        ) == (
+            "See https://example.com/a and https://example.com/ab "
+            "https://twitter.com/photo/1"
+        )
+
+        assert expand_urls(text, []) == text
+
+        text = " ".join("https://t.co/%i" % i for i in range(1000))
+        replacements = []
+        start = 0
+
+        for i in range(1000):
+            url = "https://t.co/%i" % i
+            replacements.append(
+                (url, "https://example.com/%i" % i, start, start + len(url))
+            )
+            start += len(url) + 1
+
+        assert expand_urls(text, replacements) == " ".join(
+            "https://example.com/%i" % i for i in range(1000)
+        )
+
+    def test_extract_hashtags_and_mentions_from_text(self):
+        texts = [
+            "RT @author: Hello @World, #hashtag & #HashTag! ##double @@you",
+            "RT @author: RT @other: #a@b @c#d e#f g@h",
+            "Lone # and @ markers, #é_1 @über-ß",
+            "",
+        ]
+
+        for text in texts:
+            assert extract_hashtags_and_mentions_from_text(text) == (
+                extract_items_from_text(text, "#"),
+                extract_items_from_text(text, "@"),
+            )
+
+        assert extract_hashtags_and_mentions_from_text(texts[0]) == (
+            ["double", "hashtag"],
+            ["world", "you"],
+        )
+
     def test_normalize_user(self):
         tz = timezone("Europe/Paris")
 
@@ -130,6 +436,10 @@ class TestNormalizers(object):
 
         assert user == original_arg
 
+        normalize_user(user, pure=False)
+
+        assert user == original_arg
+
     def test_normalize_tweets_payload_v2(self):
         with pytest.raises(TypeError):
             normalize_tweets_payload_v2("test")
@@ -220,6 +530,154 @@ class TestNormalizers(object):
             assert "collection_time" in t1 and isinstance(t1["collection_time"], str)
             compare_tweets(t2["id"], t1, t2)
 
+    def test_normalize_tweets_payload_v2_memo(self):
+        payload = get_json_resource("payload-v2.json")
+        included_ids = set(t["id"] for t in payload["includes"]["tweets"])
+
+        retweet = next(
+            tweet
+            for tweet in payload["data"]
+            if any(
+                ref["type"] == "retweeted" and ref["id"] in included_ids
+                for ref in tweet.get("referenced_tweets", [])
+            )
+        )
+
+        # Page where the same tweet is retweeted 10 times
+        page = {"data": [], "includes": payload["includes"]}
+
+        for i in range(10):
+            page["data"].append({**retweet, "id": str(int(retweet["id"]) + i)})
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            expected = [
+                normalize_tweets_payload_v2(
+                    {"data": [tweet], "includes": payload["includes"]},
+                    extract_referenced_tweets=True,
+                    collection_source="api",
+                )
+                for tweet in page["data"]
+            ]
+
+            stats = NormalizationStats()
+            normalized_tweets = normalize_tweets_payload_v2(
+                page,
+                extract_referenced_tweets=True,
+                collection_source="api",
+                stats=stats,
+            )
+
+        assert normalized_tweets[:2] == expected[0]
+        assert normalized_tweets[2:] == [tweets[0] for tweets in expected[1:]]
+
+        # The retweeted tweet & the shared author are only normalized once
+        assert stats.as_dict()["retweet"]["calls"] == 10
+        assert stats.as_dict()["urls"]["calls"] == 11
+        # NOTE: dates of the 11 tweets, and of the 2 authors
+        assert stats.as_dict()["get_dates"]["calls"] == 11 + 2
+
+    def test_payload_v2_normalizer(self):
+        payloads = [
+            get_json_resource(name)
+            for name in [
+                "payload-v2.json",
+                "payload-v2-tweet-retweet.json",
+                "alternative-payload-v2.json",
+            ]
+        ]
+
+        # Overlapping pages
+        payloads.append(payloads[0])
+
+        with pytest.raises(TypeError):
+            PayloadV2Normalizer().feed({"data": []})
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            for extract_referenced_tweets in [False, True]:
+                expected = {}
+
+                # NOTE: the first occurrence of each tweet is kept as is
+                for payload in payloads:
+                    for item in get_payload_v2_items(payload):
+                        for tweet in normalize_tweets_payload_v2(
+                            {"data": [item], "includes": payload["includes"]},
+                            extract_referenced_tweets=extract_referenced_tweets,
+                            collection_source="api",
+                        ):
+                            expected.setdefault(tweet["id"], tweet)
+
+                normalizer = PayloadV2Normalizer(
+                    extract_referenced_tweets=extract_referenced_tweets,
+                    collection_source="api",
+                )
+
+                normalized_tweets = []
+
+                for payload in payloads:
+                    normalized_tweets.extend(normalizer.feed(payload))
+
+                assert normalized_tweets == list(expected.values())
+
+                # Mutating yielded tweets does not corrupt the next pages
+                normalizer = PayloadV2Normalizer(
+                    extract_referenced_tweets=extract_referenced_tweets,
+                    collection_source="api",
+                )
+
+                mutated_tweets = []
+
+                for payload in payloads:
+                    for tweet in normalizer.feed(payload):
+                        mutated_tweets.append(deepcopy(tweet))
+                        anonymize_normalized_tweet(tweet)
+                        tweet["text"] = "MUTATED"
+                        tweet["hashtags"].append("mutated")
+
+                assert mutated_tweets == normalized_tweets
+
+        # Memoized referenced tweets get the collection time of their page
+        payload = get_json_resource("payload-v2-tweet-retweet.json")
+        normalizer = PayloadV2Normalizer(extract_referenced_tweets=True)
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            list(normalizer.feed(payload))
+
+        normalizer.already_seen.clear()
+
+        with collection_clock("2025-01-02T00:00:00.000000"):
+            for tweet in normalizer.feed(payload):
+                assert tweet["collection_time"] == "2025-01-02T00:00:00.000000"
+
+        with collection_clock("2025-01-01T00:00:00.000000"):
+            # Includes of earlier pages are used by the next ones
+            payload = payloads[0]
+            retweet = next(
+                tweet
+                for tweet in payload["data"]
+                if any(
+                    ref["type"] == "retweeted"
+                    for ref in tweet.get("referenced_tweets", [])
+                )
+            )
+
+            normalizer = PayloadV2Normalizer()
+            list(normalizer.feed(payload))
+
+            page = {"data": [{**retweet, "id": "1"}], "includes": {}}
+
+            with pytest.raises(TwitterPayloadV2IncompleteIncludesError):
+                normalize_tweets_payload_v2(page)
+
+            tweet = next(normalizer.feed(page))
+
+            assert tweet == {
+                **normalize_tweets_payload_v2(
+                    {"data": [retweet], "includes": payload["includes"]}
+                )[0],
+                "id": "1",
+                "url": tweet["url"],
+            }
+
     def test_incomplete_includes(self):
         payload = get_json_resource("payload-v2.json")
 
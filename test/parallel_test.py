@@ -0,0 +1,88 @@
+# =============================================================================
+# Twitwi Parallel Normalization Unit Tests
+# =============================================================================
+import pickle
+import pytest
+from test.utils import get_json_resource
+
+from twitwi.bluesky import normalize_post
+from twitwi.exceptions import (
+    BlueskyPayloadError,
+    PayloadLineError,
+    PayloadNormalizationError,
+    TwitterPayloadV2IncompleteIncludesError,
+)
+from twitwi.normalizers import normalize_tweet
+from twitwi.parallel import normalize_many
+from twitwi.utils import collection_clock
+
+FAKE_COLLECTION_TIME = "2025-01-01T00:00:00.000000"
+
+
+class TestParallel(object):
+    def test_normalize_many(self):
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+        tweets = tweets * 4
+
+        with pytest.raises(ValueError):
+            normalize_many(tweets, kind="toot")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [
+                normalize_tweet(tweet, extract_referenced_tweets=True)
+                for tweet in tweets
+            ]
+
+            for workers in [1, 2]:
+                results = normalize_many(
+                    iter(tweets),
+                    workers=workers,
+                    chunksize=3,
+                    extract_referenced_tweets=True,
+                )
+
+                assert list(results) == expected
+
+                results = normalize_many(
+                    tweets,
+                    workers=workers,
+                    chunksize=3,
+                    ordered=False,
+                    extract_referenced_tweets=True,
+                )
+
+                assert sorted(results, key=lambda item: item[0]) == list(
+                    enumerate(expected)
+                )
+
+    def test_errors(self):
+        posts = get_json_resource("bluesky-posts.json")[:3]
+        payloads = [posts[0], "broken", posts[1], {}, posts[2]]
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [normalize_post(post) for post in posts]
+            results = list(
+                normalize_many(payloads, kind="post", workers=2, chunksize=2)
+            )
+
+        assert [results[0], results[2], results[4]] == expected
+
+        assert isinstance(results[1], PayloadNormalizationError)
+        assert results[1].index == 1
+        assert isinstance(results[1].error, BlueskyPayloadError)
+        assert results[3].index == 3
+
+    def test_exceptions_are_picklable(self):
+        errors = [
+            TwitterPayloadV2IncompleteIncludesError("user", "123"),
+            BlueskyPayloadError("at://post", "broken"),
+            PayloadLineError(3, "{}", KeyError("id")),
+            PayloadNormalizationError(3, KeyError("id")),
+        ]
+
+        for error in errors:
+            unpickled = pickle.loads(pickle.dumps(error))
+
+            assert type(unpickled) is type(error)
+            assert str(unpickled) == str(error)
+            assert vars(unpickled).keys() == vars(error).keys()
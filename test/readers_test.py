@@ -0,0 +1,281 @@
+# =============================================================================
+# Twitwi Readers Unit Tests
+# =============================================================================
+import io
+import gc
+import bz2
+import gzip
+import json
+import lzma
+import pytest
+import warnings
+from os.path import join
+from test.utils import get_json_resource, RESOURCES_DIR
+
+from twitwi.exceptions import PayloadLineError
+from twitwi.formatters import format_tweet_as_csv_row
+from twitwi.normalizers import (
+    normalize_tweet,
+    normalize_user,
+    normalize_tweets_payload_v2,
+)
+from twitwi.readers import (
+    iter_normalized_tweets,
+    iter_normalized_tweets_payloads_v2,
+    iter_normalized_users,
+    iter_normalized_large_payload_v2,
+    iter_tweets_from_csv,
+    iter_users_from_csv,
+)
+from twitwi.utils import collection_clock
+from twitwi.writers import TweetCSVWriter
+
+FAKE_COLLECTION_TIME = "2025-01-01T00:00:00.000000"
+
+OPENERS = {
+    "tweets.jsonl": open,
+    "tweets.jsonl.gz": gzip.open,
+    "tweets.jsonl.bz2": bz2.open,
+    "tweets.jsonl.xz": lzma.open,
+}
+
+
+def dump_jsonl(payloads):
+    return "".join(json.dumps(payload) + "\n" for payload in payloads)
+
+
+class TestReaders(object):
+    def test_iter_normalized_tweets(self, tmp_path):
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+        data = dump_jsonl(tweets)
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [
+                normalize_tweet(tweet, extract_referenced_tweets=True)
+                for tweet in tweets
+            ]
+            expected = [tweet for normalized in expected for tweet in normalized]
+
+            for name, opener in OPENERS.items():
+                path = tmp_path / name
+
+                with opener(path, "wt", encoding="utf-8") as f:
+                    f.write(data)
+
+                normalized_tweets = iter_normalized_tweets(
+                    str(path), extract_referenced_tweets=True, buffer_size=64
+                )
+
+                assert not isinstance(normalized_tweets, list)
+                assert list(normalized_tweets) == expected
+
+            # File objects, either in binary or text mode, are left open
+            for f in [io.BytesIO(gzip.compress(data.encode())), io.StringIO(data)]:
+                assert (
+                    list(iter_normalized_tweets(f, extract_referenced_tweets=True))
+                    == expected
+                )
+                assert not f.closed
+
+    @pytest.mark.filterwarnings("error::ResourceWarning")
+    def test_files_are_closed(self, tmp_path):
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+        data = dump_jsonl(tweets)
+
+        with open(join(RESOURCES_DIR, "tweet-export.csv"), encoding="utf-8") as f:
+            csv_data = f.read()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+
+            for name, opener in OPENERS.items():
+                path = tmp_path / name
+
+                with opener(path, "wt", encoding="utf-8") as f:
+                    f.write(data)
+
+                list(iter_normalized_tweets(str(path)))
+
+                path = tmp_path / name.replace("jsonl", "csv")
+
+                with opener(path, "wt", encoding="utf-8", newline="") as f:
+                    f.write(csv_data)
+
+                list(iter_tweets_from_csv(str(path)))
+
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    def test_iter_normalized_tweets_payloads_v2(self):
+        payloads = [
+            get_json_resource("payload-v2.json"),
+            get_json_resource("payload-v2-tweet-retweet.json"),
+        ]
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [
+                tweet
+                for payload in payloads
+                for tweet in normalize_tweets_payload_v2(payload)
+            ]
+
+            assert (
+                list(
+                    iter_normalized_tweets_payloads_v2(
+                        io.StringIO(dump_jsonl(payloads))
+                    )
+                )
+                == expected
+            )
+
+    def test_iter_normalized_large_payload_v2(self, tmp_path):
+        payload = get_json_resource("payload-v2.json")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = normalize_tweets_payload_v2(
+                payload, extract_referenced_tweets=True
+            )
+
+            # NOTE: data come first in API responses, and the file is read twice
+            for keys in [["data", "includes", "meta"], ["meta", "includes", "data"]]:
+                data = json.dumps({k: payload[k] for k in keys}, indent=2)
+
+                normalized_tweets = iter_normalized_large_payload_v2(
+                    io.StringIO(data), extract_referenced_tweets=True, buffer_size=64
+                )
+
+                assert list(normalized_tweets) == expected
+
+                path = tmp_path / "payload.json.gz"
+
+                with gzip.open(path, "wt", encoding="utf-8") as f:
+                    f.write(data)
+
+                normalized_tweets = iter_normalized_large_payload_v2(
+                    str(path), extract_referenced_tweets=True
+                )
+
+                assert list(normalized_tweets) == expected
+
+        empty = io.StringIO(json.dumps({"meta": {"result_count": 0}}))
+
+        assert list(iter_normalized_large_payload_v2(empty)) == []
+
+        with pytest.raises(TypeError):
+            list(iter_normalized_large_payload_v2(io.StringIO("[]")))
+
+        with pytest.raises(TypeError):
+            list(iter_normalized_large_payload_v2(io.StringIO('{"data": []}')))
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_normalized_large_payload_v2(io.StringIO('{"data": [{}')))
+
+    def test_iter_normalized_users(self):
+        users = get_json_resource("api-users-v1.json")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            assert list(iter_normalized_users(io.StringIO(dump_jsonl(users)))) == [
+                normalize_user(user) for user in users
+            ]
+
+    def test_errors(self):
+        tweet = get_json_resource("normalization.json")[0]["source"]
+        data = dump_jsonl([tweet]) + "{broken\n\n" + dump_jsonl([{}, tweet])
+
+        with pytest.raises(ValueError):
+            iter_normalized_tweets(io.StringIO(data), on_error="ignore")
+
+        with pytest.raises(TypeError):
+            iter_normalized_tweets(io.StringIO(data), on_error="collect")
+
+        with pytest.raises(PayloadLineError) as info:
+            list(iter_normalized_tweets(io.StringIO(data)))
+
+        assert info.value.line == 2
+        assert isinstance(info.value.error, json.JSONDecodeError)
+
+        assert (
+            len(list(iter_normalized_tweets(io.StringIO(data), on_error="skip"))) == 2
+        )
+
+        errors = []
+        normalized_tweets = list(
+            iter_normalized_tweets(io.StringIO(data), on_error="collect", errors=errors)
+        )
+
+        assert len(normalized_tweets) == 2
+        assert [error.line for error in errors] == [2, 4]
+        assert errors[1].payload == "{}\n"
+        assert isinstance(errors[1].error, KeyError)
+
+    def test_iter_tweets_from_csv(self):
+        tweets = [
+            normalize_tweet(test["source"], collection_source="api")
+            for test in get_json_resource("normalization.json")
+        ]
+
+        # Compressed csv written by the formatters
+        output = io.BytesIO()
+
+        with TweetCSVWriter(output, compress=True) as writer:
+            writer.writerows(tweets)
+
+        output.seek(0)
+        records = list(iter_tweets_from_csv(output))
+
+        assert len(records) == len(tweets)
+
+        def format_row(item):
+            return [
+                "" if value is None else str(value)
+                for value in format_tweet_as_csv_row(item)
+            ]
+
+        for record, tweet in zip(records, tweets):
+            assert format_row(record) == format_row(tweet)
+
+            assert record["timestamp_utc"] == tweet["timestamp_utc"]
+            assert record["hashtags"] == tweet["hashtags"]
+            assert record["match_query"] is tweet["match_query"]
+
+            if "possibly_sensitive" not in tweet:
+                assert "possibly_sensitive" not in record
+
+        # Timestamps formatted as floats
+        path = join(RESOURCES_DIR, "tweet-export.csv")
+        records = list(iter_tweets_from_csv(path, fields=["id", "timestamp_utc"]))
+
+        assert records[0] == {"id": "1347085867584794624", "timestamp_utc": 1610005273}
+
+        with pytest.raises(TypeError):
+            iter_tweets_from_csv(path, fields=["id", "unknown"])
+
+        users = list(iter_users_from_csv(join(RESOURCES_DIR, "user-export.csv")))
+
+        assert isinstance(users[0]["followers"], int)
+        assert isinstance(users[0]["verified"], bool)
+
+    def test_csv_errors(self):
+        data = "id,retweet_count,hashtags\n1,2,a|b\n2,two,\n3\n4,,\n"
+
+        with pytest.raises(PayloadLineError) as info:
+            list(iter_tweets_from_csv(io.StringIO(data)))
+
+        assert info.value.line == 3
+        assert isinstance(info.value.error, ValueError)
+
+        errors = []
+        records = list(
+            iter_tweets_from_csv(io.StringIO(data), on_error="collect", errors=errors)
+        )
+
+        assert records == [
+            {"id": "1", "retweet_count": 2, "hashtags": ["a", "b"]},
+            {"id": "4", "retweet_count": None, "hashtags": []},
+        ]
+        assert [error.line for error in errors] == [3, 4]
+        assert errors[1].payload == ["3"]
+
+        with pytest.raises(TypeError):
+            list(iter_tweets_from_csv(io.StringIO(data), fields=["id", "text"]))
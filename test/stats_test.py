@@ -0,0 +1,179 @@
+# =============================================================================
+# Twitwi Normalization Stats Unit Tests
+# =============================================================================
+from threading import Barrier, Event, Thread
+from test.utils import get_json_resource
+
+from twitwi.bluesky import normalize_post
+from twitwi.normalizers import normalize_tweet, normalize_tweets_payload_v2
+from twitwi.stats import (
+    NormalizationStats,
+    collect_stats,
+    resolve_stats,
+    NULL_STATS,
+)
+from twitwi.utils import collection_clock
+
+FAKE_COLLECTION_TIME = "2025-01-01T00:00:00.000000"
+
+
+class TestStats(object):
+    def test_normalization_stats(self):
+        stats = NormalizationStats()
+
+        with stats.stage("one"):
+            pass
+
+        with stats.stage("one"):
+            with stats.stage("two"):
+                pass
+
+        result = stats.as_dict()
+
+        assert set(result) == {"one", "two"}
+        assert result["one"]["calls"] == 2
+        assert result["two"]["calls"] == 1
+        assert result["one"]["time"] >= result["two"]["time"] >= 0
+
+        stats.reset()
+        assert stats.as_dict() == {}
+
+        with NULL_STATS.stage("one"):
+            pass
+
+        assert NULL_STATS.as_dict() == {}
+
+    def test_normalize_tweet(self):
+        tweets = [test["source"] for test in get_json_resource("normalization.json")]
+        stats = NormalizationStats()
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [
+                normalize_tweet(tweet, extract_referenced_tweets=True)
+                for tweet in tweets
+            ]
+
+            assert [
+                normalize_tweet(tweet, extract_referenced_tweets=True, stats=stats)
+                for tweet in tweets
+            ] == expected
+
+        result = stats.as_dict()
+
+        assert result["entities"]["calls"] == sum(
+            len(normalized) for normalized in expected
+        )
+        assert result["retweet"]["calls"] == sum(
+            "retweeted_status" in tweet for tweet in tweets
+        )
+        assert result["quote"]["calls"] >= 1
+        assert result["get_dates"]["calls"] >= 2 * len(tweets)
+
+    def test_normalize_tweets_payload_v2(self):
+        payload = get_json_resource("payload-v2-tweet-retweet.json")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = normalize_tweets_payload_v2(payload)
+
+            with collect_stats() as stats:
+                assert normalize_tweets_payload_v2(payload) == expected
+
+        result = stats.as_dict()
+
+        assert result["includes_index"]["calls"] == 1
+        assert result["entities"]["calls"] >= len(payload["data"])
+        assert "retweet" in result
+
+    def test_normalize_post(self):
+        posts = get_json_resource("bluesky-posts.json")
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            expected = [
+                normalize_post(post, extract_referenced_posts=True) for post in posts
+            ]
+
+            with collect_stats() as stats:
+                assert [
+                    normalize_post(post, extract_referenced_posts=True)
+                    for post in posts
+                ] == expected
+
+            result = stats.as_dict()
+
+            # Stats are disabled again outside of the context manager
+            explicit_stats = NormalizationStats()
+            normalize_post(posts[0], stats=explicit_stats)
+
+        assert stats.as_dict() == result
+
+        # NOTE: referenced posts may be normalized more than once
+        assert result["validate_post_payload"]["calls"] >= sum(
+            len(normalized) for normalized in expected
+        )
+
+        for stage in [
+            "get_dates",
+            "process_post_facets",
+            "process_links_from_card",
+            "quote",
+            "merge_nested_posts",
+            "thread",
+        ]:
+            assert result[stage]["calls"] > 0
+
+        assert explicit_stats.as_dict()["validate_post_payload"]["calls"] >= 1
+
+    def test_collect_stats_threads(self):
+        tweet = get_json_resource("normalization.json")[0]["source"]
+
+        with collect_stats() as stats:
+            normalize_tweet(tweet)
+
+        expected = stats.as_dict()["get_dates"]["calls"]
+
+        entered = Barrier(3)
+        normalized = Barrier(3)
+        first_exited = Event()
+        collectors = {}
+        after = {}
+
+        def run(name, n, wait_for=None):
+            with collect_stats() as stats:
+                collectors[name] = stats
+                entered.wait()
+
+                for _ in range(n):
+                    normalize_tweet(tweet)
+
+                normalized.wait()
+
+                if wait_for is not None:
+                    wait_for.wait()
+
+            if wait_for is None:
+                first_exited.set()
+
+            after[name] = resolve_stats()
+
+        # NOTE: collectors overlap and do not exit in the order they were enabled
+        threads = [
+            Thread(target=run, args=("a", 2)),
+            Thread(target=run, args=("b", 3, first_exited)),
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        entered.wait()
+        normalize_tweet(tweet)
+        main_stats = resolve_stats()
+        normalized.wait()
+
+        for thread in threads:
+            thread.join()
+
+        assert collectors["a"].as_dict()["get_dates"]["calls"] == 2 * expected
+        assert collectors["b"].as_dict()["get_dates"]["calls"] == 3 * expected
+        assert main_stats is NULL_STATS
+        assert after == {"a": NULL_STATS, "b": NULL_STATS}
+        assert resolve_stats() is NULL_STATS
@@ -1,15 +1,38 @@
 # =============================================================================
 # Twitwi Utilities Unit Tests
 # =============================================================================
+import pytest
+from datetime import datetime
+from threading import Barrier, Event, Thread
 from pytz import timezone
 from test.utils import get_json_resource
 
+from twitwi.dates import fallback_get_dates, parse_dates
+from twitwi.normalizers import normalize_tweet
+from twitwi.bluesky import normalize_post
 from twitwi.utils import (
+    LRUCache,
+    clear_url_cache,
+    get_url_cache_stats,
+    custom_normalize_url,
+    safe_normalize_url,
+    custom_get_normalized_hostname,
+    is_url,
+    collection_clock,
+    set_collection_clock,
+    get_collection_time,
+    FixedCollectionClock,
+    BatchCollectionClock,
+    TickCollectionClock,
     get_dates,
     get_timestamp_from_id,
     validate_payload_v2,
     get_dates_from_id,
+    get_timestamps_from_ids,
+    get_dates_from_ids,
+    get_id_range_from_dates,
 )
+from twitwi.constants import PRE_SNOWFLAKE_LAST_TWEET_ID
 
 GET_DATES_TESTS = [
     (
@@ -26,6 +49,24 @@ GET_DATES_TESTS = [
     ),
 ]
 
+FAST_PATH_DATES_TESTS = [
+    ("Thu Feb 07 06:43:33 +0000 2013", "v1"),
+    ("Thu Feb 7 06:43:33 +0000 2013", "v1"),
+    ("2021-04-15T12:03:42.000Z", "v2"),
+    ("2021-04-15T12:03:42.000Z", "iframe"),
+    ("2025-03-31T13:55:10.752895Z", "bluesky"),
+    ("2025-03-14T08:31:07Z", "bluesky"),
+    ("2025-06-03T08:09:12.057943+00:00", "bluesky"),
+    ("2025-05-02T13:08:32-04:00", "bluesky"),
+    ("2024-12-11T00:00:06+08:00", "bluesky"),
+    ("1969-12-31T23:59:59.5Z", "bluesky"),
+    ("0000-05-12T10:00:00.000Z", "bluesky"),
+    ("0023-05-12T10:00:00Z", "bluesky"),
+    ("Thu Feb 07 06:43:33.123 +0000 2013", "bluesky"),
+]
+
+FAKE_COLLECTION_TIME = "2025-01-01T00:00:00.000000"
+
 GET_TIMESTAMP_TESTS = [
     (1479161354066051075, 1641494522),
     (1503824656331165704, 1647374712),
@@ -76,6 +117,23 @@ class TestUtils(object):
 
         assert timestamp == 1360219413123
 
+    def test_parse_dates(self):
+        locales = [None, timezone("Europe/Paris"), timezone("America/Toronto")]
+
+        for date_str, source in FAST_PATH_DATES_TESTS:
+            for tz in locales:
+                for millisecond_timestamp in [False, True]:
+                    args = (date_str, tz, source, millisecond_timestamp)
+
+                    assert parse_dates(*args) == fallback_get_dates(*args), args
+                    assert get_dates(*args) == fallback_get_dates(*args), args
+
+        with pytest.raises(ValueError):
+            get_dates("2021-04-15T12:03:42Z", source="v2")
+
+        with pytest.raises(ValueError):
+            get_dates("Thu Feb 30 06:43:33 +0000 2013")
+
     def test_validate_payload_v2(self):
         assert not validate_payload_v2("hello")
         assert not validate_payload_v2([1, 2, 3])
@@ -92,3 +150,236 @@ class TestUtils(object):
                 tz = timezone(tz)
 
             assert get_dates_from_id(tweet_id, tz) == result
+
+    def test_get_timestamps_from_ids(self):
+        ids = [tweet_id for tweet_id, _ in GET_TIMESTAMP_TESTS]
+        ids.append(PRE_SNOWFLAKE_LAST_TWEET_ID)
+
+        expected = [timestamp for _, timestamp in GET_TIMESTAMP_TESTS] + [None]
+
+        assert get_timestamps_from_ids(ids) == expected
+        assert get_timestamps_from_ids(str(tweet_id) for tweet_id in ids) == expected
+
+        np = pytest.importorskip("numpy")
+
+        timestamps = get_timestamps_from_ids(np.array(ids, dtype=np.int64))
+
+        assert timestamps.dtype == np.int64
+        assert timestamps.tolist() == expected
+
+    def test_get_dates_from_ids(self):
+        for (tweet_id, tz), result in GET_DATES_ID_TESTS:
+            if tz:
+                tz = timezone(tz)
+
+            timestamps, dates = get_dates_from_ids(
+                [tweet_id, PRE_SNOWFLAKE_LAST_TWEET_ID], tz
+            )
+
+            assert timestamps == [result[0], None]
+            assert dates == [result[1], None]
+
+        np = pytest.importorskip("numpy")
+
+        for (tweet_id, tz), result in GET_DATES_ID_TESTS:
+            if tz:
+                tz = timezone(tz)
+
+            timestamps, dates = get_dates_from_ids(
+                np.array([tweet_id, PRE_SNOWFLAKE_LAST_TWEET_ID]), tz
+            )
+
+            assert timestamps.tolist() == [result[0], None]
+            assert dates.tolist() == [result[1], None]
+
+    def test_get_id_range_from_dates(self):
+        start = datetime(2021, 9, 1, 5, 21, 21)
+        end = datetime(2021, 9, 4, 1, 8, 48, 999000)
+
+        min_id, max_id = get_id_range_from_dates(start, end)
+
+        for (tweet_id, _), (timestamp, _) in GET_DATES_ID_TESTS:
+            assert (min_id <= tweet_id <= max_id) == (
+                start.timestamp() <= timestamp <= end.timestamp()
+            )
+
+        assert get_timestamp_from_id(min_id) == 1630473681
+        assert get_timestamp_from_id(min_id - 1) == 1630473680
+        assert get_timestamp_from_id(max_id) == 1630717728
+        assert get_timestamp_from_id(max_id + 1) == 1630717729
+
+        assert get_id_range_from_dates(1630473681, 1630473681.5) == (
+            get_id_range_from_dates(start, datetime(2021, 9, 1, 5, 21, 21, 500000))
+        )
+
+        min_id, max_id = get_id_range_from_dates(
+            datetime(2006, 3, 21), datetime(2010, 11, 4, 1, 44)
+        )
+
+        assert min_id == PRE_SNOWFLAKE_LAST_TWEET_ID + 1
+        assert get_timestamp_from_id(max_id) == 1288835040
+
+        min_id, max_id = get_id_range_from_dates(
+            datetime(2006, 3, 21), datetime(2007, 3, 21)
+        )
+
+        assert min_id > max_id
+
+        with pytest.raises(ValueError):
+            get_id_range_from_dates(end, start)
+
+    def test_collection_clock(self):
+        tweet = get_json_resource("normalization.json")[0]["source"]
+        post = get_json_resource("bluesky-posts.json")[0]
+
+        with collection_clock(FAKE_COLLECTION_TIME):
+            assert get_collection_time() == FAKE_COLLECTION_TIME
+
+            for t in normalize_tweet(tweet, extract_referenced_tweets=True):
+                assert t["collection_time"] == FAKE_COLLECTION_TIME
+
+            for p in normalize_post(post, extract_referenced_posts=True):
+                assert p["collection_time"] == FAKE_COLLECTION_TIME
+
+        assert get_collection_time() != FAKE_COLLECTION_TIME
+
+        with collection_clock(FixedCollectionClock(datetime(2025, 1, 1))):
+            assert get_collection_time() == FAKE_COLLECTION_TIME
+
+        with collection_clock(BatchCollectionClock()) as clock:
+            first = get_collection_time()
+            assert first == get_collection_time()
+
+            assert clock.stamp() == get_collection_time()
+
+        with collection_clock(TickCollectionClock(resolution=3600)):
+            value = get_collection_time()
+
+            assert value.endswith(".000000")
+            assert value == get_collection_time()
+
+        with pytest.raises(ValueError):
+            TickCollectionClock(resolution=0)
+
+    def test_collection_clock_threads(self):
+        entered = Barrier(3)
+        checked = Barrier(3)
+        a_exited = Event()
+        seen = {}
+
+        def run(value, wait_for=None):
+            with collection_clock(FixedCollectionClock(value)):
+                entered.wait()
+                seen[value] = get_collection_time()
+                checked.wait()
+
+                if wait_for is not None:
+                    wait_for.wait()
+
+            if wait_for is None:
+                a_exited.set()
+
+            seen[value + "_after"] = get_collection_time()
+
+        # NOTE: blocks overlap and do not exit in the order they were entered
+        threads = [
+            Thread(target=run, args=("A",)),
+            Thread(target=run, args=("B", a_exited)),
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        entered.wait()
+        main_value = get_collection_time()
+        checked.wait()
+
+        for thread in threads:
+            thread.join()
+
+        assert seen["A"] == "A"
+        assert seen["B"] == "B"
+        assert main_value not in ("A", "B")
+        assert seen["A_after"] not in ("A", "B")
+        assert seen["B_after"] not in ("A", "B")
+        assert get_collection_time() not in ("A", "B")
+
+        # The process-wide default clock is used by every thread
+        previous_clock = set_collection_clock(FAKE_COLLECTION_TIME)
+
+        try:
+            thread = Thread(target=lambda: seen.update(default=get_collection_time()))
+            thread.start()
+            thread.join()
+
+            assert seen["default"] == FAKE_COLLECTION_TIME
+
+            with collection_clock("A"):
+                assert get_collection_time() == "A"
+
+            assert get_collection_time() == FAKE_COLLECTION_TIME
+        finally:
+            set_collection_clock(previous_clock)
+
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+
+        cache["one"] = 1
+        cache["two"] = 2
+
+        assert cache.get("one") == 1
+        assert cache.get("three") is None
+
+        cache["three"] = 3
+
+        assert "two" not in cache
+        assert list(cache) == ["one", "three"]
+
+        with pytest.raises(KeyError):
+            cache["two"]
+
+        assert cache.stats() == {
+            "size": 2,
+            "maxsize": 2,
+            "hits": 1,
+            "misses": 2,
+            "evictions": 1,
+        }
+
+        cache.resize(1)
+
+        assert list(cache) == ["three"]
+        assert cache.evictions == 2
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["evictions"] == 0
+
+        cache.resize(2)
+        cache["one"] = 1
+        cache.update({"two": 2, "one": 1.0, "three": 3})
+
+        assert list(cache) == ["one", "three"]
+        assert cache["one"] == 1.0
+        assert cache.evictions == 1
+
+    def test_url_cache(self):
+        clear_url_cache()
+
+        url = "https://www.lemonde.fr/path?utm_source=twitter#hash"
+
+        for _ in range(3):
+            assert custom_normalize_url(url) == "https://www.lemonde.fr/path#hash"
+            assert safe_normalize_url(url) == "https://www.lemonde.fr/path#hash"
+            assert custom_get_normalized_hostname(url) == "lemonde.fr"
+            assert is_url(url)
+
+        assert not is_url("not an url")
+        assert not is_url("not an url")
+
+        stats = get_url_cache_stats()
+
+        assert stats["size"] == 5
+        assert stats["misses"] == 5
+        assert stats["hits"] == 9
@@ -0,0 +1,111 @@
+# =============================================================================
+# Twitwi Writers Unit Tests
+# =============================================================================
+import io
+import csv
+import gzip
+import pytest
+from test.utils import get_json_resource, open_resource
+
+from twitwi.constants import TWEET_FIELDS, TWEET_FIELDS_TCAT, USER_FIELDS
+from twitwi.formatters import format_tweet_as_csv_row, format_tweet_as_tcat_row
+from twitwi.normalizers import normalize_tweet
+from twitwi.writers import TweetCSVWriter, TweetTCATWriter, UserCSVWriter
+
+
+class TestWriters(object):
+    def test_tweet_csv_writer(self, tmp_path):
+        tweets = [
+            normalize_tweet(test["source"], collection_source="api")
+            for test in get_json_resource("normalization.json")
+        ]
+
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(TWEET_FIELDS)
+
+        for tweet in tweets:
+            writer.writerow(format_tweet_as_csv_row(tweet))
+
+        expected = expected.getvalue()
+
+        # Single rows & batches, with a buffer smaller than a row
+        for buffer_size in [1, 1024 * 1024]:
+            path = tmp_path / "tweets.csv"
+
+            with TweetCSVWriter(str(path), buffer_size=buffer_size) as writer:
+                writer.writerow(tweets[0])
+                writer.writerows(tweets[1:])
+
+            with open(path, "rb") as f:
+                data = f.read()
+
+            assert data.decode("utf-8") == expected
+            assert writer.rows_written == len(tweets)
+            assert writer.bytes_written == len(data)
+
+        # Compressed output
+        path = tmp_path / "tweets.csv.gz"
+
+        with TweetCSVWriter(str(path)) as writer:
+            writer.writerows(iter(tweets))
+
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            assert f.read() == expected
+
+        # File objects are left open
+        output = io.StringIO()
+
+        with TweetCSVWriter(output, write_header=False) as writer:
+            writer.writerow(tweets[0], item_id="1")
+
+        assert not output.closed
+        assert next(csv.reader(io.StringIO(output.getvalue())))[0] == "1"
+
+        output = io.BytesIO()
+
+        with TweetCSVWriter(output, compress=True) as writer:
+            writer.writerows(tweets)
+
+        assert gzip.decompress(output.getvalue()).decode("utf-8") == expected
+
+        with pytest.raises(TypeError):
+            TweetCSVWriter(io.StringIO(), compress=True)
+
+    def test_user_csv_writer(self):
+        output = io.StringIO()
+
+        with UserCSVWriter(output) as writer:
+            writer.writerows(get_json_resource("normalized-users.json"))
+
+        with open_resource("user-export.csv") as f:
+            output.seek(0)
+            assert list(csv.reader(output)) == list(csv.reader(f))
+
+        assert writer.rows_written == len(get_json_resource("normalized-users.json"))
+        assert list(csv.reader(io.StringIO(output.getvalue())))[0] == USER_FIELDS
+
+    def test_tweet_tcat_writer(self):
+        tweets = [
+            normalize_tweet(test["source"], collection_source="api")
+            for test in get_json_resource("normalization.json")
+        ]
+
+        for delimiter in [",", "\t"]:
+            output = io.StringIO()
+
+            with TweetTCATWriter(output, delimiter=delimiter) as writer:
+                writer.writerows(tweet for tweet in tweets)
+
+            output.seek(0)
+            rows = list(csv.reader(output, delimiter=delimiter))
+
+            assert rows[0] == TWEET_FIELDS_TCAT
+            assert rows[1:] == [
+                [
+                    "" if value is None else str(value)
+                    for value in format_tweet_as_tcat_row(tweet)
+                ]
+                for tweet in tweets
+            ]
+            assert writer.rows_written == len(tweets)
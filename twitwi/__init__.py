@@ -2,13 +2,22 @@
 # Twitwi Library Endpoint
 # =============================================================================
 #
-from twitwi.anonymizers import anonymize_normalized_tweet
+from twitwi.anonymizers import (
+    anonymize_normalized_tweet,
+    Pseudonymizer,
+    iter_pseudonymized,
+)
 from twitwi.formatters import (
     transform_tweet_into_csv_dict,
     format_tweet_as_csv_row,
+    format_tweet_as_csv_dict,
+    format_tweets_as_csv_dicts,
     transform_user_into_csv_dict,
     format_user_as_csv_row,
+    format_user_as_csv_dict,
+    format_users_as_csv_dicts,
     apply_tcat_format,
+    format_tweet_as_tcat_row,
 )
 
 # NOTE: should we drop this from public exports?
@@ -17,25 +26,68 @@ from twitwi.utils import (
     custom_normalize_url,
     get_timestamp_from_id,
     get_dates_from_id,
+    get_timestamps_from_ids,
+    get_dates_from_ids,
+    get_id_range_from_dates,
+    collection_clock,
 )
+from twitwi.stats import collect_stats
+from twitwi.lazy import LazyNormalizedTweet
 from twitwi.normalizers import (
     normalize_tweet,
+    normalize_tweets,
     normalize_user,
     normalize_tweets_payload_v2,
+    PayloadV2Normalizer,
+    extract_hashtags_and_mentions_from_text,
+)
+from twitwi.writers import TweetCSVWriter, TweetTCATWriter, UserCSVWriter
+from twitwi.readers import (
+    iter_normalized_tweets,
+    iter_normalized_tweets_payloads_v2,
+    iter_normalized_users,
+    iter_normalized_large_payload_v2,
+    iter_tweets_from_csv,
+    iter_users_from_csv,
 )
 
 __all__ = [
     "anonymize_normalized_tweet",
+    "Pseudonymizer",
+    "iter_pseudonymized",
     "transform_tweet_into_csv_dict",
     "format_tweet_as_csv_row",
+    "format_tweet_as_csv_dict",
+    "format_tweets_as_csv_dicts",
     "transform_user_into_csv_dict",
     "format_user_as_csv_row",
+    "format_user_as_csv_dict",
+    "format_users_as_csv_dicts",
     "apply_tcat_format",
+    "format_tweet_as_tcat_row",
     "get_dates",
     "custom_normalize_url",
     "get_timestamp_from_id",
     "get_dates_from_id",
+    "get_timestamps_from_ids",
+    "get_dates_from_ids",
+    "get_id_range_from_dates",
+    "collection_clock",
+    "collect_stats",
+    "LazyNormalizedTweet",
     "normalize_tweet",
+    "normalize_tweets",
     "normalize_user",
     "normalize_tweets_payload_v2",
+    "PayloadV2Normalizer",
+    "extract_hashtags_and_mentions_from_text",
+    "iter_normalized_tweets",
+    "iter_normalized_tweets_payloads_v2",
+    "iter_normalized_users",
+    "iter_normalized_large_payload_v2",
+    "iter_tweets_from_csv",
+    "iter_users_from_csv",
+    "TweetCSVWriter",
+    "TweetTCATWriter",
+    "UserCSVWriter",
 ]
@@ -1,4 +1,11 @@
 import re
+import hmac
+import hashlib
+from functools import partial
+
+from twitwi.constants import PSEUDONYM_CACHE_SIZE
+from twitwi.lazy import LazyNormalizedTweet
+from twitwi.utils import LRUCache
 
 QUOTED_REDACT_RE = re.compile(r"«\s+[^»]+:\s+([^»]+)\s+»")
 
@@ -63,3 +70,395 @@ def anonymize_normalized_tweet(normalized_tweet) -> None:
     for field in FIELDS_TO_DELETE:
         if field in normalized_tweet:
             del normalized_tweet[field]
+
+
+# Pseudonymization of identifiers, replaced by HMAC-keyed pseudonyms so that
+# the same account, or post, always gets the same pseudonym for a given key
+# and the interaction graph can still be studied.
+TWITTER_URL_RE = re.compile(
+    r"(https?://(?:(?:www|mobile)\.)?(?:twitter|x)\.com/)(\w+)"
+    r"(?:(/(?:web/)?status(?:es)?/)(\d+))?",
+    re.I,
+)
+TWITTER_RESERVED_PATHS = {
+    "account",
+    "explore",
+    "hashtag",
+    "home",
+    "i",
+    "intent",
+    "login",
+    "messages",
+    "notifications",
+    "privacy",
+    "search",
+    "settings",
+    "share",
+    "signup",
+    "tos",
+}
+
+# NOTE: profiles & at:// uris can refer to accounts by handle or by DID,
+# bare DIDs being also found in the urls of Bluesky's cdn, e.g. for media
+BLUESKY_ACCOUNT_URL_RE = re.compile(
+    r"(https?://(?:[\w-]+\.)*(?:bsky|atsky)\.app/(?:profile|starter-pack)/|at://)"
+    r"([^/\s?#]+)"
+)
+DID_RE = re.compile(r"(?<![\w:])did:[a-z]+:[A-Za-z0-9._:%-]*[A-Za-z0-9]")
+
+BLUESKY_HANDLE_PATTERN = r"[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?(?:\.[A-Za-z0-9-]+)+"
+BLUESKY_HANDLE_RE = re.compile(BLUESKY_HANDLE_PATTERN)
+INVALID_BLUESKY_HANDLE = "handle.invalid"
+
+TWITTER_MENTION_RE = re.compile(r"(?<![\w@])@(\w+)")
+BLUESKY_MENTION_RE = re.compile(r"(?<![\w@])@(%s)" % BLUESKY_HANDLE_PATTERN)
+
+# Fields are either pseudonymized, as a single identifier or a list of them
+# in a given namespace, have their urls & mentions pseudonymized, or deleted
+TWEET_PSEUDONYMIZATION_PLAN = {
+    "id": ("pseudonym", "tweet"),
+    "to_tweetid": ("pseudonym", "tweet"),
+    "retweeted_id": ("pseudonym", "tweet"),
+    "quoted_id": ("pseudonym", "tweet"),
+    "user_id": ("pseudonym", "user"),
+    "to_userid": ("pseudonym", "user"),
+    "retweeted_user_id": ("pseudonym", "user"),
+    "quoted_user_id": ("pseudonym", "user"),
+    "mentioned_ids": ("pseudonyms", "user"),
+    "user_screen_name": ("pseudonym", "screen_name"),
+    "to_username": ("pseudonym", "screen_name"),
+    "retweeted_user": ("pseudonym", "screen_name"),
+    "quoted_user": ("pseudonym", "screen_name"),
+    "mentioned_names": ("pseudonyms", "screen_name"),
+    "text": ("text", None),
+    "url": ("text", None),
+    "links": ("texts", None),
+    "proper_links": ("texts", None),
+    "lat": ("delete", None),
+    "lng": ("delete", None),
+    "place_coordinates": ("delete", None),
+    "place_country_code": ("delete", None),
+    "place_name": ("delete", None),
+    "place_type": ("delete", None),
+    "user_location": ("delete", None),
+    "user_created_at": ("delete", None),
+    "user_description": ("delete", None),
+    "user_image": ("delete", None),
+    "user_name": ("delete", None),
+    "user_timestamp_utc": ("delete", None),
+    "user_url": ("delete", None),
+    "user_verified": ("delete", None),
+    "retweeted_timestamp_utc": ("delete", None),
+    "quoted_timestamp_utc": ("delete", None),
+    "media_files": ("delete", None),
+}
+
+POST_PSEUDONYMIZATION_PLAN = {
+    "uri": ("text", None),
+    "to_post_uri": ("text", None),
+    "to_root_post_uri": ("text", None),
+    "quoted_uri": ("text", None),
+    "hidden_replies_uris": ("texts", None),
+    "url": ("text", None),
+    "to_post_url": ("text", None),
+    "to_root_post_url": ("text", None),
+    "quoted_url": ("text", None),
+    "user_url": ("text", None),
+    "links": ("texts", None),
+    "card_link": ("text", None),
+    "card_title": ("text", None),
+    "card_description": ("text", None),
+    "card_thumbnail": ("text", None),
+    "media_urls": ("texts", None),
+    "media_thumbnails": ("texts", None),
+    "media_alt_texts": ("texts", None),
+    "replies_rules": ("texts", None),
+    "user_did": ("pseudonym", "did"),
+    "to_user_did": ("pseudonym", "did"),
+    "to_root_user_did": ("pseudonym", "did"),
+    "repost_by_user_did": ("pseudonym", "did"),
+    "quoted_user_did": ("pseudonym", "did"),
+    "mentioned_user_dids": ("pseudonyms", "did"),
+    "user_handle": ("pseudonym", "handle"),
+    "repost_by_user_handle": ("pseudonym", "handle"),
+    "quoted_user_handle": ("pseudonym", "handle"),
+    "mentioned_user_handles": ("pseudonyms", "handle"),
+    "text": ("text", None),
+    "original_text": ("text", None),
+    "user_display_name": ("delete", None),
+    "user_avatar": ("delete", None),
+    "user_created_at": ("delete", None),
+    "user_timestamp_utc": ("delete", None),
+    "bridgy_original_url": ("delete", None),
+}
+
+# NOTE: partial posts only lack some of the fields of posts
+PSEUDONYMIZATION_PLANS = {
+    "tweet": TWEET_PSEUDONYMIZATION_PLAN,
+    "post": POST_PSEUDONYMIZATION_PLAN,
+    "partial_post": POST_PSEUDONYMIZATION_PLAN,
+}
+
+
+class Pseudonymizer(object):
+    """
+    Anonymizer of normalized tweets or Bluesky posts, replacing the
+    identifiers of accounts (ids, screen names, DIDs & handles, including
+    mentions and the ones found in urls & texts) and of tweets by pseudonyms
+    computed using HMAC-SHA256 with a secret key, and deleting the other
+    fields identifying their authors. The field plan of the schema is
+    compiled once, and pseudonyms are memoized in a bounded cache since the
+    same accounts are found again and again.
+
+    Args:
+        key (str or bytes): secret key of the HMAC. The same key always
+            gives the same pseudonyms.
+        schema (str, optional): one of "tweet", "post" or "partial_post".
+            Defaults to "tweet".
+        length (int, optional): number of hexadecimal characters of the
+            pseudonyms. Defaults to 16.
+        delete (iterable, optional): names of other fields to delete.
+        cache_size (int, optional): maximum number of pseudonyms memoized.
+            Defaults to `PSEUDONYM_CACHE_SIZE`.
+
+    Attributes:
+        cache (LRUCache): memoized pseudonyms.
+
+    """
+
+    def __init__(
+        self,
+        key,
+        schema: str = "tweet",
+        length: int = 16,
+        delete=None,
+        cache_size: int = PSEUDONYM_CACHE_SIZE,
+    ):
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+
+        if not isinstance(key, bytes):
+            raise TypeError("key should be a str or bytes")
+
+        if not key:
+            raise ValueError("key should not be empty")
+
+        if schema not in PSEUDONYMIZATION_PLANS:
+            raise ValueError(
+                "schema should be one of %s" % ", ".join(PSEUDONYMIZATION_PLANS)
+            )
+
+        if not 1 <= length <= 64:
+            raise ValueError("length should be between 1 and 64")
+
+        self.key = key
+        self.schema = schema
+        self.length = length
+        self.cache = LRUCache(maxsize=cache_size)
+
+        plan = PSEUDONYMIZATION_PLANS[schema]
+
+        if schema == "tweet":
+            self.mention_pattern = TWITTER_MENTION_RE
+            self.mention_namespace = "screen_name"
+        else:
+            self.mention_pattern = BLUESKY_MENTION_RE
+            self.mention_namespace = "handle"
+
+        self.deleted = [
+            field for field, (action, _) in plan.items() if action == "delete"
+        ]
+
+        if delete is not None:
+            self.deleted.extend(field for field in delete if field not in self.deleted)
+
+        self.transforms = [
+            (field, self.compile_transform(action, namespace))
+            for field, (action, namespace) in plan.items()
+            if action != "delete" and field not in self.deleted
+        ]
+
+        self.identifier_fields = {
+            field
+            for field, (action, _) in plan.items()
+            if action in ("pseudonym", "pseudonyms")
+        }
+
+        # NOTE: handles can be any domain name, the ones of the accounts of
+        # a post are therefore also looked for everywhere else in it
+        self.handle_fields = [
+            (field, action == "pseudonyms")
+            for field, (action, namespace) in plan.items()
+            if namespace == "handle"
+        ]
+
+    def compile_transform(self, action, namespace):
+        if action == "pseudonym":
+            return partial(self.pseudonym, namespace)
+
+        if action == "pseudonyms":
+            pseudonym = self.pseudonym
+
+            return lambda values: [pseudonym(namespace, value) for value in values]
+
+        if action == "text":
+            return self.pseudonymize_text
+
+        pseudonymize_text = self.pseudonymize_text
+
+        return lambda values: [pseudonymize_text(value) for value in values]
+
+    def pseudonym(self, namespace: str, value) -> str:
+        """
+        Method returning the pseudonym of an identifier in the given
+        namespace, "tweet", "user", "screen_name", "did" or "handle". Screen
+        names & handles are case insensitive.
+        """
+        if value is None:
+            return None
+
+        if namespace in ("screen_name", "handle"):
+            value = value.lower()
+
+        cache_key = (namespace, value)
+        pseudonym = self.cache.get(cache_key)
+
+        if pseudonym is None:
+            message = ("%s:%s" % (namespace, value)).encode("utf-8")
+            pseudonym = hmac.new(self.key, message, hashlib.sha256).hexdigest()[
+                : self.length
+            ]
+            self.cache[cache_key] = pseudonym
+
+        return pseudonym
+
+    def pseudonymize_text(self, text):
+        """
+        Method replacing the accounts & tweets found in the Twitter urls of a
+        text, or the handles & DIDs found in its Bluesky urls, at:// uris and
+        elsewhere, as well as its mentions, by their pseudonyms.
+        """
+        if not text:
+            return text
+
+        if self.schema == "tweet":
+            text = TWITTER_URL_RE.sub(self.pseudonymize_twitter_url, text)
+        else:
+            text = BLUESKY_ACCOUNT_URL_RE.sub(self.pseudonymize_bluesky_url, text)
+            text = DID_RE.sub(self.pseudonymize_did, text)
+
+        return self.mention_pattern.sub(self.pseudonymize_mention, text)
+
+    def pseudonymize_twitter_url(self, match):
+        prefix, screen_name, status, tweet_id = match.groups()
+
+        if screen_name.lower() not in TWITTER_RESERVED_PATHS:
+            screen_name = self.pseudonym("screen_name", screen_name)
+
+        if tweet_id is None:
+            return prefix + screen_name
+
+        return prefix + screen_name + status + self.pseudonym("tweet", tweet_id)
+
+    def pseudonymize_bluesky_url(self, match):
+        prefix, account = match.groups()
+
+        # NOTE: DIDs are replaced afterwards, as everywhere else
+        if account.startswith("did:"):
+            return match.group(0)
+
+        return prefix + self.pseudonym("handle", account)
+
+    def pseudonymize_did(self, match):
+        return self.pseudonym("did", match.group(0))
+
+    def pseudonymize_mention(self, match):
+        return "@" + self.pseudonym(self.mention_namespace, match.group(1))
+
+    def anonymize(self, record) -> dict:
+        """
+        Method returning a pseudonymized copy of a normalized record, which
+        is left untouched.
+        """
+        if isinstance(record, LazyNormalizedTweet):
+            result = record.materialize()
+        else:
+            result = dict(record)
+
+        for field in self.deleted:
+            result.pop(field, None)
+
+        if self.schema == "tweet" and result.get("text") is not None:
+            if record.get("retweeted_id") is not None:
+                result["text"] = redact_rt_text(result["text"])
+            elif record.get("quoted_id") is not None:
+                result["text"] = redact_quoted_text(result["text"])
+
+        for field, transform in self.transforms:
+            value = result.get(field)
+
+            if value is not None:
+                result[field] = transform(value)
+
+        if self.handle_fields:
+            self.pseudonymize_known_handles(record, result)
+
+        return result
+
+    def pseudonymize_known_handles(self, record, result) -> None:
+        handles = set()
+
+        for field, plural in self.handle_fields:
+            value = record.get(field)
+
+            if not value:
+                continue
+
+            for handle in value if plural else [value]:
+                if handle and BLUESKY_HANDLE_RE.fullmatch(handle):
+                    handles.add(handle.lower())
+
+        handles.discard(INVALID_BLUESKY_HANDLE)
+
+        if not handles:
+            return
+
+        pattern = re.compile(
+            r"(?<![\w-])(?:%s)(?![\w-])"
+            % "|".join(re.escape(h) for h in sorted(handles, key=len, reverse=True)),
+            re.I,
+        )
+
+        def replace(match):
+            return self.pseudonym("handle", match.group(0))
+
+        for field, value in result.items():
+            if field in self.identifier_fields:
+                continue
+
+            if isinstance(value, str):
+                result[field] = pattern.sub(replace, value)
+
+            elif isinstance(value, list):
+                result[field] = [
+                    pattern.sub(replace, v) if isinstance(v, str) else v for v in value
+                ]
+
+    def anonymize_many(self, records):
+        """
+        Method lazily yielding pseudonymized copies of an iterable of
+        normalized records.
+        """
+        anonymize = self.anonymize
+
+        for record in records:
+            yield anonymize(record)
+
+
+def iter_pseudonymized(records, key, schema: str = "tweet", **kwargs):
+    """
+    Function lazily yielding pseudonymized copies of an iterable of
+    normalized tweets or Bluesky posts. See `Pseudonymizer` for the
+    arguments.
+    """
+    return Pseudonymizer(key, schema=schema, **kwargs).anonymize_many(records)
@@ -7,25 +7,69 @@ from twitwi.bluesky.normalizers import (
 from twitwi.bluesky.formatters import (
     transform_profile_into_csv_dict,
     format_profile_as_csv_row,
+    format_profile_as_csv_dict,
+    format_profiles_as_csv_dicts,
     transform_partial_profile_into_csv_dict,
     format_partial_profile_as_csv_row,
+    format_partial_profile_as_csv_dict,
+    format_partial_profiles_as_csv_dicts,
     transform_post_into_csv_dict,
     format_post_as_csv_row,
+    format_post_as_csv_dict,
+    format_posts_as_csv_dicts,
     transform_partial_post_into_csv_dict,
     format_partial_post_as_csv_row,
+    format_partial_post_as_csv_dict,
+    format_partial_posts_as_csv_dicts,
+)
+from twitwi.bluesky.readers import (
+    iter_normalized_profiles,
+    iter_normalized_partial_profiles,
+    iter_normalized_posts,
+    iter_normalized_partial_posts,
+    iter_posts_from_csv,
+    iter_partial_posts_from_csv,
+    iter_profiles_from_csv,
+    iter_partial_profiles_from_csv,
+)
+from twitwi.bluesky.writers import (
+    PostCSVWriter,
+    PartialPostCSVWriter,
+    ProfileCSVWriter,
+    PartialProfileCSVWriter,
 )
 
 __all__ = [
     "transform_profile_into_csv_dict",
     "format_profile_as_csv_row",
+    "format_profile_as_csv_dict",
+    "format_profiles_as_csv_dicts",
     "transform_partial_profile_into_csv_dict",
     "format_partial_profile_as_csv_row",
+    "format_partial_profile_as_csv_dict",
+    "format_partial_profiles_as_csv_dicts",
     "transform_post_into_csv_dict",
     "format_post_as_csv_row",
+    "format_post_as_csv_dict",
+    "format_posts_as_csv_dicts",
     "transform_partial_post_into_csv_dict",
     "format_partial_post_as_csv_row",
+    "format_partial_post_as_csv_dict",
+    "format_partial_posts_as_csv_dicts",
     "normalize_profile",
     "normalize_partial_profile",
     "normalize_post",
     "normalize_partial_post",
+    "iter_normalized_profiles",
+    "iter_normalized_partial_profiles",
+    "iter_normalized_posts",
+    "iter_normalized_partial_posts",
+    "iter_posts_from_csv",
+    "iter_partial_posts_from_csv",
+    "iter_profiles_from_csv",
+    "iter_partial_profiles_from_csv",
+    "PostCSVWriter",
+    "PartialPostCSVWriter",
+    "ProfileCSVWriter",
+    "PartialProfileCSVWriter",
 ]
@@ -9,8 +9,20 @@ from twitwi.bluesky.types import (
 
 PROFILE_FIELDS = list(BlueskyProfile.__annotations__.keys())
 
+PROFILE_INTEGER_FIELDS = [
+    k
+    for k, v in BlueskyProfile.__annotations__.items()
+    if v is int or v == Optional[int]
+]
+
 PARTIAL_PROFILE_FIELDS = list(BlueskyPartialProfile.__annotations__.keys())
 
+PARTIAL_PROFILE_INTEGER_FIELDS = [
+    k
+    for k, v in BlueskyPartialProfile.__annotations__.items()
+    if v is int or v == Optional[int]
+]
+
 POST_FIELDS = list(BlueskyPost.__annotations__.keys())
 
 POST_PLURAL_FIELDS = [
@@ -25,6 +37,10 @@ POST_BOOLEAN_FIELDS = [
     if v is bool or v == Optional[bool]
 ]
 
+POST_INTEGER_FIELDS = [
+    k for k, v in BlueskyPost.__annotations__.items() if v is int or v == Optional[int]
+]
+
 PARTIAL_POST_FIELDS = list(BlueskyPartialPost.__annotations__.keys())
 
 PARTIAL_POST_PLURAL_FIELDS = [
@@ -38,3 +54,9 @@ PARTIAL_POST_BOOLEAN_FIELDS = [
     for k, v in BlueskyPartialPost.__annotations__.items()
     if v is bool or v == Optional[bool]
 ]
+
+PARTIAL_POST_INTEGER_FIELDS = [
+    k
+    for k, v in BlueskyPartialPost.__annotations__.items()
+    if v is int or v == Optional[int]
+]
@@ -1,4 +1,9 @@
-from twitwi.formatters import make_transform_into_csv_dict, make_format_as_csv_row
+from twitwi.formatters import (
+    make_transform_into_csv_dict,
+    make_format_as_csv_row,
+    make_format_as_csv_dict,
+    make_format_as_csv_dicts,
+)
 from twitwi.bluesky.constants import (
     PROFILE_FIELDS,
     PARTIAL_PROFILE_FIELDS,
@@ -19,6 +24,12 @@ format_post_as_csv_row = make_format_as_csv_row(
     POST_FIELDS, POST_PLURAL_FIELDS, POST_BOOLEAN_FIELDS
 )
 
+format_post_as_csv_dict = make_format_as_csv_dict(
+    POST_PLURAL_FIELDS, POST_BOOLEAN_FIELDS
+)
+
+format_posts_as_csv_dicts = make_format_as_csv_dicts(format_post_as_csv_dict)
+
 
 transform_partial_post_into_csv_dict = make_transform_into_csv_dict(
     PARTIAL_POST_PLURAL_FIELDS, PARTIAL_POST_BOOLEAN_FIELDS
@@ -28,25 +39,51 @@ format_partial_post_as_csv_row = make_format_as_csv_row(
     PARTIAL_POST_FIELDS, PARTIAL_POST_PLURAL_FIELDS, PARTIAL_POST_BOOLEAN_FIELDS
 )
 
+format_partial_post_as_csv_dict = make_format_as_csv_dict(
+    PARTIAL_POST_PLURAL_FIELDS, PARTIAL_POST_BOOLEAN_FIELDS
+)
+
+format_partial_posts_as_csv_dicts = make_format_as_csv_dicts(
+    format_partial_post_as_csv_dict
+)
+
 
 transform_profile_into_csv_dict = make_transform_into_csv_dict([], [])
 
 format_profile_as_csv_row = make_format_as_csv_row(PROFILE_FIELDS, [], [])
 
+format_profile_as_csv_dict = make_format_as_csv_dict([], [])
+
+format_profiles_as_csv_dicts = make_format_as_csv_dicts(format_profile_as_csv_dict)
+
 transform_partial_profile_into_csv_dict = make_transform_into_csv_dict([], [])
 
 format_partial_profile_as_csv_row = make_format_as_csv_row(
     PARTIAL_PROFILE_FIELDS, [], []
 )
 
+format_partial_profile_as_csv_dict = make_format_as_csv_dict([], [])
+
+format_partial_profiles_as_csv_dicts = make_format_as_csv_dicts(
+    format_partial_profile_as_csv_dict
+)
+
 
 __all__ = [
     "transform_post_into_csv_dict",
     "format_post_as_csv_row",
+    "format_post_as_csv_dict",
+    "format_posts_as_csv_dicts",
     "transform_partial_post_into_csv_dict",
     "format_partial_post_as_csv_row",
+    "format_partial_post_as_csv_dict",
+    "format_partial_posts_as_csv_dicts",
     "transform_profile_into_csv_dict",
     "format_profile_as_csv_row",
+    "format_profile_as_csv_dict",
+    "format_profiles_as_csv_dicts",
     "transform_partial_profile_into_csv_dict",
     "format_partial_profile_as_csv_row",
+    "format_partial_profile_as_csv_dict",
+    "format_partial_profiles_as_csv_dicts",
 ]
@@ -1,14 +1,16 @@
 from copy import deepcopy
 from typing import List, Dict, Union, Optional, Literal, Any, overload, Tuple, Set
 
-from ural import is_url
+from ural import is_url as ural_is_url
 
 from twitwi.exceptions import BlueskyPayloadError
+from twitwi.stats import NULL_STATS, NormalizationStats, resolve_stats
 from twitwi.utils import (
     get_collection_time,
     get_dates,
     safe_normalize_url,
     custom_get_normalized_hostname,
+    is_url,
 )
 from twitwi.bluesky.utils import (
     validate_post_payload,
@@ -476,9 +478,10 @@ def process_post_facets(
                     else:
                         # we're looking for a link which could be valid if we add "https://" at the beginning,
                         # as in some cases the "http(s)://" part is missing in the post text
+                        # NOTE: candidates are not cached as they are unlikely to repeat
                         for starting in range(byteEnd - byteStart):
                             try:
-                                if is_url(
+                                if ural_is_url(
                                     "https://"
                                     + text[
                                         byteStart + starting : byteEnd + starting
@@ -649,6 +652,7 @@ def process_links_from_card(
     extract_referenced_posts: bool = False,
     referenced_posts: Dict = {},
     data: Dict = {},
+    stats=NULL_STATS,
 ) -> str:
     media_ids = set()
     embed = record["embed"]
@@ -884,16 +888,19 @@ def process_links_from_card(
             quoted_data["embed"] = quoted_data["embeds"][0]
             del quoted_data["embeds"]
 
-        nested = normalize_post(
-            quoted_data,
-            locale=locale,
-            extract_referenced_posts=True,
-            collection_source="quote",
-        )
+        with stats.stage("quote"):
+            nested = normalize_post(
+                quoted_data,
+                locale=locale,
+                extract_referenced_posts=True,
+                collection_source="quote",
+                stats=stats,
+            )
         quoted = nested[-1]
         if extract_referenced_posts:
             # Warning: mutates referenced_posts
-            merge_nested_posts(referenced_posts, nested, post["url"])
+            with stats.stage("merge_nested_posts"):
+                merge_nested_posts(referenced_posts, nested, post["url"])
 
         # Take better quoted url with user_handle
         post["quoted_url"] = quoted["url"]
@@ -960,29 +967,36 @@ def process_thread_posts_from_feed(
     locale: Optional[Any],
     extract_referenced_posts: bool,
     referenced_posts: Dict,
+    stats=NULL_STATS,
 ):
     if "parent" in reply_data:
-        nested = normalize_post(
-            reply_data["parent"],
-            locale=locale,
-            extract_referenced_posts=extract_referenced_posts,
-            collection_source="thread",
-        )
+        with stats.stage("thread"):
+            nested = normalize_post(
+                reply_data["parent"],
+                locale=locale,
+                extract_referenced_posts=extract_referenced_posts,
+                collection_source="thread",
+                stats=stats,
+            )
         # Warning: mutates referenced_posts
-        merge_nested_posts(referenced_posts, nested, post["url"])
+        with stats.stage("merge_nested_posts"):
+            merge_nested_posts(referenced_posts, nested, post["url"])
 
     if "root" in reply_data and (
         "parent" not in reply_data
         or reply_data["parent"]["cid"] != reply_data["root"]["cid"]
     ):
-        nested = normalize_post(
-            reply_data["root"],
-            locale=locale,
-            extract_referenced_posts=extract_referenced_posts,
-            collection_source="thread",
-        )
+        with stats.stage("thread"):
+            nested = normalize_post(
+                reply_data["root"],
+                locale=locale,
+                extract_referenced_posts=extract_referenced_posts,
+                collection_source="thread",
+                stats=stats,
+            )
         # Warning: mutates referenced_posts
-        merge_nested_posts(referenced_posts, nested, post["url"])
+        with stats.stage("merge_nested_posts"):
+            merge_nested_posts(referenced_posts, nested, post["url"])
 
     if "grandparentAuthor" in reply_data:
         # TODO ? Shall we do anything from that?
@@ -991,7 +1005,7 @@ def process_thread_posts_from_feed(
 
 # Warning: mutates post
 def handle_text_and_datetime_fields(
-    data: Dict, post: Dict, locale: Optional[Any] = None
+    data: Dict, post: Dict, locale: Optional[Any] = None, stats=NULL_STATS
 ) -> str:
     # Store original text and prepare text for quotes & medias enriched version
     post["original_text"] = data["record"]["text"]
@@ -999,9 +1013,10 @@ def handle_text_and_datetime_fields(
 
     # Handle datetime fields
     post["collection_time"] = get_collection_time()
-    post["timestamp_utc"], post["local_time"] = get_dates(
-        data["record"]["createdAt"], locale=locale, source="bluesky"
-    )
+    with stats.stage("get_dates"):
+        post["timestamp_utc"], post["local_time"] = get_dates(
+            data["record"]["createdAt"], locale=locale, source="bluesky"
+        )
     # Completing year with less than 4 digits as in some posts: https://bsky.app/profile/koro.icu/post/3kbpuogc6fz2o
     # len 26 example: '2023-06-15T12:34:56.789000'
     while len(post["local_time"]) < 26 and len(post["local_time"].split("-")[0]) < 4:
@@ -1016,6 +1031,7 @@ def normalize_post(
     locale: Optional[str] = ...,
     extract_referenced_posts: Literal[True] = ...,
     collection_source: Optional[str] = ...,
+    stats: Optional[NormalizationStats] = ...,
 ) -> List[BlueskyPost]: ...
 
 
@@ -1025,6 +1041,7 @@ def normalize_post(
     locale: Optional[str] = ...,
     extract_referenced_posts: Literal[False] = ...,
     collection_source: Optional[str] = ...,
+    stats: Optional[NormalizationStats] = ...,
 ) -> BlueskyPost: ...
 
 
@@ -1033,6 +1050,7 @@ def normalize_post(
     locale: Optional[Any] = None,
     extract_referenced_posts: bool = False,
     collection_source: Optional[str] = None,
+    stats: Optional[NormalizationStats] = None,
 ) -> Union[BlueskyPost, List[BlueskyPost]]:
     """
     Function "normalizing" a post as returned by Bluesky's API in order to
@@ -1049,6 +1067,9 @@ def normalize_post(
             to `False`.
         collection_source (str, optional): string explaining how the post
             was collected. Defaults to `None`.
+        stats (NormalizationStats, optional): collector recording the time
+            spent in each normalization stage. Defaults to the one enabled
+            by `twitwi.stats.collect_stats`, if any.
 
     Returns:
         (dict or list): Either a single post dict or a list of post dicts if
@@ -1061,7 +1082,10 @@ def normalize_post(
             "UNKNOWN", f"data provided to normalize_post is not a dictionary: {payload}"
         )
 
-    valid, error = validate_post_payload(payload)
+    stats = resolve_stats(stats)
+
+    with stats.stage("validate_post_payload"):
+        valid, error = validate_post_payload(payload)
     if not valid:
         raise BlueskyPayloadError(
             payload.get("uri", payload.get("post", {}).get("uri", "UNKNOWN")),
@@ -1085,7 +1109,7 @@ def normalize_post(
     post = {}
 
     # Warning: mutates post
-    text = handle_text_and_datetime_fields(data, post, locale)
+    text = handle_text_and_datetime_fields(data, post, locale, stats)
     post["indexed_at_utc"] = data["indexedAt"]
 
     # Handle post/user identifiers
@@ -1110,9 +1134,10 @@ def normalize_post(
     # Handle user metadata
     post["user_display_name"] = data["author"].get("displayName", "")
     post["user_avatar"] = data["author"].get("avatar", "")
-    post["user_timestamp_utc"], post["user_created_at"] = get_dates(
-        data["author"]["createdAt"], locale=locale, source="bluesky"
-    )
+    with stats.stage("get_dates"):
+        post["user_timestamp_utc"], post["user_created_at"] = get_dates(
+            data["author"]["createdAt"], locale=locale, source="bluesky"
+        )
     post["user_langs"] = data["record"].get("langs", [])
 
     if "bridgyOriginalUrl" in data["record"]:
@@ -1128,9 +1153,10 @@ def normalize_post(
 
     # Handle hashtags, mentions & links from facets
     # Warning: mutates post
-    text, links, media_data, extra_links = process_post_facets(
-        data["record"].get("facets", []), post, text
-    )
+    with stats.stage("process_post_facets"):
+        text, links, media_data, extra_links = process_post_facets(
+            data["record"].get("facets", []), post, text
+        )
 
     # Handle thread info when applicable
     # Unfortunately posts' payload only provide at uris for these so we do not have the handles
@@ -1146,22 +1172,25 @@ def normalize_post(
     post["media_alt_texts"] = []
     if "embed" in data["record"]:
         # Warning: mutates post, links and referenced_posts
-        text = process_links_from_card(
-            data["record"],
-            post,
-            links,
-            text,
-            media_data,
-            extra_links,
-            locale,
-            extract_referenced_posts,
-            referenced_posts,
-            data,
-        )
+        with stats.stage("process_links_from_card"):
+            text = process_links_from_card(
+                data["record"],
+                post,
+                links,
+                text,
+                media_data,
+                extra_links,
+                locale,
+                extract_referenced_posts,
+                referenced_posts,
+                data,
+                stats,
+            )
 
     # Process links domains
     # Warning: mutates post
-    process_links_domains(post, links)
+    with stats.stage("process_links_domains"):
+        process_links_domains(post, links)
 
     # Handle threadgates (replies rules)
     # WARNING: quoted posts do not seem to include threadgates info
@@ -1185,12 +1214,15 @@ def normalize_post(
                     post["replies_rules"].append(rule_string)
             if not data["threadgate"]["record"]["allow"]:
                 post["replies_rules"].append("disallow")
-        (
-            post["replies_rules_timestamp_utc"],
-            post["replies_rules_created_at"],
-        ) = get_dates(
-            data["threadgate"]["record"]["createdAt"], locale=locale, source="bluesky"
-        )
+        with stats.stage("get_dates"):
+            (
+                post["replies_rules_timestamp_utc"],
+                post["replies_rules_created_at"],
+            ) = get_dates(
+                data["threadgate"]["record"]["createdAt"],
+                locale=locale,
+                source="bluesky",
+            )
         post["hidden_replies_uris"] = data["threadgate"]["record"].get(
             "hiddenReplies", []
         )
@@ -1218,9 +1250,10 @@ def normalize_post(
 
         post["repost_by_user_did"] = repost_data["by"]["did"]
         post["repost_by_user_handle"] = repost_data["by"]["handle"]
-        post["repost_timestamp_utc"], post["repost_created_at"] = get_dates(
-            repost_data["indexedAt"], locale=locale, source="bluesky"
-        )
+        with stats.stage("get_dates"):
+            post["repost_timestamp_utc"], post["repost_created_at"] = get_dates(
+                repost_data["indexedAt"], locale=locale, source="bluesky"
+            )
 
     # Finalize text field
     # Warning: mutates post
@@ -1235,7 +1268,12 @@ def normalize_post(
         if reply_data:
             # Warning: mutates referenced_posts
             process_thread_posts_from_feed(
-                reply_data, post, locale, extract_referenced_posts, referenced_posts
+                reply_data,
+                post,
+                locale,
+                extract_referenced_posts,
+                referenced_posts,
+                stats,
             )
 
         assert referenced_posts is not None
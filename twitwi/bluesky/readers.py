@@ -0,0 +1,218 @@
+# =============================================================================
+# Twitwi Bluesky Payload Readers
+# =============================================================================
+#
+# Generators lazily normalizing JSONL files of Bluesky payloads, or reading
+# back csv exports of normalized records, see `twitwi.readers` for the
+# details.
+#
+from functools import partial
+
+from twitwi.constants import READ_BUFFER_SIZE
+from twitwi.readers import (
+    iter_normalized,
+    iter_records_from_csv,
+    validate_csv_fields,
+)
+from twitwi.bluesky.constants import (
+    POST_FIELDS,
+    POST_PLURAL_FIELDS,
+    POST_BOOLEAN_FIELDS,
+    POST_INTEGER_FIELDS,
+    PARTIAL_POST_FIELDS,
+    PARTIAL_POST_PLURAL_FIELDS,
+    PARTIAL_POST_BOOLEAN_FIELDS,
+    PARTIAL_POST_INTEGER_FIELDS,
+    PROFILE_FIELDS,
+    PROFILE_INTEGER_FIELDS,
+    PARTIAL_PROFILE_FIELDS,
+    PARTIAL_PROFILE_INTEGER_FIELDS,
+)
+from twitwi.bluesky.normalizers import (
+    normalize_profile,
+    normalize_partial_profile,
+    normalize_post,
+    normalize_partial_post,
+)
+
+
+def iter_normalized_posts(
+    path_or_file,
+    locale=None,
+    extract_referenced_posts=False,
+    collection_source=None,
+    on_error: str = "raise",
+    errors=None,
+    stats=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the posts or feed items of a JSONL file. See
+    `twitwi.readers.iter_normalized` & `normalize_post` for the arguments.
+    """
+    normalize = partial(
+        normalize_post,
+        locale=locale,
+        extract_referenced_posts=extract_referenced_posts,
+        collection_source=collection_source,
+        stats=stats,
+    )
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def iter_normalized_partial_posts(
+    path_or_file,
+    locale=None,
+    collection_source=None,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the partial posts of a JSONL file, as
+    collected from the firehose or tap. See `twitwi.readers.iter_normalized`
+    & `normalize_partial_post` for the arguments.
+    """
+    normalize = partial(
+        normalize_partial_post, locale=locale, collection_source=collection_source
+    )
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def iter_normalized_profiles(
+    path_or_file,
+    locale=None,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the profiles of a JSONL file. See
+    `twitwi.readers.iter_normalized` & `normalize_profile` for the arguments.
+    """
+    normalize = partial(normalize_profile, locale=locale)
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def iter_normalized_partial_profiles(
+    path_or_file,
+    locale=None,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the partial profiles of a JSONL file. See
+    `twitwi.readers.iter_normalized` & `normalize_partial_profile` for the
+    arguments.
+    """
+    normalize = partial(normalize_partial_profile, locale=locale)
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def iter_posts_from_csv(
+    path_or_file,
+    fields=None,
+    plural_separator: str = "|",
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized posts, as written by
+    `format_post_as_csv_row`. See `twitwi.readers.iter_records_from_csv` for
+    the arguments.
+    """
+    validate_csv_fields(fields, POST_FIELDS, "post")
+
+    return iter_records_from_csv(
+        path_or_file,
+        plural_fields=POST_PLURAL_FIELDS,
+        boolean_fields=POST_BOOLEAN_FIELDS,
+        integer_fields=POST_INTEGER_FIELDS,
+        fields=fields,
+        plural_separator=plural_separator,
+        on_error=on_error,
+        errors=errors,
+        buffer_size=buffer_size,
+    )
+
+
+def iter_partial_posts_from_csv(
+    path_or_file,
+    fields=None,
+    plural_separator: str = "|",
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized partial posts, as
+    written by `format_partial_post_as_csv_row`. See
+    `twitwi.readers.iter_records_from_csv` for the arguments.
+    """
+    validate_csv_fields(fields, PARTIAL_POST_FIELDS, "partial post")
+
+    return iter_records_from_csv(
+        path_or_file,
+        plural_fields=PARTIAL_POST_PLURAL_FIELDS,
+        boolean_fields=PARTIAL_POST_BOOLEAN_FIELDS,
+        integer_fields=PARTIAL_POST_INTEGER_FIELDS,
+        fields=fields,
+        plural_separator=plural_separator,
+        on_error=on_error,
+        errors=errors,
+        buffer_size=buffer_size,
+    )
+
+
+def iter_profiles_from_csv(
+    path_or_file,
+    fields=None,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized profiles, as written
+    by `format_profile_as_csv_row`. See `twitwi.readers.iter_records_from_csv`
+    for the arguments.
+    """
+    validate_csv_fields(fields, PROFILE_FIELDS, "profile")
+
+    return iter_records_from_csv(
+        path_or_file,
+        integer_fields=PROFILE_INTEGER_FIELDS,
+        fields=fields,
+        on_error=on_error,
+        errors=errors,
+        buffer_size=buffer_size,
+    )
+
+
+def iter_partial_profiles_from_csv(
+    path_or_file,
+    fields=None,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized partial profiles, as
+    written by `format_partial_profile_as_csv_row`. See
+    `twitwi.readers.iter_records_from_csv` for the arguments.
+    """
+    validate_csv_fields(fields, PARTIAL_PROFILE_FIELDS, "partial profile")
+
+    return iter_records_from_csv(
+        path_or_file,
+        integer_fields=PARTIAL_PROFILE_INTEGER_FIELDS,
+        fields=fields,
+        on_error=on_error,
+        errors=errors,
+        buffer_size=buffer_size,
+    )
@@ -105,7 +105,7 @@ class BlueskyPost(TypedDict):
     # Contrary to Twitter where a retweet is a new tweet with its own ID, reposting on Bluesky only adds a flag to the post saying it was reposted by a specific user at a specific time. These are available for instance when collecting a user's feed.
     repost_by_user_did: Optional[str]       # persistent long-term identifier of the account who reposted the post
     repost_by_user_handle: Optional[str]    # updatable human-readable username of the account who reposted the post
-    repost_created_at: Optional[int]        # datetime (potentially timezoned) of when the repost was done
+    repost_created_at: Optional[str]        # datetime (potentially timezoned) of when the repost was done
     repost_timestamp_utc: Optional[int]     # Unix UTC timestamp of when the repost was done
 
     # Quoted post metadata fields
@@ -116,7 +116,7 @@ class BlueskyPost(TypedDict):
     quoted_url: Optional[str]           # URL of the quoted post accessible on the web
     quoted_user_did: Optional[str]      # persistent long-term identifier of the account who authored the quoted post
     quoted_user_handle: Optional[str]   # updatable human-readable username of the account who authored the quoted post
-    quoted_created_at: Optional[int]    # datetime (potentially timezoned) of when the quoted post was submitted
+    quoted_created_at: Optional[str]    # datetime (potentially timezoned) of when the quoted post was submitted
     quoted_timestamp_utc: Optional[int] # Unix UTC timestamp of when the quoted post was submitted
     quoted_status: Optional[str]        # empty or "detached" when the author of the quoted post intentionnally required the quoting post not to appear in the list of this post's quotes
 
@@ -164,7 +164,7 @@ class BlueskyPartialPost(TypedDict):
     timestamp_utc: int                  # Unix UTC timestamp of when the post was submitted
     local_time: str                     # datetime (potentially timezoned) of when the post was submitted
     # indexed_at_utc: str               # not available from firehose nor tap payloads
-    firehose_timestamp_us : str         # datetime (NOT timezoned, for configuring/debugging the firehose) of the firehose event, in microseconds since epoch, only available when collected from the firehose
+    firehose_timestamp_us: Optional[int] # datetime (NOT timezoned, for configuring/debugging the firehose) of the firehose event, in microseconds since epoch, only available when collected from the firehose
 
     # Author identifying fields
     user_did: str                       # persistent long-term identifier of the account who authored the post
@@ -219,7 +219,7 @@ class BlueskyPartialPost(TypedDict):
     # Contrary to Twitter where a retweet is a new tweet with its own ID, reposting on Bluesky only adds a flag to the post saying it was reposted by a specific user at a specific time. These are available for instance when collecting a user's feed.
     # repost_by_user_did: Optional[str]       # not available from firehose nor tap payloads
     # repost_by_user_handle: Optional[str]    # not available from firehose nor tap payloads
-    # repost_created_at: Optional[int]        # not available from firehose nor tap payloads
+    # repost_created_at: Optional[str]        # not available from firehose nor tap payloads
     # repost_timestamp_utc: Optional[int]     # not available from firehose nor tap payloads
 
     # Quoted post metadata fields
@@ -230,7 +230,7 @@ class BlueskyPartialPost(TypedDict):
     quoted_url: Optional[str]             # URL of the quoted post accessible on the web
     quoted_user_did: Optional[str]        # persistent long-term identifier of the account who authored the quoted post
     # quoted_user_handle: Optional[str]   # not available from firehose nor tap payloads
-    # quoted_created_at: Optional[int]    # not available from firehose nor tap payloads
+    # quoted_created_at: Optional[str]    # not available from firehose nor tap payloads
     # quoted_timestamp_utc: Optional[int] # not available from firehose nor tap payloads
     # quoted_status: Optional[str]        # not available from firehose nor tap payloads
 
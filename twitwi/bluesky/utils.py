@@ -1,6 +1,16 @@
 import re
+from datetime import datetime
+from typing import Optional, Tuple, Union
 
+from twitwi.constants import FORMATTED_FULL_DATETIME_FORMAT
+from twitwi.dates import UTC_TIMEZONE
 from twitwi.exceptions import BlueskyPayloadError
+from twitwi.utils import get_timestamp_in_milliseconds, is_numpy_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 valid_post_keys = [
@@ -241,3 +251,166 @@ def format_external_embed_thumbnail_url(thumbnail_cid: str, user_did: str) -> st
     return (
         f"https://cdn.bsky.app/img/feed_thumbnail/plain/{user_did}/{thumbnail_cid}@jpeg"
     )
+
+
+# NOTE: TIDs are 13 chars long base32-sortable encodings of a 64 bits integer
+# whose top bit is 0, followed by a 53 bits UNIX timestamp in microseconds and
+# a 10 bits clock id. See https://atproto.com/specs/tid
+TID_ALPHABET = "234567abcdefghijklmnopqrstuvwxyz"
+TID_LENGTH = 13
+TID_CLOCK_ID_BITS = 10
+TID_MAX_CLOCK_ID = (1 << TID_CLOCK_ID_BITS) - 1
+
+re_tid = re.compile(r"^[234567a-j][234567a-z]{12}$")
+
+# Translating TIDs to regular base32 digits lets `int` do the decoding
+TID_TO_BASE32 = str.maketrans(TID_ALPHABET, "0123456789abcdefghijklmnopqrstuv")
+
+if np is not None:
+    TID_DIGITS_TABLE = np.full(128, -1, dtype=np.int64)
+
+    for i, c in enumerate(TID_ALPHABET):
+        TID_DIGITS_TABLE[ord(c)] = i
+
+
+def decode_tid(tid: str) -> Optional[Tuple[int, int]]:
+    """Returns a tuple of (timestamp in microseconds, clock id) from a TID, or None if invalid"""
+
+    if not isinstance(tid, str) or not re_tid.match(tid):
+        return None
+
+    value = int(tid.translate(TID_TO_BASE32), 32)
+
+    return value >> TID_CLOCK_ID_BITS, value & TID_MAX_CLOCK_ID
+
+
+def encode_tid(timestamp_us: int, clock_id: int = 0) -> str:
+    if not 0 <= timestamp_us < (1 << 53) or not 0 <= clock_id <= TID_MAX_CLOCK_ID:
+        raise ValueError("timestamp or clock id out of TID range")
+
+    value = (timestamp_us << TID_CLOCK_ID_BITS) | clock_id
+
+    chars = []
+
+    for _ in range(TID_LENGTH):
+        chars.append(TID_ALPHABET[value & 31])
+        value >>= 5
+
+    return "".join(reversed(chars))
+
+
+def get_timestamp_from_tid(tid: str, millisecond_timestamp: bool = False):
+    decoded = decode_tid(tid)
+
+    if decoded is None:
+        return None
+
+    return decoded[0] // (1000 if millisecond_timestamp else 1000000)
+
+
+def get_dates_from_tid(tid: str, locale=None):
+    """
+    Returns a tuple of (timestamp, local time formatted as Bluesky post
+    dates) from a TID, or None if invalid.
+    """
+    decoded = decode_tid(tid)
+
+    if decoded is None:
+        return None
+
+    if locale is None:
+        locale = UTC_TIMEZONE
+
+    seconds, microseconds = divmod(decoded[0], 1000000)
+    locale_datetime = datetime.fromtimestamp(seconds, locale).replace(
+        microsecond=microseconds
+    )
+
+    return (
+        seconds,
+        datetime.strftime(locale_datetime, FORMATTED_FULL_DATETIME_FORMAT),
+    )
+
+
+def get_timestamps_from_tids(tids, millisecond_timestamp: bool = False):
+    """
+    Batch version of `get_timestamp_from_tid`.
+
+    Given a NumPy array of strings, decoding is vectorized and returns a
+    masked int64 array where invalid TIDs are masked. Given any other
+    iterable, returns a list where invalid TIDs are mapped to None.
+    """
+    divisor = 1000 if millisecond_timestamp else 1000000
+
+    if not is_numpy_array(tids):
+        timestamps = []
+
+        for tid in tids:
+            if isinstance(tid, str) and re_tid.match(tid):
+                value = int(tid.translate(TID_TO_BASE32), 32)
+                timestamps.append((value >> TID_CLOCK_ID_BITS) // divisor)
+            else:
+                timestamps.append(None)
+
+        return timestamps
+
+    tids = tids.astype(str)
+    invalid = np.char.str_len(tids) != TID_LENGTH
+
+    # Reading the code points of each char, shorter strings being 0-padded
+    code_points = (
+        np.ascontiguousarray(tids.astype("U%i" % TID_LENGTH))
+        .view(np.uint32)
+        .reshape(-1, TID_LENGTH)
+    )
+
+    digits = TID_DIGITS_TABLE[np.minimum(code_points, 127)]
+
+    invalid |= (digits < 0).any(axis=1) | (digits[:, 0] > 15)
+    digits = np.where(invalid[:, None], 0, digits).astype(np.uint64)
+
+    values = np.zeros(len(tids), dtype=np.uint64)
+
+    for i in range(TID_LENGTH):
+        values = (values << np.uint64(5)) | digits[:, i]
+
+    timestamps = (values >> np.uint64(TID_CLOCK_ID_BITS)).astype(np.int64) // divisor
+
+    return np.ma.masked_array(timestamps, mask=invalid)
+
+
+def get_tid_range_from_dates(
+    start: Union[datetime, int, float], end: Union[datetime, int, float]
+) -> Tuple[str, str]:
+    """
+    Return the inclusive range of TIDs, as a (min_tid, max_tid) tuple, that
+    records created between start and end (both inclusive, at the
+    millisecond) can have. Dates can be given as datetimes (naive ones being
+    considered as UTC) or UNIX timestamps in seconds. Since TIDs sort
+    lexicographically, the range can be used to filter sorted rkeys.
+    """
+    start_ms = get_timestamp_in_milliseconds(start)
+    end_ms = get_timestamp_in_milliseconds(end)
+
+    if end_ms < start_ms:
+        raise ValueError("end should not be anterior to start")
+
+    return (
+        encode_tid(start_ms * 1000),
+        encode_tid(end_ms * 1000 + 999, TID_MAX_CLOCK_ID),
+    )
+
+
+def get_backdating_delay(post) -> Optional[int]:
+    """
+    Returns the delay, in seconds, between the time encoded in the TID of a
+    normalized post and its declared creation time. A large positive value
+    means the post's createdAt was backdated. Returns None when the post
+    did is not a TID.
+    """
+    timestamp = get_timestamp_from_tid(post["did"])
+
+    if timestamp is None:
+        return None
+
+    return timestamp - post["timestamp_utc"]
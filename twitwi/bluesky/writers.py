@@ -0,0 +1,54 @@
+# =============================================================================
+# Twitwi Bluesky CSV Writers
+# =============================================================================
+#
+# Buffered csv writers of normalized Bluesky records, see `twitwi.writers`
+# for the details.
+#
+from twitwi.writers import CSVWriter
+from twitwi.bluesky.constants import (
+    PROFILE_FIELDS,
+    PARTIAL_PROFILE_FIELDS,
+    POST_FIELDS,
+    POST_PLURAL_FIELDS,
+    POST_BOOLEAN_FIELDS,
+    PARTIAL_POST_FIELDS,
+    PARTIAL_POST_PLURAL_FIELDS,
+    PARTIAL_POST_BOOLEAN_FIELDS,
+)
+
+
+class PostCSVWriter(CSVWriter):
+    """Buffered csv writer of normalized posts, see `twitwi.writers.CSVWriter`."""
+
+    fields = POST_FIELDS
+    plural_fields = POST_PLURAL_FIELDS
+    boolean_fields = POST_BOOLEAN_FIELDS
+
+
+class PartialPostCSVWriter(CSVWriter):
+    """
+    Buffered csv writer of normalized partial posts, see
+    `twitwi.writers.CSVWriter`.
+    """
+
+    fields = PARTIAL_POST_FIELDS
+    plural_fields = PARTIAL_POST_PLURAL_FIELDS
+    boolean_fields = PARTIAL_POST_BOOLEAN_FIELDS
+
+
+class ProfileCSVWriter(CSVWriter):
+    """
+    Buffered csv writer of normalized profiles, see `twitwi.writers.CSVWriter`.
+    """
+
+    fields = PROFILE_FIELDS
+
+
+class PartialProfileCSVWriter(CSVWriter):
+    """
+    Buffered csv writer of normalized partial profiles, see
+    `twitwi.writers.CSVWriter`.
+    """
+
+    fields = PARTIAL_PROFILE_FIELDS
@@ -0,0 +1,495 @@
+# =============================================================================
+# Twitwi Columnar Export
+# =============================================================================
+#
+# Builders converting iterables of normalized records into typed columns:
+# integers and floats into arrays with a null mask, booleans into byte arrays,
+# strings into offsets & utf-8 bytes buffers and plural fields into list
+# offsets over a string column of their elements. Records are consumed one at
+# a time and columns can be flushed in row groups of fixed size, so that
+# memory stays bounded whatever the number of records.
+#
+from array import array
+
+from twitwi.constants import (
+    TWEET_FIELDS,
+    TWEET_PLURAL_FIELDS,
+    TWEET_BOOLEAN_FIELDS,
+    TWEET_INTEGER_FIELDS,
+    TWEET_FLOAT_FIELDS,
+    USER_FIELDS,
+    USER_PLURAL_FIELDS,
+    USER_BOOLEAN_FIELDS,
+    USER_INTEGER_FIELDS,
+    COLUMNAR_ROW_GROUP_SIZE,
+)
+from twitwi.bluesky.constants import (
+    POST_FIELDS,
+    POST_PLURAL_FIELDS,
+    POST_BOOLEAN_FIELDS,
+    POST_INTEGER_FIELDS,
+    PARTIAL_POST_FIELDS,
+    PARTIAL_POST_PLURAL_FIELDS,
+    PARTIAL_POST_BOOLEAN_FIELDS,
+    PARTIAL_POST_INTEGER_FIELDS,
+    PROFILE_FIELDS,
+    PROFILE_INTEGER_FIELDS,
+    PARTIAL_PROFILE_FIELDS,
+    PARTIAL_PROFILE_INTEGER_FIELDS,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Fields, plural fields, boolean fields, integer fields & float fields
+SCHEMAS = {
+    "tweet": (
+        TWEET_FIELDS,
+        TWEET_PLURAL_FIELDS,
+        TWEET_BOOLEAN_FIELDS,
+        TWEET_INTEGER_FIELDS,
+        TWEET_FLOAT_FIELDS,
+    ),
+    "user": (
+        USER_FIELDS,
+        USER_PLURAL_FIELDS,
+        USER_BOOLEAN_FIELDS,
+        USER_INTEGER_FIELDS,
+        [],
+    ),
+    "post": (
+        POST_FIELDS,
+        POST_PLURAL_FIELDS,
+        POST_BOOLEAN_FIELDS,
+        POST_INTEGER_FIELDS,
+        [],
+    ),
+    "partial_post": (
+        PARTIAL_POST_FIELDS,
+        PARTIAL_POST_PLURAL_FIELDS,
+        PARTIAL_POST_BOOLEAN_FIELDS,
+        PARTIAL_POST_INTEGER_FIELDS,
+        [],
+    ),
+    "profile": (PROFILE_FIELDS, [], [], PROFILE_INTEGER_FIELDS, []),
+    "partial_profile": (
+        PARTIAL_PROFILE_FIELDS,
+        [],
+        [],
+        PARTIAL_PROFILE_INTEGER_FIELDS,
+        [],
+    ),
+}
+
+
+def get_column_types(schema: str = "tweet", fields=None) -> dict:
+    """
+    Function returning the type of the columns of a schema, in field order,
+    among "int", "float", "bool", "str" & "list".
+
+    Args:
+        schema (str, optional): one of "tweet", "user", "post",
+            "partial_post", "profile" or "partial_profile". Defaults to
+            "tweet".
+        fields (iterable, optional): projection on some fields of the schema.
+
+    Returns:
+        dict: mapping of field names to column types.
+
+    """
+    if schema not in SCHEMAS:
+        raise ValueError("schema should be one of %s" % ", ".join(SCHEMAS))
+
+    all_fields, plural_fields, boolean_fields, integer_fields, float_fields = SCHEMAS[
+        schema
+    ]
+
+    if fields is None:
+        fields = all_fields
+    else:
+        if isinstance(fields, str):
+            raise TypeError("fields should be an iterable of field names")
+
+        for field in fields:
+            if field not in all_fields:
+                raise TypeError("unknown %s field %r" % (schema, field))
+
+    types = {}
+
+    for field in fields:
+        if field in plural_fields:
+            types[field] = "list"
+        elif field in boolean_fields:
+            types[field] = "bool"
+        elif field in integer_fields:
+            types[field] = "int"
+        elif field in float_fields:
+            types[field] = "float"
+        else:
+            types[field] = "str"
+
+    return types
+
+
+class Column(object):
+    """
+    Typed column of a row group.
+
+    Attributes:
+        name (str): name of the field.
+        type (str): one of "int", "float", "bool", "str" or "list".
+        mask (bytearray or numpy.ndarray): 1 for null values, 0 otherwise.
+        values (array or numpy.ma.MaskedArray): values of "int" (int64),
+            "float" (float64) & "bool" (bytes of 0 or 1) columns, null values
+            being stored as 0. None for other columns.
+        offsets (array or numpy.ndarray): int64 offsets of the values of
+            "str" columns in `data`, or of the elements of "list" columns in
+            `child`, with one more offset than rows. None for other columns.
+        data (bytes): utf-8 encoded values of "str" columns. None for other
+            columns.
+        child (Column): "str" column of the elements of "list" columns. None
+            for other columns.
+
+    """
+
+    __slots__ = ("name", "type", "mask", "values", "offsets", "data", "child")
+
+    def __init__(
+        self, name, type, mask, values=None, offsets=None, data=None, child=None
+    ):
+        self.name = name
+        self.type = type
+        self.mask = mask
+        self.values = values
+        self.offsets = offsets
+        self.data = data
+        self.child = child
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __repr__(self):
+        return "<%s name=%r type=%s length=%i>" % (
+            self.__class__.__name__,
+            self.name,
+            self.type,
+            len(self),
+        )
+
+    def to_list(self) -> list:
+        """
+        Method decoding the column into a list of python values, None
+        standing for null values.
+        """
+        mask = (
+            self.mask.tolist()
+            if np is not None and isinstance(self.mask, np.ndarray)
+            else self.mask
+        )
+
+        if self.type in ("int", "float", "bool"):
+            values = self.values
+
+            if np is not None and isinstance(values, np.ndarray):
+                values = np.ma.getdata(values)
+
+            values = values.tolist() if hasattr(values, "tolist") else list(values)
+
+            if self.type == "bool":
+                values = [bool(value) for value in values]
+
+            return [None if null else value for null, value in zip(mask, values)]
+
+        offsets = self.offsets.tolist()
+
+        if self.type == "str":
+            data = self.data
+
+            return [
+                None if null else data[start:end].decode("utf-8")
+                for null, start, end in zip(mask, offsets, offsets[1:])
+            ]
+
+        elements = self.child.to_list()
+
+        return [
+            None if null else elements[start:end]
+            for null, start, end in zip(mask, offsets, offsets[1:])
+        ]
+
+
+class NumberColumnBuilder(object):
+    typecode = "q"
+    cast = int
+
+    def __init__(self):
+        self.values = array(self.typecode)
+        self.mask = bytearray()
+
+    def append(self, value):
+        if value is None or value == "":
+            self.values.append(0)
+            self.mask.append(1)
+        else:
+            self.values.append(self.cast(value))
+            self.mask.append(0)
+
+    def build(self, name, type, numpy=False):
+        if not numpy:
+            return Column(name, type, self.mask, values=self.values)
+
+        mask = np.frombuffer(self.mask, dtype=np.bool_)
+        values = np.frombuffer(self.values, dtype=np.dtype(self.typecode))
+
+        return Column(name, type, mask, values=np.ma.masked_array(values, mask=mask))
+
+
+class IntegerColumnBuilder(NumberColumnBuilder):
+    typecode = "q"
+    cast = int
+
+
+class FloatColumnBuilder(NumberColumnBuilder):
+    typecode = "d"
+    cast = float
+
+
+class BooleanColumnBuilder(NumberColumnBuilder):
+    def __init__(self):
+        self.values = bytearray()
+        self.mask = bytearray()
+
+    def cast(self, value):
+        return 1 if value else 0
+
+    def build(self, name, type, numpy=False):
+        if not numpy:
+            return Column(name, type, self.mask, values=self.values)
+
+        mask = np.frombuffer(self.mask, dtype=np.bool_)
+        values = np.frombuffer(self.values, dtype=np.bool_)
+
+        return Column(name, type, mask, values=np.ma.masked_array(values, mask=mask))
+
+
+class StringColumnBuilder(object):
+    def __init__(self):
+        self.offsets = array("q", [0])
+        self.mask = bytearray()
+        self.chunks = []
+        self.position = 0
+
+    def append(self, value):
+        if value is None:
+            self.mask.append(1)
+        else:
+            if not isinstance(value, str):
+                value = str(value)
+
+            encoded = value.encode("utf-8")
+            self.chunks.append(encoded)
+            self.position += len(encoded)
+            self.mask.append(0)
+
+        self.offsets.append(self.position)
+
+    def build(self, name, type, numpy=False):
+        data = b"".join(self.chunks)
+
+        if not numpy:
+            return Column(name, type, self.mask, offsets=self.offsets, data=data)
+
+        return Column(
+            name,
+            type,
+            np.frombuffer(self.mask, dtype=np.bool_),
+            offsets=np.frombuffer(self.offsets, dtype=np.int64),
+            data=data,
+        )
+
+
+class ListColumnBuilder(object):
+    def __init__(self):
+        self.offsets = array("q", [0])
+        self.mask = bytearray()
+        self.child = StringColumnBuilder()
+        self.position = 0
+
+    def append(self, value):
+        if value is None:
+            self.mask.append(1)
+        else:
+            append_element = self.child.append
+
+            for element in value:
+                append_element(element)
+
+            self.position += len(value)
+            self.mask.append(0)
+
+        self.offsets.append(self.position)
+
+    def build(self, name, type, numpy=False):
+        child = self.child.build(name, "str", numpy=numpy)
+
+        if not numpy:
+            return Column(name, type, self.mask, offsets=self.offsets, child=child)
+
+        return Column(
+            name,
+            type,
+            np.frombuffer(self.mask, dtype=np.bool_),
+            offsets=np.frombuffer(self.offsets, dtype=np.int64),
+            child=child,
+        )
+
+
+COLUMN_BUILDERS = {
+    "int": IntegerColumnBuilder,
+    "float": FloatColumnBuilder,
+    "bool": BooleanColumnBuilder,
+    "str": StringColumnBuilder,
+    "list": ListColumnBuilder,
+}
+
+
+class ColumnarBuilder(object):
+    """
+    Builder appending normalized records to typed columns, which can be
+    flushed as row groups.
+
+    Args:
+        schema (str, optional): one of "tweet", "user", "post",
+            "partial_post", "profile" or "partial_profile". Defaults to
+            "tweet".
+        fields (iterable, optional): projection on some fields of the schema.
+        numpy (bool, optional): whether to build NumPy arrays, or masked
+            arrays for "int", "float" & "bool" values, instead of stdlib
+            arrays. Defaults to `False`.
+
+    Attributes:
+        types (dict): mapping of field names to column types.
+        rows (int): number of records appended since the last flush.
+
+    """
+
+    def __init__(self, schema: str = "tweet", fields=None, numpy: bool = False):
+        if numpy and np is None:
+            raise ImportError("numpy is required to build numpy columns")
+
+        self.types = get_column_types(schema, fields)
+        self.numpy = numpy
+        self.rows = 0
+        self.reset()
+
+    def reset(self):
+        self.builders = [
+            (field, COLUMN_BUILDERS[type]()) for field, type in self.types.items()
+        ]
+
+    def __len__(self):
+        return self.rows
+
+    def append(self, record) -> None:
+        for field, builder in self.builders:
+            # NOTE: links are exported resolved, as done by the csv formatters
+            if field == "links":
+                value = record.get("proper_links", record.get("links"))
+            else:
+                value = record.get(field)
+
+            builder.append(value)
+
+        self.rows += 1
+
+    def extend(self, records) -> None:
+        for record in records:
+            self.append(record)
+
+    def flush(self) -> dict:
+        """
+        Method returning the columns built since the last flush, as a dict
+        mapping field names to `Column` instances, and starting a new row
+        group.
+        """
+        columns = {
+            field: builder.build(field, self.types[field], numpy=self.numpy)
+            for field, builder in self.builders
+        }
+
+        self.rows = 0
+        self.reset()
+
+        return columns
+
+
+def iter_row_groups(
+    records,
+    schema: str = "tweet",
+    fields=None,
+    row_group_size: int = COLUMNAR_ROW_GROUP_SIZE,
+    numpy: bool = False,
+):
+    """
+    Function converting an iterable of normalized records into row groups of
+    typed columns, consuming the records one at a time.
+
+    Args:
+        records (iterable): normalized records, possibly lazy.
+        schema (str, optional): one of "tweet", "user", "post",
+            "partial_post", "profile" or "partial_profile". Defaults to
+            "tweet".
+        fields (iterable, optional): projection on some fields of the schema.
+        row_group_size (int, optional): number of records per row group, the
+            last one being possibly smaller. Defaults to
+            `COLUMNAR_ROW_GROUP_SIZE`.
+        numpy (bool, optional): whether to build NumPy arrays. Defaults to
+            `False`.
+
+    Returns:
+        (generator): dicts mapping field names to `Column` instances.
+
+    """
+    if row_group_size < 1:
+        raise ValueError("row_group_size should be positive")
+
+    builder = ColumnarBuilder(schema, fields=fields, numpy=numpy)
+
+    return generate_row_groups(builder, records, row_group_size)
+
+
+def generate_row_groups(builder, records, row_group_size):
+    for record in records:
+        builder.append(record)
+
+        if builder.rows >= row_group_size:
+            yield builder.flush()
+
+    if builder.rows:
+        yield builder.flush()
+
+
+def to_columns(records, schema: str = "tweet", fields=None, numpy: bool = False):
+    """
+    Function converting an iterable of normalized records into typed
+    columns, as a single row group.
+
+    Args:
+        records (iterable): normalized records, possibly lazy.
+        schema (str, optional): one of "tweet", "user", "post",
+            "partial_post", "profile" or "partial_profile". Defaults to
+            "tweet".
+        fields (iterable, optional): projection on some fields of the schema.
+        numpy (bool, optional): whether to build NumPy arrays. Defaults to
+            `False`.
+
+    Returns:
+        dict: mapping of field names to `Column` instances.
+
+    """
+    builder = ColumnarBuilder(schema, fields=fields, numpy=numpy)
+    builder.extend(records)
+
+    return builder.flush()
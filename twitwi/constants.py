@@ -10,6 +10,9 @@ FORMATTED_TWEET_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
 FORMATTED_FULL_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
 
+# Maximum number of parsed dates memoized by `twitwi.utils.get_dates`
+DATES_CACHE_SIZE = 16384
+
 # More details on Twitter's tweets metadata can be read here: https://developer.twitter.com/en/docs/tweets/data-dictionary/overview/tweet-object
 TWEET_FIELDS = [
     "id",                       # digital ID
@@ -87,6 +90,15 @@ TWEET_FIELDS = [
     "hashtags",                 # list of hashtags used, lowercased, separated by |
 ]
 
+# Fields that must also be computed when projecting normalized tweets on some
+# fields (see the `fields` argument of the normalizers), because their value is
+# derived from them
+TWEET_FIELD_DEPENDENCIES = {
+    "domains": ["links"],           # hostnames of the links
+    "hashtags": ["text"],           # extracted from the text when entities are missing (v1)
+    "mentioned_names": ["text"],    # extracted from the text when entities are missing (v1)
+}
+
 TWEET_FIELDS_TCAT = [
     "id",
     "time",
@@ -215,6 +227,24 @@ TWEET_PLURAL_FIELDS = {
 
 TWEET_BOOLEAN_FIELDS = {"possibly_sensitive", "user_verified", "user_is_blue_verified", "match_query"}
 
+TWEET_INTEGER_FIELDS = {
+    "timestamp_utc",
+    "retweet_count",
+    "like_count",
+    "reply_count",
+    "impression_count",
+    "user_tweets",
+    "user_followers",
+    "user_friends",
+    "user_likes",
+    "user_lists",
+    "user_timestamp_utc",
+    "retweeted_timestamp_utc",
+    "quoted_timestamp_utc",
+}
+
+TWEET_FLOAT_FIELDS = {"lat", "lng"}
+
 # More details on Twitter's users metadata can be read here: https://developer.twitter.com/en/docs/tweets/data-dictionary/overview/user-object
 USER_FIELDS = [
     "id",
@@ -269,6 +299,8 @@ USER_BOOLEAN_FIELDS = {
     "default_profile_image",
 }
 
+USER_INTEGER_FIELDS = {"timestamp_utc", "tweets", "followers", "friends", "likes", "lists"}
+
 CANONICAL_URL_KWARGS = {
     "strip_authentication": False,
     "strip_trailing_slash": False,
@@ -283,6 +315,17 @@ CANONICAL_URL_KWARGS = {
 
 CANONICAL_HOSTNAME_KWARGS = {"normalize_amp": False, "infer_redirection": False}
 
+# Maximum number of entries kept by the cache shared by url normalization,
+# hostname extraction and url validation helpers
+URL_CACHE_SIZE = 65536
+
+# Maximum number of referenced tweets memoized, and of tweets remembered for
+# deduplication, by `twitwi.normalizers.normalize_tweets`
+REFERENCED_TWEETS_CACHE_SIZE = 8192
+
+# Maximum number of pseudonyms memoized by `twitwi.anonymizers.Pseudonymizer`
+PSEUDONYM_CACHE_SIZE = 65536
+
 # API v2 constants
 TWEET_FIELDS_V2 = {
     "attachments",
@@ -404,3 +447,18 @@ LIST_TWEETS_OR_MEMBERS_PARAMS = {
 
 PRE_SNOWFLAKE_LAST_TWEET_ID = 29700859247
 OFFSET_TIMESTAMP = 1288834974657
+
+# Size (in bytes) of the buffers used when reading payloads files
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Size (in characters) of the buffers used by `twitwi.writers` csv writers
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Number of rows formatted at once by the csv writers' `writerows` method
+WRITE_BATCH_SIZE = 1024
+
+# Number of payloads sent at once to a worker by `twitwi.parallel.normalize_many`
+PARALLEL_CHUNK_SIZE = 256
+
+# Number of records per row group built by `twitwi.columnar`
+COLUMNAR_ROW_GROUP_SIZE = 65536
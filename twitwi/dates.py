@@ -0,0 +1,256 @@
+# =============================================================================
+# Twitwi Date Parsing Engine
+# =============================================================================
+#
+# Fast-path parsers for the datetime formats found in Twitter & Bluesky
+# payloads. `twitwi.utils.get_dates` relies on this module and only falls back
+# to `datetime.strptime` & `dateutil` for the odd payloads.
+#
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import Tuple
+
+from pytz import timezone
+from dateutil.parser import parse as parse_date
+
+from twitwi.constants import (
+    SOURCE_DATETIME_FORMAT,
+    SOURCE_DATETIME_FORMAT_V2,
+    FORMATTED_TWEET_DATETIME_FORMAT,
+    FORMATTED_FULL_DATETIME_FORMAT,
+    DATES_CACHE_SIZE,
+)
+
+UTC_TIMEZONE = timezone("UTC")
+
+MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# NOTE: matches SOURCE_DATETIME_FORMAT, e.g. "Thu Feb 07 06:43:33 +0000 2013"
+V1_DATETIME_PATTERN = re.compile(
+    r"^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun) ([A-Z][a-z]{2}) (\d{2}) "
+    r"(\d{2}):(\d{2}):(\d{2}) \+0000 (\d{4})$"
+)
+
+# NOTE: matches SOURCE_DATETIME_FORMAT_V2, e.g. "2021-04-15T12:00:00.000Z",
+# as well as the ISO variants found in Bluesky payloads, such as
+# "2025-03-14T08:31:07Z" or "2025-05-02T13:08:32.123456-04:00"
+ISO_DATETIME_PATTERN = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?"
+    r"(Z|[+-]\d{2}:\d{2})$"
+)
+
+UTC_OFFSET = dt_timezone.utc
+
+
+@lru_cache(maxsize=64)
+def get_fixed_offset(offset: str) -> dt_timezone:
+    if offset == "Z":
+        return UTC_OFFSET
+
+    sign = -1 if offset[0] == "-" else 1
+    delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+
+    if not delta:
+        return UTC_OFFSET
+
+    return dt_timezone(sign * delta)
+
+
+def parse_v1_datetime(date_str: str):
+    match = V1_DATETIME_PATTERN.match(date_str)
+
+    if match is None:
+        return None
+
+    month, day, hour, minute, second, year = match.groups()
+
+    try:
+        return datetime(
+            int(year),
+            MONTHS[month],
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            tzinfo=UTC_OFFSET,
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def parse_iso_datetime(date_str: str, strict: bool = True):
+    match = ISO_DATETIME_PATTERN.match(date_str)
+
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+    # Only the exact SOURCE_DATETIME_FORMAT_V2 format is accepted for Twitter
+    if strict and (fraction is None or offset != "Z"):
+        return None
+
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=get_fixed_offset(offset),
+        )
+    except ValueError:
+        return None
+
+
+def fallback_get_dates(
+    date_str: str, locale=None, source: str = "v1", millisecond_timestamp: bool = False
+) -> Tuple[int, str]:
+    """
+    Reference implementation relying on `datetime.strptime` and `dateutil`,
+    used for the payloads not handled by the fast paths.
+    """
+    if locale is None:
+        locale = UTC_TIMEZONE
+
+    # Let's pray we never see a negative year...
+    year_zero = date_str.startswith("0000") or all(
+        c == "0" for c in date_str.split("-")[0]
+    )
+
+    try:
+        parsed_datetime = datetime.strptime(
+            date_str,
+            SOURCE_DATETIME_FORMAT if source == "v1" else SOURCE_DATETIME_FORMAT_V2,
+        )
+    except ValueError as e:
+        if source != "bluesky":
+            raise e
+        # Yes, it seems that some people were active in year 0...
+        # see by yourself: https://bsky.app/profile/koro.icu/post/3kbpuogc6fz2o
+        if year_zero:
+            date_str_fixed = "0001" + date_str[4:]
+            parsed_datetime = parse_date(date_str_fixed)
+        else:
+            parsed_datetime = parse_date(date_str)
+
+    utc_datetime = parsed_datetime
+    if not parsed_datetime.tzinfo:
+        utc_datetime = UTC_TIMEZONE.localize(parsed_datetime)
+    locale_datetime = utc_datetime.astimezone(locale)
+
+    formatted_date_str = datetime.strftime(
+        locale_datetime,
+        FORMATTED_FULL_DATETIME_FORMAT
+        if source == "bluesky"
+        else FORMATTED_TWEET_DATETIME_FORMAT,
+    )
+
+    timestamp = int(utc_datetime.timestamp())
+
+    if year_zero:
+        # Subtract one year (year 0001 is not a leap year) in seconds
+        timestamp -= 31536000
+        # Doing like so using split because on ubuntu, datetime.strftime on year with less than 4 digits
+        # only returns 1 digit for year 0 (e.g. "0-05-12...") instead of 4 digits ("0000-05-12..."),
+        # whereas on macOS and Windows it returns 4 digits.
+        formatted_date_str = "0000-" + formatted_date_str.split("-", 1)[1]
+
+    if millisecond_timestamp:
+        timestamp *= 1000
+        timestamp += utc_datetime.microsecond / 1000
+
+    return (
+        int(timestamp),
+        formatted_date_str,
+    )
+
+
+def parse_dates(
+    date_str: str, locale=None, source: str = "v1", millisecond_timestamp: bool = False
+) -> Tuple[int, str]:
+    """
+    Uncached date engine: tries the hand-written parsers first and delegates
+    to `fallback_get_dates` for anything else.
+    """
+    if source == "v1":
+        utc_datetime = parse_v1_datetime(date_str)
+    else:
+        utc_datetime = parse_iso_datetime(date_str, strict=source != "bluesky")
+
+    # NOTE: years before 1000 are not formatted consistently across platforms
+    # by strftime, so we let the fallback handle them
+    if utc_datetime is None or utc_datetime.year < 1000:
+        return fallback_get_dates(
+            date_str,
+            locale=locale,
+            source=source,
+            millisecond_timestamp=millisecond_timestamp,
+        )
+
+    if locale is None or locale is UTC_TIMEZONE:
+        locale_datetime = utc_datetime.astimezone(UTC_OFFSET)
+    else:
+        locale_datetime = utc_datetime.astimezone(locale)
+
+    if locale_datetime.year < 1000:
+        return fallback_get_dates(
+            date_str,
+            locale=locale,
+            source=source,
+            millisecond_timestamp=millisecond_timestamp,
+        )
+
+    if source == "bluesky":
+        formatted_date_str = "%04d-%02d-%02dT%02d:%02d:%02d.%06d" % (
+            locale_datetime.year,
+            locale_datetime.month,
+            locale_datetime.day,
+            locale_datetime.hour,
+            locale_datetime.minute,
+            locale_datetime.second,
+            locale_datetime.microsecond,
+        )
+    else:
+        formatted_date_str = "%04d-%02d-%02dT%02d:%02d:%02d" % (
+            locale_datetime.year,
+            locale_datetime.month,
+            locale_datetime.day,
+            locale_datetime.hour,
+            locale_datetime.minute,
+            locale_datetime.second,
+        )
+
+    timestamp = int(utc_datetime.timestamp())
+
+    if millisecond_timestamp:
+        timestamp *= 1000
+        timestamp += utc_datetime.microsecond / 1000
+
+    return (
+        int(timestamp),
+        formatted_date_str,
+    )
+
+
+cached_parse_dates = lru_cache(maxsize=DATES_CACHE_SIZE)(parse_dates)
+
+
+def clear_dates_cache() -> None:
+    cached_parse_dates.cache_clear()
@@ -4,6 +4,9 @@
 #
 # Custom exceptions used by the library.
 #
+# NOTE: exceptions with custom constructors implement `__reduce__` so that they
+# can be pickled, e.g. when sent back by `twitwi.parallel` workers.
+#
 
 
 class TwitwiError(Exception):
@@ -16,9 +19,36 @@ class TwitterPayloadV2IncompleteIncludesError(TwitwiError):
         self.key = key
         super().__init__("{!r} ({})".format(key, kind))
 
+    def __reduce__(self):
+        return (self.__class__, (self.kind, self.key))
+
 
 class BlueskyPayloadError(TwitwiError):
     def __init__(self, source, message):
         self.source = source
         self.message = message
         super().__init__(f"Error while processing Bluesky post {source}.\n{message}")
+
+    def __reduce__(self):
+        return (self.__class__, (self.source, self.message))
+
+
+class PayloadLineError(TwitwiError):
+    def __init__(self, line, payload, error):
+        self.line = line
+        self.payload = payload
+        self.error = error
+        super().__init__("line {}: {!r}".format(line, error))
+
+    def __reduce__(self):
+        return (self.__class__, (self.line, self.payload, self.error))
+
+
+class PayloadNormalizationError(TwitwiError):
+    def __init__(self, index, error):
+        self.index = index
+        self.error = error
+        super().__init__("payload {}: {!r}".format(index, error))
+
+    def __reduce__(self):
+        return (self.__class__, (self.index, self.error))
@@ -7,6 +7,7 @@
 #
 from twitwi.constants import (
     TWEET_FIELDS,
+    TWEET_FIELDS_TCAT,
     GAZOU_TO_TCAT,
     TWEET_BOOLEAN_FIELDS,
     TWEET_PLURAL_FIELDS,
@@ -14,18 +15,40 @@ from twitwi.constants import (
     USER_BOOLEAN_FIELDS,
     USER_PLURAL_FIELDS,
 )
+from twitwi.lazy import LazyNormalizedTweet
+
+
+TCAT_SOURCE_FORMAT = "<a href={} rel=nofollow>{}</a>"
 
 
 def apply_tcat_format(item):
     result = {
         v: item[k] for k, v in GAZOU_TO_TCAT["identical_fields"].items() if k in item
     }
-    result["source"] = "<a href={} rel=nofollow>{}</a>".format(
+    result["source"] = TCAT_SOURCE_FORMAT.format(
         item["source_url"], item["source_name"]
     )
     return result
 
 
+def format_tcat_source(item):
+    if "source_name" not in item:
+        return ""
+
+    return TCAT_SOURCE_FORMAT.format(item["source_url"], item["source_name"])
+
+
+# NOTE: TCAT columns having no counterpart in normalized tweets, such as the
+# GAZOU_TO_TCAT["removed_fields"], are left empty
+TCAT_SOURCES = {field: None for field in TWEET_FIELDS_TCAT}
+TCAT_SOURCES.update(
+    (tcat_field, field)
+    for field, tcat_field in GAZOU_TO_TCAT["identical_fields"].items()
+    if tcat_field in TCAT_SOURCES
+)
+TCAT_SOURCES["source"] = format_tcat_source
+
+
 def make_transform_into_csv_dict(plural_fields, boolean_fields):
     def transform_into_csv_dict(
         item, item_id=None, plural_separator="|", allow_erroneous_plurals=False
@@ -51,45 +74,205 @@ def make_transform_into_csv_dict(plural_fields, boolean_fields):
     return transform_into_csv_dict
 
 
-def make_format_as_csv_row(fields, plural_fields, boolean_fields):
-    def format_field_for_csv(
-        field, item, item_id=None, plural_separator="|", allow_erroneous_plurals=False
+def make_format_as_csv_dict(plural_fields, boolean_fields):
+    plural_fields = tuple(plural_fields)
+    boolean_fields = tuple(boolean_fields)
+
+    def format_item_as_csv_dict(
+        item, item_id=None, plural_separator="|", allow_erroneous_plurals=False
     ):
-        if field == "id" and item_id is not None:
-            return item_id
+        # NOTE: the given item is left untouched, its unchanged values being
+        # shared with the returned dict
+        if isinstance(item, LazyNormalizedTweet):
+            result = item.materialize()
+        else:
+            result = dict(item)
 
-        # NOTE: this is hardly the most performant way to proceed by I am lazy...
-        if field in plural_fields:
-            v = item.get(field, [])
+        if item_id is not None:
+            result["id"] = item_id
+
+        get = result.get
+        join = plural_separator.join
 
-            if field == "links":
-                v = item.get("proper_links", v)
+        for plural_field in plural_fields:
+            if plural_field == "links":
+                plurals = get("proper_links", get("links", []))
+            else:
+                plurals = get(plural_field, [])
 
-            # Clean None values that may have slipped in, such as in the 'domains' field when
-            # normalizing this Bluesky post: https://bsky.app/profile/did:plc:cs5qjcmnntogoahrrsagmg2z/post/3lvqhn7raq62v
             if allow_erroneous_plurals:
-                v = [element if element is not None else "" for element in v]
+                plurals = [
+                    element if element is not None else "" for element in plurals
+                ]
+
+            result[plural_field] = join(plurals)
+
+        for boolean_field in boolean_fields:
+            result[boolean_field] = (
+                int(result[boolean_field]) if boolean_field in result else ""
+            )
+
+        return result
+
+    return format_item_as_csv_dict
+
+
+def make_format_as_csv_dicts(format_item_as_csv_dict):
+    def format_items_as_csv_dicts(
+        items, plural_separator="|", allow_erroneous_plurals=False
+    ):
+        for item in items:
+            yield format_item_as_csv_dict(
+                item,
+                plural_separator=plural_separator,
+                allow_erroneous_plurals=allow_erroneous_plurals,
+            )
+
+    return format_items_as_csv_dicts
+
+
+def make_plural_getter(field, separator, allow_erroneous_plurals):
+    join = separator.join
+
+    if field == "links":
+
+        def get_values(item):
+            return item.get("proper_links", item.get("links", []))
+
+    else:
+
+        def get_values(item):
+            return item.get(field, [])
+
+    if allow_erroneous_plurals:
+        # Clean None values that may have slipped in, such as in the 'domains' field when
+        # normalizing this Bluesky post: https://bsky.app/profile/did:plc:cs5qjcmnntogoahrrsagmg2z/post/3lvqhn7raq62v
+        def get_plural(item):
+            return join(["" if e is None else e for e in get_values(item)])
+
+    else:
+
+        def get_plural(item):
+            return join(get_values(item))
+
+    return get_plural
 
-            return plural_separator.join(v)
 
-        if field in boolean_fields:
-            return int(item[field]) if field in item else ""
+def make_boolean_getter(field):
+    def get_boolean(item):
+        return int(item[field]) if field in item else ""
 
-        return item.get(field, "")
+    return get_boolean
+
+
+# NOTE: key of the always empty columns, never found in items
+EMPTY_COLUMN = object()
+
+
+def compile_csv_row_formatter(
+    fields,
+    plural_fields,
+    boolean_fields,
+    plural_separator="|",
+    allow_erroneous_plurals=False,
+    sources=None,
+):
+    """
+    Function building a function formatting an item as a csv row for the
+    given schema & options, each column's kind being resolved once and for
+    all.
+
+    The optional `sources` mapping gives, for some columns, the item's field
+    they are read from, a function of the item computing them, or None for
+    columns that are always empty. Other columns are read from the item's
+    field of the same name.
+
+    Returns:
+        (callable): function taking an item and an optional item_id, and
+            returning the row as a list.
+
+    """
+    plural_fields = set(plural_fields)
+    boolean_fields = set(boolean_fields)
+
+    if sources is None:
+        sources = {}
+
+    # NOTE: columns are read using `item.get` all at once, the other kinds
+    # of columns being then computed by their getter
+    keys = []
+    getters = []
+    id_index = None
+
+    for i, field in enumerate(fields):
+        source = sources.get(field, field)
+
+        if source is None:
+            keys.append(EMPTY_COLUMN)
+            continue
+
+        if callable(source):
+            keys.append(EMPTY_COLUMN)
+            getters.append((i, source))
+            continue
+
+        keys.append(source)
+
+        if source in plural_fields:
+            getter = make_plural_getter(
+                source, plural_separator, allow_erroneous_plurals
+            )
+            getters.append((i, getter))
+
+        elif source in boolean_fields:
+            getters.append((i, make_boolean_getter(source)))
+
+        if field == "id":
+            id_index = i
+
+    keys = tuple(keys)
+    defaults = ("",) * len(keys)
+    getters = tuple(getters)
+
+    def format_item_as_csv_row(item, item_id=None):
+        if isinstance(item, LazyNormalizedTweet):
+            item = item.materialize()
+
+        row = list(map(item.get, keys, defaults))
+
+        for i, getter in getters:
+            row[i] = getter(item)
+
+        if item_id is not None and id_index is not None:
+            row[id_index] = item_id
+
+        return row
+
+    return format_item_as_csv_row
+
+
+def make_format_as_csv_row(fields, plural_fields, boolean_fields, sources=None):
+    # NOTE: formatters are compiled once per combination of options
+    compiled = {}
 
     def format_item_as_csv_row(
         item, item_id=None, plural_separator="|", allow_erroneous_plurals=False
     ):
-        return [
-            format_field_for_csv(
-                field,
-                item,
-                item_id=item_id,
+        options = (plural_separator, allow_erroneous_plurals)
+        formatter = compiled.get(options)
+
+        if formatter is None:
+            formatter = compile_csv_row_formatter(
+                fields,
+                plural_fields,
+                boolean_fields,
                 plural_separator=plural_separator,
                 allow_erroneous_plurals=allow_erroneous_plurals,
+                sources=sources,
             )
-            for field in fields
-        ]
+            compiled[options] = formatter
+
+        return formatter(item, item_id)
 
     return format_item_as_csv_row
 
@@ -102,6 +285,16 @@ format_tweet_as_csv_row = make_format_as_csv_row(
     TWEET_FIELDS, TWEET_PLURAL_FIELDS, TWEET_BOOLEAN_FIELDS
 )
 
+format_tweet_as_csv_dict = make_format_as_csv_dict(
+    TWEET_PLURAL_FIELDS, TWEET_BOOLEAN_FIELDS
+)
+
+format_tweets_as_csv_dicts = make_format_as_csv_dicts(format_tweet_as_csv_dict)
+
+format_tweet_as_tcat_row = make_format_as_csv_row(
+    TWEET_FIELDS_TCAT, TWEET_PLURAL_FIELDS, TWEET_BOOLEAN_FIELDS, sources=TCAT_SOURCES
+)
+
 transform_user_into_csv_dict = make_transform_into_csv_dict(
     USER_PLURAL_FIELDS, USER_BOOLEAN_FIELDS
 )
@@ -110,10 +303,22 @@ format_user_as_csv_row = make_format_as_csv_row(
     USER_FIELDS, USER_PLURAL_FIELDS, USER_BOOLEAN_FIELDS
 )
 
+format_user_as_csv_dict = make_format_as_csv_dict(
+    USER_PLURAL_FIELDS, USER_BOOLEAN_FIELDS
+)
+
+format_users_as_csv_dicts = make_format_as_csv_dicts(format_user_as_csv_dict)
+
 __all__ = [
     "transform_tweet_into_csv_dict",
     "format_tweet_as_csv_row",
+    "format_tweet_as_csv_dict",
+    "format_tweets_as_csv_dicts",
     "transform_user_into_csv_dict",
     "format_user_as_csv_row",
+    "format_user_as_csv_dict",
+    "format_users_as_csv_dicts",
     "apply_tcat_format",
+    "format_tweet_as_tcat_row",
+    "compile_csv_row_formatter",
 ]
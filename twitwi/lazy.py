@@ -0,0 +1,144 @@
+# =============================================================================
+# Twitwi Lazy Normalized Tweets
+# =============================================================================
+#
+# Read-only mapping standing for a normalized tweet whose fields are only
+# computed, by groups, when first accessed, which is useful when most tweets
+# are filtered out after inspecting a few of their fields.
+#
+from collections.abc import Mapping
+
+from twitwi.constants import TWEET_FIELDS
+from twitwi.utils import get_collection_time
+
+# Groups of fields computed together, the expensive ones being isolated
+LAZY_FIELD_GROUPS = [
+    frozenset(["timestamp_utc", "local_time"]),
+    frozenset(["user_created_at", "user_timestamp_utc"]),
+    frozenset(["text", "hashtags", "mentioned_names", "mentioned_ids"]),
+    frozenset(["links", "domains"]),
+    frozenset(["media_urls", "media_files", "media_types", "media_alt_texts"]),
+    frozenset(
+        [
+            "retweeted_user",
+            "retweeted_user_id",
+            "retweeted_timestamp_utc",
+            "quoted_user",
+            "quoted_user_id",
+            "quoted_timestamp_utc",
+            "retweet_count",
+        ]
+    ),
+]
+
+LAZY_FIELD_GROUPS.append(
+    frozenset(TWEET_FIELDS).difference(*LAZY_FIELD_GROUPS) - {"collected_via"}
+)
+
+LAZY_FIELD_GROUP_BY_FIELD = {
+    field: group for group in LAZY_FIELD_GROUPS for field in group
+}
+
+
+class LazyNormalizedTweet(Mapping):
+    """
+    Read-only mapping computing the fields of a normalized tweet on first
+    access, by groups of fields, and caching them. Since each group runs the
+    projected normalization anew, the whole normalized tweet is computed at
+    once as soon as a second group is needed, as well as when accessing keys
+    not belonging to `TWEET_FIELDS`, iterating over it or materializing it.
+
+    Args:
+        normalize (callable): function taking resolved fields, or `None` for
+            all of them, and the collection time of the tweet, and returning
+            the normalized tweet projected on those fields.
+        id (str): id of the tweet.
+        collected_via (list, optional): collection sources of the tweet.
+
+    """
+
+    __slots__ = (
+        "_normalize",
+        "_collection_time",
+        "_collected_via",
+        "_fields",
+        "_computed_groups",
+        "_materialized",
+    )
+
+    def __init__(self, normalize, id, collected_via=None):
+        self._normalize = normalize
+        self._collection_time = get_collection_time()
+        self._collected_via = collected_via
+        self._fields = {"id": id}
+        self._computed_groups = set()
+        self._materialized = None
+
+    def _compute(self, fields):
+        # NOTE: all groups share the collection time of the tweet
+        return self._normalize(fields, self._collection_time)
+
+    def _compute_all(self):
+        if self._materialized is None:
+            self._materialized = self._compute(None)
+            self._fields = None
+            self._computed_groups = None
+
+        return self._materialized
+
+    def materialize(self):
+        """
+        Returns the normalized tweet as a dict, exactly as produced by the
+        eager normalizers.
+        """
+        materialized = dict(self._compute_all())
+
+        if self._collected_via is not None:
+            materialized["collected_via"] = list(self._collected_via)
+
+        return materialized
+
+    def merge_collected_via(self, other):
+        if not other._collected_via:
+            return
+
+        new_collection_source = other._collected_via[0]
+
+        if self._collected_via is None:
+            self._collected_via = [new_collection_source]
+        elif new_collection_source not in self._collected_via:
+            self._collected_via.append(new_collection_source)
+
+    def __getitem__(self, key):
+        if key == "collected_via":
+            if self._collected_via is None:
+                raise KeyError(key)
+
+            return self._collected_via
+
+        if self._materialized is not None:
+            return self._materialized[key]
+
+        if key in self._fields:
+            return self._fields[key]
+
+        group = LAZY_FIELD_GROUP_BY_FIELD.get(key)
+
+        # NOTE: computing a second group would parse the payload once more,
+        # which quickly costs more than normalizing the whole tweet
+        if group is None or self._computed_groups:
+            return self._compute_all()[key]
+
+        self._fields.update(self._compute(group))
+        self._computed_groups.add(group)
+
+        return self._fields[key]
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.materialize())
+
+    def __repr__(self):
+        return "<%s id=%s>" % (self.__class__.__name__, self["id"])
@@ -7,10 +7,17 @@
 # analysable data.
 #
 import re
-from copy import deepcopy
+from functools import lru_cache
 from html import unescape
 
+from twitwi.constants import (
+    REFERENCED_TWEETS_CACHE_SIZE,
+    TWEET_FIELDS,
+    TWEET_FIELD_DEPENDENCIES,
+)
 from twitwi.exceptions import TwitterPayloadV2IncompleteIncludesError, TwitwiError
+from twitwi.lazy import LazyNormalizedTweet
+from twitwi.stats import NULL_STATS, resolve_stats
 from twitwi.utils import (
     get_collection_time,
     get_dates,
@@ -18,10 +25,16 @@ from twitwi.utils import (
     validate_payload_v2,
     custom_get_normalized_hostname,
     format_profile_url,
+    LRUCache,
 )
 
 CLEAN_RT_PATTERN = re.compile(r"^RT @\w+: ")
 
+# NOTE: matches the same items as splitting the text on runs of characters
+# which are neither word characters nor the item's marker and keeping the
+# parts starting with the marker, hashtags & mentions never overlapping
+HASHTAGS_AND_MENTIONS_PATTERN = re.compile(r"(?<![\w#])#+([\w#]*)|(?<![\w@])@+([\w@]*)")
+
 
 def format_rt_text(user, text):
     return "RT @%s: %s" % (user, text)
@@ -49,6 +62,61 @@ def extract_media_name_from_url(media_url):
     return media_url.rsplit("/", 1)[-1].split("?tag=", 1)[0]
 
 
+def expand_urls(text, replacements):
+    """
+    Function replacing shortened urls in a text by their expanded version, in
+    a single pass over the text using the indices of the entities. Urls whose
+    indices are missing or inconsistent with the text, e.g. when entities
+    were merged from a referenced tweet, are searched & replaced afterwards.
+
+    Args:
+        text (str): text to expand.
+        replacements (list): (url, expanded_url, start, end) tuples, with
+            `start` & `end` set to `None` when unknown.
+
+    Returns:
+        (str): the expanded text.
+
+    """
+    spans = []
+    unindexed = []
+
+    for url, expanded_url, start, end in replacements:
+        if (
+            start is not None
+            and end is not None
+            and 0 <= start
+            and end - start == len(url)
+            and text.startswith(url, start)
+        ):
+            spans.append((start, end, expanded_url))
+        else:
+            unindexed.append((url, expanded_url))
+
+    if spans:
+        spans.sort()
+
+        parts = []
+        last_end = 0
+
+        for start, end, expanded_url in spans:
+            # NOTE: several media can share the same url & indices
+            if start < last_end:
+                continue
+
+            parts.append(text[last_end:start])
+            parts.append(expanded_url)
+            last_end = end
+
+        parts.append(text[last_end:])
+        text = "".join(parts)
+
+    for url, expanded_url in unindexed:
+        text = text.replace(url, expanded_url)
+
+    return text
+
+
 def extract_items_from_text(text, char):
     splitter = re.compile(r"[^\w%s]+" % char)
 
@@ -61,12 +129,40 @@ def extract_items_from_text(text, char):
     )
 
 
+def extract_hashtags_and_mentions_from_text(text):
+    """
+    Function extracting, in a single pass, the sorted & deduplicated
+    lowercase hashtags and mentions found in a text, ignoring the author of
+    the retweeted tweet in retweets' text.
+
+    Returns:
+        (tuple): a (hashtags, mentions) tuple of lists.
+
+    """
+    hashtags = set()
+    mentions = set()
+
+    rt_match = CLEAN_RT_PATTERN.match(text)
+
+    for match in HASHTAGS_AND_MENTIONS_PATTERN.finditer(
+        text, rt_match.end() if rt_match is not None else 0
+    ):
+        hashtag, mention = match.groups()
+
+        if hashtag is not None:
+            hashtags.add(hashtag.lower())
+        else:
+            mentions.add(mention.lower())
+
+    return sorted(hashtags), sorted(mentions)
+
+
 def extract_hashtags_from_text(text):
-    return extract_items_from_text(text, "#")
+    return extract_hashtags_and_mentions_from_text(text)[0]
 
 
 def extract_mentions_from_text(text):
-    return extract_items_from_text(text, "@")
+    return extract_hashtags_and_mentions_from_text(text)[1]
 
 
 def resolve_entities(tweet, prefix, source_version: str = "v1"):
@@ -79,15 +175,16 @@ def resolve_entities(tweet, prefix, source_version: str = "v1"):
     status_key = "%s_%s" % (prefix, suffix)
     target = tweet[status_key]
 
+    # NOTE: entities are merged into new containers so that only the given
+    # tweet dict is mutated, and never the payload it was copied from
     for ent in ["entities", "extended_entities", "mediaDetails"]:
         if ent not in target:
             continue
         if isinstance(target[ent], dict):
-            tweet[ent] = tweet.get(ent, {})
+            merged = dict(tweet.get(ent, {}))
             for field in target[ent]:
-                tweet[ent][field] = tweet[ent].get(field, [])
-                if field in target[ent]:
-                    tweet[ent][field] += target[ent][field]
+                merged[field] = merged.get(field, []) + target[ent][field]
+            tweet[ent] = merged
         elif isinstance(target[ent], list):
             tweet[ent] = tweet.get(ent, []) + target[ent]
 
@@ -145,8 +242,131 @@ USER_META_FIELDS_IFRAME = [
 
 PLACE_META_FIELDS = ["country_code", "full_name", "place_type"]
 
+# Groups of fields whose computation can be skipped when projecting normalized
+# tweets on some fields, see `resolve_tweet_fields`
+DATE_FIELDS = {"timestamp_utc", "local_time"}
+USER_DATE_FIELDS = {"user_created_at", "user_timestamp_utc"}
+SOURCE_FIELDS = {"source_url", "source_name"}
+PLACE_FIELDS = {"place_country_code", "place_name", "place_type", "place_coordinates"}
+MEDIA_FIELDS = {"media_urls", "media_files", "media_types", "media_alt_texts"}
+MENTION_FIELDS = {"mentioned_names", "mentioned_ids"}
+ENTITY_FIELDS = {"text", "links", "hashtags"} | MENTION_FIELDS | MEDIA_FIELDS
+REPLY_FIELDS = {"to_username", "to_userid", "to_tweetid"}
+RETWEET_FIELDS = {"retweeted_user", "retweeted_user_id", "retweeted_timestamp_utc"}
+QUOTE_FIELDS = {"quoted_user", "quoted_user_id", "quoted_timestamp_utc"}
+
+# Fields needing the referenced tweets to be normalized
+FIELDS_USING_REFERENCED_TWEETS = (
+    {"text", "links", "retweet_count"} | RETWEET_FIELDS | QUOTE_FIELDS
+)
+
+# Fields computed by `grab_extra_meta`
+EXTRA_META_FIELDS = set(TWEET_FIELDS) - (
+    {
+        "id",
+        "text",
+        "url",
+        "links",
+        "domains",
+        "hashtags",
+        "quoted_id",
+        "retweeted_id",
+        "collection_time",
+        "collected_via",
+        "match_query",
+    }
+    | DATE_FIELDS
+    | MEDIA_FIELDS
+    | MENTION_FIELDS
+    | QUOTE_FIELDS
+    | RETWEET_FIELDS
+)
+
+TWEET_FIELDS_SET = set(TWEET_FIELDS)
+
+
+def resolve_tweet_fields(fields):
+    """
+    Function validating the fields on which normalized tweets are projected
+    and returning them along with the fields they depend on, as documented
+    by `TWEET_FIELD_DEPENDENCIES`. "id" is always included.
+
+    Returns:
+        (frozenset or None): the fields to compute, or None for all of them.
+
+    """
+    if fields is None:
+        return None
+
+    if isinstance(fields, str):
+        raise TypeError("fields should be an iterable of field names")
 
-def grab_extra_meta(source, result, locale=None, source_version: str = "v1"):
+    resolved = {"id"}
+    stack = list(fields)
+
+    while stack:
+        field = stack.pop()
+
+        if field not in TWEET_FIELDS_SET:
+            raise TypeError("unknown tweet field %r" % field)
+
+        if field in resolved:
+            continue
+
+        resolved.add(field)
+        stack.extend(TWEET_FIELD_DEPENDENCIES.get(field, []))
+
+    return frozenset(resolved)
+
+
+@lru_cache(maxsize=None)
+def get_referenced_tweet_fields(fields, referenced):
+    """
+    Function returning the fields to compute for the tweets referenced by a
+    tweet projected on the given fields, i.e. the same ones if they are to be
+    returned, or else only the ones needed by the referencing tweet.
+    """
+    if fields is None:
+        return None
+
+    referenced_fields = set(fields if referenced else fields & ENTITY_FIELDS)
+
+    if "text" in fields:
+        referenced_fields.update(
+            ["text", "url", "quoted_id", "quoted_user", "user_screen_name"]
+        )
+
+    if "links" in fields:
+        referenced_fields.update(["url", "quoted_id", "quoted_user"])
+
+    if "retweet_count" in fields:
+        referenced_fields.add("retweet_count")
+
+    if not fields.isdisjoint(RETWEET_FIELDS | QUOTE_FIELDS):
+        referenced_fields.update(["timestamp_utc", "user_id", "user_screen_name"])
+
+    return resolve_tweet_fields(referenced_fields)
+
+
+def wants(fields, names):
+    return fields is None or not fields.isdisjoint(names)
+
+
+def project(normalized_tweet, fields):
+    if fields is None:
+        return normalized_tweet
+
+    return {k: v for k, v in normalized_tweet.items() if k in fields}
+
+
+def grab_extra_meta(
+    source,
+    result,
+    locale=None,
+    source_version: str = "v1",
+    stats=NULL_STATS,
+    fields=None,
+):
     if source.get("coordinates"):
         result["coordinates"] = source["coordinates"]["coordinates"]
         result["lat"] = source["coordinates"]["coordinates"][1]
@@ -186,7 +406,11 @@ def grab_extra_meta(source, result, locale=None, source_version: str = "v1"):
         result["user_lists"] = source["user"].get("listed_count")
         result["user_image"] = source["user"]["profile_image_url_https"]
 
-    if "place" in source and source["place"] is not None:
+    if (
+        "place" in source
+        and source["place"] is not None
+        and wants(fields, PLACE_FIELDS)
+    ):
         for meta in PLACE_META_FIELDS:
             if meta in source["place"]:
                 key = "place_%s" % meta.replace("place_", "").replace("full_", "")
@@ -217,11 +441,15 @@ def grab_extra_meta(source, result, locale=None, source_version: str = "v1"):
                 pass
 
     if "user_created_at" in result:
-        result["user_timestamp_utc"], result["user_created_at"] = get_dates(
-            result["user_created_at"], locale
-        )
+        if wants(fields, USER_DATE_FIELDS):
+            with stats.stage("get_dates"):
+                result["user_timestamp_utc"], result["user_created_at"] = get_dates(
+                    result["user_created_at"], locale
+                )
+        else:
+            del result["user_created_at"]
 
-    if source.get("source"):
+    if source.get("source") and wants(fields, SOURCE_FIELDS):
         result["source_url"], result["source_name"] = (
             source["source"]
             .replace('<a href="', "")
@@ -239,13 +467,14 @@ def normalize_tweet(
     collection_source=None,
     pure=True,
     source_version: str = "v1",
+    stats=None,
+    fields=None,
+    lazy=False,
 ):
     """
     Function "normalizing" a tweet as returned by Twitter's API in order to
     cleanup and optimize some fields.
 
-    Note that this function mutates the argument to work.
-
     Args:
         tweet (dict): Tweet json dict from Twitter API.
         locale (pytz.timezone, optional): Timezone for date conversions.
@@ -255,10 +484,19 @@ def normalize_tweet(
             to `False`.
         collection_source (str, optional): string explaining how the tweet
             was collected. Defaults to `None`.
-        pure (bool, optional): whether to allow the function to mutate its
-            original argument. Default to `True`.
+        pure (bool, optional): kept for backward compatibility, the function
+            never mutates its argument. Default to `True`.
         source_version (str, optional): version of the Twitter payload. Must be
             either "v1" or "iframe". Default to "v1".
+        stats (NormalizationStats, optional): collector recording the time
+            spent in each normalization stage. Defaults to the one enabled
+            by `twitwi.stats.collect_stats`, if any.
+        fields (list, optional): names of the fields to compute, among
+            `TWEET_FIELDS`, the work needed by the other ones being skipped.
+            Defaults to `None`, meaning all of them.
+        lazy (bool, optional): whether to return `LazyNormalizedTweet`
+            mappings, computing their fields on first access, instead of
+            dicts. Cannot be combined with `fields`. Defaults to `False`.
 
     Returns:
         (dict or list): Either a single tweet dict or a list of tweet dicts if
@@ -270,14 +508,80 @@ def normalize_tweet(
     if source_version not in ["v1", "iframe"]:
         raise Exception("source should be one of v1 or iframe")
 
-    if pure:
-        tweet = deepcopy(tweet)
+    if lazy:
+        if fields is not None:
+            raise TypeError("fields cannot be combined with lazy")
+
+        results = lazy_normalize_tweet_tree(
+            tweet,
+            locale=locale,
+            collection_source=collection_source,
+            source_version=source_version,
+            stats=resolve_stats(stats),
+            referenced=extract_referenced_tweets,
+        )
+
+        if not extract_referenced_tweets:
+            return results[-1]
+
+        return results
+
+    results, _ = normalize_tweet_tree(
+        tweet,
+        locale=locale,
+        collection_source=collection_source,
+        source_version=source_version,
+        stats=resolve_stats(stats),
+        fields=resolve_tweet_fields(fields),
+        referenced=extract_referenced_tweets,
+    )
+
+    if not extract_referenced_tweets:
+        return results[-1]
+
+    return results
 
+
+def normalize_tweet_tree(
+    tweet,
+    locale=None,
+    collection_source=None,
+    source_version: str = "v1",
+    stats=NULL_STATS,
+    memo=None,
+    fields=None,
+    referenced=True,
+    collection_time=None,
+):
+    """
+    Function normalizing a tweet along with the tweets it references, without
+    mutating the given payload.
+
+    If a `memo` mapping is given, the referenced tweets are only normalized
+    once per id, collection source & fields, their results being stored in it.
+
+    If `fields` are given, as resolved by `resolve_tweet_fields`, only those
+    are computed, the referenced tweets being normalized only if `referenced`
+    is True or if they are needed to compute them. Referenced tweets may then
+    also hold the fields needed by the tweets referencing them.
+
+    If a `collection_time` is given, it is used for the given tweet instead of
+    asking the current collection clock.
+
+    Returns:
+        (tuple): the list of normalized tweets, the given one being last, and
+            the resolved tweet, i.e. a shallow copy of the payload merged with
+            its `extended_tweet` and the entities of the tweets it references.
+
+    """
     results = []
 
+    # NOTE: working on a shallow copy is enough since nested containers
+    # are only ever replaced, see `resolve_entities`
+    tweet = dict(tweet)
+
     if "extended_tweet" in tweet:
-        for field in tweet["extended_tweet"]:
-            tweet[field] = tweet["extended_tweet"][field]
+        tweet.update(tweet["extended_tweet"])
 
     text = tweet.get("full_text", tweet.get("text", ""))
 
@@ -296,6 +600,15 @@ def normalize_tweet(
     elif source_version == "iframe":
         quoted_status_key = "quoted_tweet"
 
+    rtweet = None
+    qtweet = None
+
+    normalize_referenced = referenced or wants(
+        fields, FIELDS_USING_REFERENCED_TWEETS | ENTITY_FIELDS
+    )
+    referenced_fields = get_referenced_tweet_fields(fields, referenced)
+    resolve_referenced_entities = wants(fields, ENTITY_FIELDS)
+
     if (
         "retweeted_status" in tweet
         and tweet["retweeted_status"]["id_str"] != tweet["id_str"]
@@ -304,22 +617,27 @@ def normalize_tweet(
         rtu = tweet["retweeted_status"]["user"]["screen_name"]
         rtuid = tweet["retweeted_status"]["user"]["id_str"]
 
-        nested = normalize_tweet(
-            tweet["retweeted_status"],
-            locale=locale,
-            extract_referenced_tweets=True,
-            collection_source="retweet",
-            pure=False,
-        )
+        if normalize_referenced:
+            with stats.stage("retweet"):
+                nested, tweet["retweeted_status"] = normalize_referenced_tweet(
+                    tweet["retweeted_status"],
+                    locale=locale,
+                    collection_source="retweet",
+                    stats=stats,
+                    memo=memo,
+                    fields=referenced_fields,
+                    referenced=referenced,
+                )
 
-        rtweet = nested[-1]
+            rtweet = nested[-1]
 
-        if extract_referenced_tweets:
             results.extend(nested)
 
-        rtime = rtweet["timestamp_utc"]
+            rtime = rtweet.get("timestamp_utc")
 
-        resolve_entities(tweet, "retweeted")
+        if resolve_referenced_entities:
+            with stats.stage("resolve_entities"):
+                resolve_entities(tweet, "retweeted")
 
     elif (
         quoted_status_key in tweet
@@ -329,27 +647,32 @@ def normalize_tweet(
         qtu = tweet[quoted_status_key]["user"]["screen_name"]
         qtuid = tweet[quoted_status_key]["user"]["id_str"]
 
-        nested = normalize_tweet(
-            tweet[quoted_status_key],
-            locale=locale,
-            extract_referenced_tweets=True,
-            collection_source="quote",
-            pure=False,
-            source_version=source_version,
-        )
+        if normalize_referenced:
+            with stats.stage("quote"):
+                nested, tweet[quoted_status_key] = normalize_referenced_tweet(
+                    tweet[quoted_status_key],
+                    locale=locale,
+                    collection_source="quote",
+                    source_version=source_version,
+                    stats=stats,
+                    memo=memo,
+                    fields=referenced_fields,
+                    referenced=referenced,
+                )
 
-        qtweet = nested[-1]
+            qtweet = nested[-1]
 
-        if extract_referenced_tweets:
             results.extend(nested)
 
-        if "quoted_status_permalink" in tweet:
-            qturl = tweet["quoted_status_permalink"]["expanded"]
-        else:
-            qturl = qtweet["url"]
-        qtime = qtweet["timestamp_utc"]
+            if "quoted_status_permalink" in tweet:
+                qturl = tweet["quoted_status_permalink"]["expanded"]
+            else:
+                qturl = qtweet.get("url")
+            qtime = qtweet.get("timestamp_utc")
 
-        resolve_entities(tweet, "quoted", source_version=source_version)
+        if resolve_referenced_entities:
+            with stats.stage("resolve_entities"):
+                resolve_entities(tweet, "quoted", source_version=source_version)
 
     medids = set()
     media_urls = []
@@ -361,62 +684,85 @@ def normalize_tweet(
     hashtags = set()
     mentions = {}
 
-    if "entities" in tweet or "extended_entities" in tweet:
-        source_id = rti or qti or tweet["id_str"]
+    with_text = wants(fields, ("text",))
+    with_links = wants(fields, ("links",))
+    with_media = wants(fields, MEDIA_FIELDS)
 
-        entities = []
+    with stats.stage("entities"):
+        if wants(fields, ENTITY_FIELDS) and (
+            "entities" in tweet or "extended_entities" in tweet
+        ):
+            source_id = rti or qti or tweet["id_str"]
 
-        if source_version == "v1":
-            entities += tweet.get("extended_entities", tweet["entities"]).get(
-                "media", []
-            )
-        elif source_version == "iframe":
-            entities += tweet.get("mediaDetails", [])
-        entities += tweet["entities"].get("urls", [])
+            entities = []
 
-        for entity in entities:
-            if "expanded_url" in entity and "url" in entity and entity["expanded_url"]:
-                try:
-                    text = text.replace(entity["url"], entity["expanded_url"])
-                except KeyError:
-                    pass
-
-            if "media_url" in entity or "media_url_https" in entity:
-                if "video_info" in entity:
-                    med_url = max(entity["video_info"]["variants"], key=get_bitrate)[
-                        "url"
-                    ]
-                else:
-                    med_url = entity["media_url_https"]
-
-                med_name = extract_media_name_from_url(med_url)
-
-                if med_name not in medids:
-                    medids.add(med_name)
-                    media_types.append(entity["type"])
-                    media_urls.append(med_url.split("?tag=")[0])
-                    media_files.append("%s_%s" % (source_id, med_name))
-                    media_alt_texts.append(entity.get("ext_alt_text") or "")
-
-            # NOTE: fun fact, Twitter is starting to break down and we cannot guarantee
-            # expanded_url exists anymore. It even crashes the website itself lol:
-            # https://x.com/lmerzeau/status/426318495450943488
-            elif "expanded_url" in entity:
-                normalized = custom_normalize_url(entity["expanded_url"])
-                links.add(normalized)
-
-        for hashtag in tweet["entities"].get("hashtags", []):
-            hashtags.add(hashtag["text"].lower())
-
-        for mention in tweet["entities"].get("user_mentions", []):
-            mentions[mention["screen_name"].lower()] = mention["id_str"]
-
-    if rtu:
-        text = format_rt_text(rtu, rtweet["text"])
-        if rtweet["quoted_id"]:
+            if source_version == "v1":
+                entities += tweet.get("extended_entities", tweet["entities"]).get(
+                    "media", []
+                )
+            elif source_version == "iframe":
+                entities += tweet.get("mediaDetails", [])
+            entities += tweet["entities"].get("urls", [])
+
+            replacements = []
+
+            for entity in entities:
+                if (
+                    with_text
+                    and "expanded_url" in entity
+                    and "url" in entity
+                    and entity["expanded_url"]
+                ):
+                    start, end = entity.get("indices") or (None, None)
+                    replacements.append(
+                        (entity["url"], entity["expanded_url"], start, end)
+                    )
+
+                if "media_url" in entity or "media_url_https" in entity:
+                    if not with_media:
+                        continue
+
+                    if "video_info" in entity:
+                        med_url = max(
+                            entity["video_info"]["variants"], key=get_bitrate
+                        )["url"]
+                    else:
+                        med_url = entity["media_url_https"]
+
+                    med_name = extract_media_name_from_url(med_url)
+
+                    if med_name not in medids:
+                        medids.add(med_name)
+                        media_types.append(entity["type"])
+                        media_urls.append(med_url.split("?tag=")[0])
+                        media_files.append("%s_%s" % (source_id, med_name))
+                        media_alt_texts.append(entity.get("ext_alt_text") or "")
+
+                # NOTE: fun fact, Twitter is starting to break down and we cannot guarantee
+                # expanded_url exists anymore. It even crashes the website itself lol:
+                # https://x.com/lmerzeau/status/426318495450943488
+                elif with_links and "expanded_url" in entity:
+                    normalized = custom_normalize_url(entity["expanded_url"])
+                    links.add(normalized)
+
+            if with_text:
+                text = expand_urls(text, replacements)
+
+            if wants(fields, ("hashtags",)):
+                for hashtag in tweet["entities"].get("hashtags", []):
+                    hashtags.add(hashtag["text"].lower())
+
+            if wants(fields, MENTION_FIELDS):
+                for mention in tweet["entities"].get("user_mentions", []):
+                    mentions[mention["screen_name"].lower()] = mention["id_str"]
+
+    if rtweet is not None:
+        if with_text:
+            text = format_rt_text(rtu, rtweet["text"])
+        if (with_text or with_links) and rtweet["quoted_id"]:
             qturl = format_tweet_url(rtweet["quoted_user"], rtweet["quoted_id"])
 
-    elif qtu:
+    elif qtweet is not None and with_text:
         text = format_qt_text(qtu, text, qtweet["text"], qturl)
 
     if qturl:
@@ -425,20 +771,37 @@ def normalize_tweet(
             if link.lower() == qturl_lc:
                 links.remove(link)
 
-    timestamp_utc, local_time = get_dates(
-        tweet["created_at"], locale, source=source_version
-    )
-    text = unescape(text)
+    timestamp_utc, local_time = None, None
+
+    if wants(fields, DATE_FIELDS):
+        with stats.stage("get_dates"):
+            timestamp_utc, local_time = get_dates(
+                tweet["created_at"], locale, source=source_version
+            )
+
+    if with_text:
+        text = unescape(text)
 
     if collection_source is None:
         collection_source = tweet.get("collection_source")
     links = sorted(links)
-    domains = [
-        custom_get_normalized_hostname(
-            link, normalize_amp=False, infer_redirection=False
-        )
-        for link in links
-    ]
+    domains = []
+
+    if wants(fields, ("domains",)):
+        domains = [custom_get_normalized_hostname(link) for link in links]
+
+    if hashtags:
+        hashtags = sorted(hashtags)
+
+    mentioned_names = sorted(mentions.keys())
+
+    if wants(fields, ("hashtags", "mentioned_names")) and (
+        not hashtags or not mentioned_names
+    ):
+        text_hashtags, text_mentions = extract_hashtags_and_mentions_from_text(text)
+        hashtags = hashtags or text_hashtags
+        mentioned_names = mentioned_names or text_mentions
+
     normalized_tweet = {
         "id": tweet["id_str"],
         "local_time": local_time,
@@ -460,32 +823,277 @@ def normalize_tweet(
         "links": links,
         "links_to_resolve": len(links) > 0,
         "domains": domains,
-        "hashtags": sorted(hashtags) if hashtags else extract_hashtags_from_text(text),
+        "hashtags": hashtags,
         "mentioned_ids": [mentions[m] for m in sorted(mentions.keys())],
-        "mentioned_names": sorted(mentions.keys())
-        if mentions
-        else extract_mentions_from_text(text),
-        "collection_time": get_collection_time(),
+        "mentioned_names": mentioned_names,
+        "collection_time": collection_time or get_collection_time(),
         "match_query": collection_source != "thread" and collection_source != "quote",
     }
 
     if collection_source is not None:
         normalized_tweet["collected_via"] = [collection_source]
 
-    grab_extra_meta(tweet, normalized_tweet, locale, source_version)
+    if wants(fields, EXTRA_META_FIELDS):
+        with stats.stage("grab_extra_meta"):
+            grab_extra_meta(
+                tweet, normalized_tweet, locale, source_version, stats, fields
+            )
 
-    if rtu and not normalized_tweet["retweet_count"]:
+    if (
+        rtu
+        and wants(fields, ("retweet_count",))
+        and not normalized_tweet["retweet_count"]
+    ):
         normalized_tweet["retweet_count"] = rtweet["retweet_count"]
 
-    results.append(normalized_tweet)
+    results.append(project(normalized_tweet, fields))
 
-    if not extract_referenced_tweets:
-        return results[0]
+    return results, tweet
+
+
+def lazy_normalize_tweet_tree(
+    tweet,
+    locale=None,
+    collection_source=None,
+    source_version: str = "v1",
+    stats=NULL_STATS,
+    referenced=True,
+):
+    """
+    Lazy counterpart of `normalize_tweet_tree`, returning `LazyNormalizedTweet`
+    mappings in the same order, the given tweet being last.
+    """
+    results = []
+
+    resolved_tweet = tweet
+
+    if "extended_tweet" in tweet:
+        resolved_tweet = {**tweet, **tweet["extended_tweet"]}
+
+    if referenced:
+        if source_version == "v1":
+            quoted_status_key = "quoted_status"
+        elif source_version == "iframe":
+            quoted_status_key = "quoted_tweet"
+
+        if (
+            "retweeted_status" in resolved_tweet
+            and resolved_tweet["retweeted_status"]["id_str"] != resolved_tweet["id_str"]
+        ):
+            results.extend(
+                lazy_normalize_tweet_tree(
+                    resolved_tweet["retweeted_status"],
+                    locale=locale,
+                    collection_source="retweet",
+                    stats=stats,
+                )
+            )
+        elif (
+            quoted_status_key in resolved_tweet
+            and resolved_tweet[quoted_status_key]["id_str"] != resolved_tweet["id_str"]
+        ):
+            results.extend(
+                lazy_normalize_tweet_tree(
+                    resolved_tweet[quoted_status_key],
+                    locale=locale,
+                    collection_source="quote",
+                    source_version=source_version,
+                    stats=stats,
+                )
+            )
+
+    def normalize(fields, collection_time):
+        normalized_tweets, _ = normalize_tweet_tree(
+            tweet,
+            locale=locale,
+            collection_source=collection_source,
+            source_version=source_version,
+            stats=stats,
+            fields=resolve_tweet_fields(fields),
+            referenced=False,
+            collection_time=collection_time,
+        )
+
+        return normalized_tweets[-1]
+
+    if collection_source is None:
+        collection_source = resolved_tweet.get("collection_source")
+
+    results.append(
+        LazyNormalizedTweet(
+            normalize,
+            resolved_tweet["id_str"],
+            collected_via=[collection_source]
+            if collection_source is not None
+            else None,
+        )
+    )
 
     return results
 
 
+def normalize_referenced_tweet(tweet, collection_source, memo=None, **kwargs):
+    if memo is None:
+        return normalize_tweet_tree(
+            tweet, collection_source=collection_source, **kwargs
+        )
+
+    key = (tweet["id_str"], collection_source, kwargs.get("fields"))
+    memoized = memo.get(key)
+
+    if memoized is None:
+        memoized = normalize_tweet_tree(
+            tweet, collection_source=collection_source, memo=memo, **kwargs
+        )
+        memo[key] = memoized
+
+    return memoized
+
+
+def copy_normalized_tweet(normalized_tweet):
+    """
+    Returns a copy of a memoized normalized tweet owning its lists, and whose
+    `collection_time` is the current one, so that consumers may freely
+    mutate it without corrupting the memo.
+    """
+    copied = {
+        k: list(v) if isinstance(v, list) else v for k, v in normalized_tweet.items()
+    }
+
+    if "collection_time" in copied:
+        copied["collection_time"] = get_collection_time()
+
+    return copied
+
+
+def merge_collected_via(earlier_normalized_tweet, normalized_tweet):
+    if isinstance(earlier_normalized_tweet, LazyNormalizedTweet):
+        earlier_normalized_tweet.merge_collected_via(normalized_tweet)
+        return
+
+    if "collected_via" not in normalized_tweet:
+        return
+
+    new_collection_source = normalized_tweet["collected_via"][0]
+
+    if "collected_via" not in earlier_normalized_tweet:
+        earlier_normalized_tweet["collected_via"] = [new_collection_source]
+    else:
+        if new_collection_source not in earlier_normalized_tweet["collected_via"]:
+            earlier_normalized_tweet["collected_via"].append(new_collection_source)
+
+
+def normalize_tweets(
+    tweets,
+    locale=None,
+    extract_referenced_tweets=False,
+    collection_source=None,
+    source_version: str = "v1",
+    cache_size: int = REFERENCED_TWEETS_CACHE_SIZE,
+    stats=None,
+    fields=None,
+):
+    """
+    Function lazily normalizing an iterable of tweets as returned by
+    Twitter's API (v1.1 or iframe), without normalizing the same referenced
+    tweet twice as long as it remains within the last `cache_size` ones.
+
+    When extracting referenced tweets, a tweet already yielded recently is
+    not yielded again and its `collected_via` field is completed, in place, on
+    the already yielded dict. The memoized referenced tweets are yielded as
+    copies, so that mutating them does not affect the next tweets.
+
+    Args:
+        tweets (iterable): Tweet json dicts from Twitter API.
+        locale (pytz.timezone, optional): Timezone for date conversions.
+        extract_referenced_tweets (bool, optional): Whether to also yield the
+            tweets referenced by the given ones. Defaults to `False`.
+        collection_source (str, optional): string explaining how the tweets
+            were collected. Defaults to `None`.
+        source_version (str, optional): version of the Twitter payloads. Must
+            be either "v1" or "iframe". Default to "v1".
+        cache_size (int, optional): number of referenced tweets memoized, and
+            of tweets remembered for deduplication. Defaults to
+            `REFERENCED_TWEETS_CACHE_SIZE`.
+        stats (NormalizationStats, optional): collector recording the time
+            spent in each normalization stage.
+        fields (list, optional): names of the fields to compute, see
+            `normalize_tweet`. Defaults to `None`, meaning all of them.
+
+    Returns:
+        (generator): normalized tweet dicts.
+
+    """
+    if source_version not in ["v1", "iframe"]:
+        raise Exception("source should be one of v1 or iframe")
+
+    return generate_normalized_tweets(
+        tweets,
+        locale,
+        extract_referenced_tweets,
+        collection_source,
+        source_version,
+        cache_size,
+        resolve_stats(stats),
+        resolve_tweet_fields(fields),
+    )
+
+
+def generate_normalized_tweets(
+    tweets,
+    locale,
+    extract_referenced_tweets,
+    collection_source,
+    source_version,
+    cache_size,
+    stats,
+    fields,
+):
+    memo = LRUCache(cache_size)
+    already_seen = LRUCache(cache_size)
+
+    for tweet in tweets:
+        normalized_tweets, _ = normalize_tweet_tree(
+            tweet,
+            locale=locale,
+            collection_source=collection_source,
+            source_version=source_version,
+            stats=stats,
+            memo=memo,
+            fields=fields,
+            referenced=extract_referenced_tweets,
+        )
+
+        if not extract_referenced_tweets:
+            yield normalized_tweets[-1]
+            continue
+
+        last = len(normalized_tweets) - 1
+
+        for i, normalized_tweet in enumerate(normalized_tweets):
+            k = int(normalized_tweet["id"])
+            earlier_normalized_tweet = already_seen.get(k)
+
+            if earlier_normalized_tweet is not None:
+                merge_collected_via(earlier_normalized_tweet, normalized_tweet)
+                continue
+
+            # NOTE: only the given tweet is not memoized
+            if i != last:
+                normalized_tweet = copy_normalized_tweet(normalized_tweet)
+
+            already_seen[k] = normalized_tweet
+
+            yield normalized_tweet
+
+
 def resolve_user_entities(user):
+    """
+    Returns a dict of the user's fields whose urls were expanded using its
+    entities, without mutating the given user.
+    """
+    resolved = {}
+
     if "entities" in user:
         for k in user["entities"]:
             if "urls" in user["entities"][k]:
@@ -493,7 +1101,11 @@ def resolve_user_entities(user):
                     if not url.get("expanded_url"):
                         continue
                     if k in user:
-                        user[k] = user[k].replace(url["url"], url["expanded_url"])
+                        resolved[k] = resolved.get(k, user[k]).replace(
+                            url["url"], url["expanded_url"]
+                        )
+
+    return resolved
 
 
 def normalize_user(user, locale=None, pure=True, v2=False):
@@ -501,23 +1113,21 @@ def normalize_user(user, locale=None, pure=True, v2=False):
     Function "normalizing" a user as returned by Twitter's API in order to
     cleanup and optimize some fields.
 
-    Note that this function mutates the argument to work.
-
     Args:
         user (dict): Twitter user json dict from Twitter API.
         locale (pytz.timezone, optional): Timezone for date conversions.
-        pure (bool, optional): whether to allow the function to mutate its
-            original argument. Default to `True`.
+        pure (bool, optional): kept for backward compatibility, the function
+            never mutates its argument. Default to `True`.
 
     Returns:
         dict: The normalized user.
 
     """
 
-    if pure:
-        user = deepcopy(user)
+    resolved = resolve_user_entities(user)
 
-    resolve_user_entities(user)
+    if resolved:
+        user = {**user, **resolved}
 
     timestamp_utc, local_time = get_dates(
         user["created_at"], locale, source="v2" if v2 else "v1"
@@ -573,6 +1183,59 @@ def includes_index(payload, key, index_key="id"):
     return {item[index_key]: item for item in payload["includes"].get(key, [])}
 
 
+# Indices of a payload's includes, as (name, includes key, index key) tuples
+INCLUDES_INDICES = [
+    ("users_by_screen_name", "users", "username"),
+    ("users_by_id", "users", "id"),
+    ("places_by_id", "places", "id"),
+    ("tweets_by_id", "tweets", "id"),
+    ("media_by_key", "media", "media_key"),
+]
+
+
+def index_includes_v2(payload):
+    return {
+        name: includes_index(payload, key, index_key=index_key)
+        for name, key, index_key in INCLUDES_INDICES
+    }
+
+
+def get_payload_v2_items(payload):
+    ## payload can contain just a single tweet
+    if isinstance(payload["data"], dict):
+        return [payload["data"]]
+
+    return payload["data"]
+
+
+class IncludesIndex(object):
+    """
+    Index of the includes of a payload, falling back to the bounded cache of
+    the includes of earlier payloads.
+    """
+
+    __slots__ = ("items", "cache")
+
+    def __init__(self, items, cache):
+        self.items = items
+        self.cache = cache
+
+    def __contains__(self, key):
+        return key in self.items or key in self.cache
+
+    def __getitem__(self, key):
+        try:
+            return self.items[key]
+        except KeyError:
+            return self.cache[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 def get_best_url(item):
     if "unwound_url" in item:
         return item["unwound_url"]
@@ -594,47 +1257,96 @@ def normalize_tweet_v2(
     locale=None,
     collection_source=None,
     extract_referenced_tweets=False,
+    stats=None,
+    fields=None,
+    referenced=True,
+    memo=None,
+    collection_time=None,
 ):
-    timestamp_utc, local_time = get_dates(
-        tweet["created_at"], locale=locale, source="v2"
-    )
+    stats = resolve_stats(stats)
+
+    if fields is not None and not isinstance(fields, frozenset):
+        fields = resolve_tweet_fields(fields)
+
+    timestamp_utc, local_time = None, None
+
+    if wants(fields, DATE_FIELDS):
+        with stats.stage("get_dates"):
+            timestamp_utc, local_time = get_dates(
+                tweet["created_at"], locale=locale, source="v2"
+            )
 
     try:
         user = users_by_id[tweet["author_id"]]
     except KeyError:
         raise TwitterPayloadV2IncompleteIncludesError("user", tweet["author_id"])
 
-    user_timestamp_utc, user_created_at = get_dates(
-        user["created_at"], locale=locale, source="v2"
+    with_user_dates = wants(fields, USER_DATE_FIELDS)
+    author_key = (
+        "author",
+        user["id"],
+        user["created_at"],
+        user.get("url"),
+        with_user_dates,
     )
-    user_entities = user.get("entities", {})
+    author = memo.get(author_key) if memo is not None else None
+
+    if author is None:
+        user_timestamp_utc, user_created_at = None, None
+
+        if with_user_dates:
+            with stats.stage("get_dates"):
+                user_timestamp_utc, user_created_at = get_dates(
+                    user["created_at"], locale=locale, source="v2"
+                )
+
+        user_entities = user.get("entities", {})
+        user_url = user.get("url")
+
+        if "url" in user_entities and "urls" in user_entities["url"]:
+            user_url_entity = user_entities["url"]["urls"][0]
+            user_url = get_best_url(user_url_entity) or user_url
+
+        author = (user_timestamp_utc, user_created_at, user_url)
+
+        if memo is not None:
+            memo[author_key] = author
+
+    user_timestamp_utc, user_created_at, user_url = author
 
     entities = tweet.get("entities", {})
     referenced_tweets = tweet.get("referenced_tweets", [])
 
-    hashtags = set()
+    with stats.stage("entities"):
+        hashtags = set()
 
-    for hashtag in entities.get("hashtags", []):
-        hashtags.add(hashtag["tag"])
+        if wants(fields, ("hashtags",)):
+            for hashtag in entities.get("hashtags", []):
+                hashtags.add(hashtag["tag"])
 
-    mentions = {}
+        mentions = {}
 
-    for mention in entities.get("mentions", []):
-        if "id" in mention:
-            mentions[mention["username"]] = mention["id"]
-        else:
-            try:
-                mentions[mention["username"]] = users_by_screen_name[
-                    mention["username"]
-                ]["id"]
-            except KeyError:
-                raise TwitterPayloadV2IncompleteIncludesError(
-                    "user", mention["username"]
-                )
+        mentions_data = entities.get("mentions", [])
+
+        if not wants(fields, MENTION_FIELDS):
+            mentions_data = []
+
+        for mention in mentions_data:
+            if "id" in mention:
+                mentions[mention["username"]] = mention["id"]
+            else:
+                try:
+                    mentions[mention["username"]] = users_by_screen_name[
+                        mention["username"]
+                    ]["id"]
+                except KeyError:
+                    raise TwitterPayloadV2IncompleteIncludesError(
+                        "user", mention["username"]
+                    )
 
     place_info = {}
 
-    if "geo" in tweet:
+    if "geo" in tweet and wants(fields, PLACE_FIELDS | {"lat", "lng"}):
         geo_data = tweet["geo"]
 
         if "coordinates" in geo_data:
@@ -669,7 +1381,7 @@ def normalize_tweet_v2(
     # Reply
     reply_info = {}
 
-    if "replied_to" in refs:
+    if "replied_to" in refs and wants(fields, REPLY_FIELDS):
         reply = tweets_by_id.get(refs["replied_to"], {})
         if "author_id" in reply:
             try:
@@ -683,6 +1395,11 @@ def normalize_tweet_v2(
         reply_info["to_userid"] = reply.get("author_id", "")
         reply_info["to_tweetid"] = reply.get("id", "")
 
+    normalize_referenced = referenced or wants(
+        fields, RETWEET_FIELDS | QUOTE_FIELDS | {"text"}
+    )
+    referenced_fields = get_referenced_tweet_fields(fields, referenced)
+
     # Retweet
     retweet_info = {}
     normalized_retweet = None
@@ -690,24 +1407,30 @@ def normalize_tweet_v2(
     if "retweeted" in refs:
         retweet_info["retweeted_id"] = refs["retweeted"]
 
-        if refs["retweeted"] in tweets_by_id:
+        if normalize_referenced and refs["retweeted"] in tweets_by_id:
             retweet = tweets_by_id[refs["retweeted"]]
-            normalized_retweet = normalize_tweet_v2(
-                retweet,
-                users_by_screen_name=users_by_screen_name,
-                places_by_id=places_by_id,
-                tweets_by_id=tweets_by_id,
-                users_by_id=users_by_id,
-                media_by_key=media_by_key,
-                locale=locale,
-                collection_source="retweet",
-            )
+            with stats.stage("retweet"):
+                normalized_retweet = normalize_referenced_tweet_v2(
+                    retweet,
+                    users_by_screen_name=users_by_screen_name,
+                    places_by_id=places_by_id,
+                    tweets_by_id=tweets_by_id,
+                    users_by_id=users_by_id,
+                    media_by_key=media_by_key,
+                    locale=locale,
+                    collection_source="retweet",
+                    stats=stats,
+                    fields=referenced_fields,
+                    referenced=referenced,
+                    memo=memo,
+                )
 
-            retweet_info["retweeted_user"] = normalized_retweet["user_screen_name"]
-            retweet_info["retweeted_user_id"] = normalized_retweet["user_id"]
-            retweet_info["retweeted_timestamp_utc"] = normalized_retweet[
+            # NOTE: those fields are missing when projected out
+            retweet_info["retweeted_user"] = normalized_retweet.get("user_screen_name")
+            retweet_info["retweeted_user_id"] = normalized_retweet.get("user_id")
+            retweet_info["retweeted_timestamp_utc"] = normalized_retweet.get(
                 "timestamp_utc"
-            ]
+            )
 
     # Quoted
     quote_info = {}
@@ -716,85 +1439,110 @@ def normalize_tweet_v2(
     if "quoted" in refs:
         quote_info["quoted_id"] = refs["quoted"]
 
-        if refs["quoted"] in tweets_by_id:
+        if normalize_referenced and refs["quoted"] in tweets_by_id:
             quote = tweets_by_id[refs["quoted"]]
-            normalized_quote = normalize_tweet_v2(
-                quote,
-                users_by_screen_name=users_by_screen_name,
-                places_by_id=places_by_id,
-                tweets_by_id=tweets_by_id,
-                users_by_id=users_by_id,
-                media_by_key=media_by_key,
-                locale=locale,
-                collection_source="quote",
-            )
+            with stats.stage("quote"):
+                normalized_quote = normalize_referenced_tweet_v2(
+                    quote,
+                    users_by_screen_name=users_by_screen_name,
+                    places_by_id=places_by_id,
+                    tweets_by_id=tweets_by_id,
+                    users_by_id=users_by_id,
+                    media_by_key=media_by_key,
+                    locale=locale,
+                    collection_source="quote",
+                    stats=stats,
+                    fields=referenced_fields,
+                    referenced=referenced,
+                    memo=memo,
+                )
 
-            quote_info["quoted_user"] = normalized_quote["user_screen_name"]
-            quote_info["quoted_user_id"] = normalized_quote["user_id"]
-            quote_info["quoted_timestamp_utc"] = normalized_quote["timestamp_utc"]
+            quote_info["quoted_user"] = normalized_quote.get("user_screen_name")
+            quote_info["quoted_user_id"] = normalized_quote.get("user_id")
+            quote_info["quoted_timestamp_utc"] = normalized_quote.get("timestamp_utc")
 
     # Replace urls in text
     links = set()
+    with_text = wants(fields, ("text",))
+    with_links = wants(fields, ("links",))
 
-    for url_data in entities.get("urls", []):
-        replacement_url = get_best_url(url_data)
+    with stats.stage("urls"):
+        replacements = []
 
-        if replacement_url:
-            text = text.replace(url_data["url"], replacement_url)
+        for url_data in entities.get("urls", []):
+            replacement_url = get_best_url(url_data)
 
-        if not replacement_url:
-            replacement_url = url_data["url"]
+            if replacement_url and with_text:
+                replacements.append(
+                    (
+                        url_data["url"],
+                        replacement_url,
+                        url_data.get("start"),
+                        url_data.get("end"),
+                    )
+                )
 
-        links.add(custom_normalize_url(replacement_url))
+            if with_links:
+                links.add(custom_normalize_url(replacement_url or url_data["url"]))
 
-    if normalized_retweet:
-        text = format_rt_text(
-            normalized_retweet["user_screen_name"], normalized_retweet["text"]
-        )
+        if with_text:
+            text = expand_urls(text, replacements)
 
-    if normalized_quote:
-        text = format_qt_text(
-            normalized_quote["user_screen_name"],
-            text,
-            normalized_quote["text"],
-            normalized_quote["url"],
-        )
+    if with_text:
+        if normalized_retweet:
+            text = format_rt_text(
+                normalized_retweet["user_screen_name"], normalized_retweet["text"]
+            )
+
+        if normalized_quote:
+            text = format_qt_text(
+                normalized_quote["user_screen_name"],
+                text,
+                normalized_quote["text"],
+                normalized_quote["url"],
+            )
+
+        text = unescape(text)
 
     # Metrics
     is_retweet = "retweeted" in refs
     public_metrics = tweet["public_metrics"]
     user_public_metrics = user["public_metrics"]
 
-    user_url = user.get("url")
-
-    if "url" in user_entities and "urls" in user_entities["url"]:
-        user_url_entity = user_entities["url"]["urls"][0]
-        user_url = get_best_url(user_url_entity) or user_url
-
     # Media
     medias = []
 
-    if "attachments" in tweet and "media_keys" in tweet["attachments"]:
-        source_id = refs.get("retweeted_id", tweet["id"])
-
-        for media_key in tweet["attachments"]["media_keys"]:
-            if media_key in media_by_key:
-                try:
-                    media_data = media_by_key[media_key]
-                except KeyError:
-                    raise TwitterPayloadV2IncompleteIncludesError("media", media_key)
-
-                if "variants" in media_data:
-                    media_url = max(media_data["variants"], key=get_bitrate_v2)["url"]
-                else:
-                    media_url = media_data.get("url", "")
-                medias.append(
-                    (
-                        media_url,
-                        "%s_%s" % (source_id, extract_media_name_from_url(media_url)),
-                        media_data["type"],
+    with stats.stage("media"):
+        if (
+            "attachments" in tweet
+            and "media_keys" in tweet["attachments"]
+            and wants(fields, MEDIA_FIELDS)
+        ):
+            source_id = refs.get("retweeted_id", tweet["id"])
+
+            for media_key in tweet["attachments"]["media_keys"]:
+                if media_key in media_by_key:
+                    try:
+                        media_data = media_by_key[media_key]
+                    except KeyError:
+                        raise TwitterPayloadV2IncompleteIncludesError(
+                            "media", media_key
+                        )
+
+                    if "variants" in media_data:
+                        media_url = max(media_data["variants"], key=get_bitrate_v2)[
+                            "url"
+                        ]
+                    else:
+                        media_url = media_data.get("url", "")
+                    medias.append(
+                        (
+                            media_url,
+                            "%s_%s"
+                            % (source_id, extract_media_name_from_url(media_url)),
+                            media_data["type"],
+                        )
                     )
-                )
 
     if collection_source is None:
         collection_source = tweet.get("collection_source")
@@ -805,12 +1553,12 @@ def normalize_tweet_v2(
         "id": tweet["id"],
         "local_time": local_time,
         "timestamp_utc": timestamp_utc,
-        "text": unescape(text),
+        "text": text,
         "url": format_tweet_url(user["username"], tweet["id"]),
         "hashtags": sorted(hashtags),
         "mentioned_names": sorted_mentions,
         "mentioned_ids": [mentions[k] for k in sorted_mentions],
-        "collection_time": get_collection_time(),
+        "collection_time": collection_time or get_collection_time(),
         "user_id": user["id"],
         "user_screen_name": user["username"],
         "user_name": user["name"],
@@ -847,6 +1595,8 @@ def normalize_tweet_v2(
     if collection_source is not None:
         normalized_tweet["collected_via"] = [collection_source]
 
+    normalized_tweet = project(normalized_tweet, fields)
+
     if extract_referenced_tweets:
         normalized_tweets = [normalized_tweet]
 
@@ -861,42 +1611,123 @@ def normalize_tweet_v2(
     return normalized_tweet
 
 
+def lazy_normalize_tweet_v2(
+    tweet, *, tweets_by_id, locale=None, collection_source=None, stats=None, **indices
+):
+    """
+    Lazy counterpart of `normalize_tweet_v2` extracting referenced tweets,
+    returning `LazyNormalizedTweet` mappings in the same order. Incomplete
+    includes are only reported when the fields needing them are accessed.
+    """
+
+    def lazy_normalize(tweet, collection_source):
+        def normalize(fields, collection_time):
+            return normalize_tweet_v2(
+                tweet,
+                tweets_by_id=tweets_by_id,
+                locale=locale,
+                collection_source=collection_source,
+                stats=stats,
+                fields=resolve_tweet_fields(fields),
+                referenced=False,
+                collection_time=collection_time,
+                **indices,
+            )
+
+        if collection_source is None:
+            collection_source = tweet.get("collection_source")
+
+        return LazyNormalizedTweet(
+            normalize,
+            tweet["id"],
+            collected_via=[collection_source]
+            if collection_source is not None
+            else None,
+        )
+
+    normalized_tweets = [lazy_normalize(tweet, collection_source)]
+
+    refs = {t["type"]: t["id"] for t in tweet.get("referenced_tweets", [])}
+
+    if refs.get("retweeted") in tweets_by_id:
+        normalized_tweets.append(
+            lazy_normalize(tweets_by_id[refs["retweeted"]], "retweet")
+        )
+
+    if refs.get("quoted") in tweets_by_id:
+        normalized_tweets.append(lazy_normalize(tweets_by_id[refs["quoted"]], "quote"))
+
+    return normalized_tweets
+
+
+def normalize_referenced_tweet_v2(tweet, collection_source, memo=None, **kwargs):
+    if memo is None:
+        return normalize_tweet_v2(tweet, collection_source=collection_source, **kwargs)
+
+    key = (tweet["id"], collection_source, kwargs.get("fields"))
+    memoized = memo.get(key)
+
+    if memoized is None:
+        memoized = normalize_tweet_v2(
+            tweet, collection_source=collection_source, memo=memo, **kwargs
+        )
+        memo[key] = memoized
+
+    return memoized
+
+
 def normalize_tweets_payload_v2(
-    payload, locale=None, extract_referenced_tweets=False, collection_source=None
+    payload,
+    locale=None,
+    extract_referenced_tweets=False,
+    collection_source=None,
+    stats=None,
+    fields=None,
+    lazy=False,
 ):
     if not validate_payload_v2(payload):
         raise TypeError("given value is not a Twitter API v2 payload")
 
+    if lazy and fields is not None:
+        raise TypeError("fields cannot be combined with lazy")
+
+    fields = resolve_tweet_fields(fields)
+
     if "data" not in payload:
         return []
 
-    users_by_screen_name = includes_index(payload, "users", index_key="username")
-    users_by_id = includes_index(payload, "users")
-    places_by_id = includes_index(payload, "places")
-    tweets_by_id = includes_index(payload, "tweets")
-    media_by_key = includes_index(payload, "media", index_key="media_key")
+    stats = resolve_stats(stats)
+
+    with stats.stage("includes_index"):
+        indices = index_includes_v2(payload)
 
     output = []
     already_seen = {}
 
-    ## payload can contain just a single tweet
-    if isinstance(payload["data"], dict):
-        items = [payload["data"]]
-    elif isinstance(payload["data"], list):
-        items = payload["data"]
-
-    for item in items:
-        normalized_tweets = normalize_tweet_v2(
-            item,
-            users_by_id=users_by_id,
-            users_by_screen_name=users_by_screen_name,
-            places_by_id=places_by_id,
-            tweets_by_id=tweets_by_id,
-            media_by_key=media_by_key,
-            locale=locale,
-            collection_source=collection_source,
-            extract_referenced_tweets=True,
-        )
+    # NOTE: referenced tweets & authors are only normalized once per payload
+    memo = {}
+
+    for item in get_payload_v2_items(payload):
+        if lazy:
+            normalized_tweets = lazy_normalize_tweet_v2(
+                item,
+                locale=locale,
+                collection_source=collection_source,
+                stats=stats,
+                **indices,
+            )
+        else:
+            normalized_tweets = normalize_tweet_v2(
+                item,
+                locale=locale,
+                collection_source=collection_source,
+                extract_referenced_tweets=True,
+                stats=stats,
+                fields=fields,
+                referenced=extract_referenced_tweets,
+                memo=memo,
+                **indices,
+            )
 
         if extract_referenced_tweets:
             for normalized_tweet in normalized_tweets:
@@ -904,22 +1735,7 @@ def normalize_tweets_payload_v2(
                 earlier_normalized_tweet = already_seen.get(k)
 
                 if earlier_normalized_tweet is not None:
-                    if "collected_via" in normalized_tweet:
-                        new_collection_source = normalized_tweet["collected_via"][0]
-
-                        if "collected_via" not in earlier_normalized_tweet:
-                            earlier_normalized_tweet["collected_via"] = [
-                                new_collection_source
-                            ]
-                        else:
-                            if (
-                                new_collection_source
-                                not in earlier_normalized_tweet["collected_via"]
-                            ):
-                                earlier_normalized_tweet["collected_via"].append(
-                                    new_collection_source
-                                )
-
+                    merge_collected_via(earlier_normalized_tweet, normalized_tweet)
                     continue
 
                 already_seen[k] = normalized_tweet
@@ -929,3 +1745,109 @@ def normalize_tweets_payload_v2(
             output.append(normalized_tweets[0])
 
     return output
+
+
+class PayloadV2Normalizer(object):
+    """
+    Stateful normalizer fed with the successive pages of a paginated Twitter
+    API v2 collection, such as search or timeline results.
+
+    The includes of the pages, as well as the normalized referenced tweets
+    and authors, are kept in bounded caches evicting the least recently used
+    ones, so that they are reused by the next pages. Tweets are deduplicated
+    across the whole pagination, as long as they remain within the last
+    `cache_size` ones. Yielded tweets are never modified afterwards, the
+    memoized referenced tweets being yielded as copies with a fresh
+    `collection_time`.
+
+    Args:
+        locale (pytz.timezone, optional): Timezone for date conversions.
+        extract_referenced_tweets (bool, optional): Whether to also yield the
+            tweets referenced by the pages' tweets. Defaults to `False`.
+        collection_source (str, optional): string explaining how the tweets
+            were collected. Defaults to `None`.
+        cache_size (int, optional): number of items of each kind of includes,
+            of normalized referenced tweets & authors, and of tweets
+            remembered for deduplication. Defaults to
+            `REFERENCED_TWEETS_CACHE_SIZE`.
+        stats (NormalizationStats, optional): collector recording the time
+            spent in each normalization stage.
+        fields (list, optional): names of the fields to compute, see
+            `normalize_tweet`. Defaults to `None`, meaning all of them.
+
+    """
+
+    def __init__(
+        self,
+        locale=None,
+        extract_referenced_tweets=False,
+        collection_source=None,
+        cache_size: int = REFERENCED_TWEETS_CACHE_SIZE,
+        stats=None,
+        fields=None,
+    ):
+        self.locale = locale
+        self.extract_referenced_tweets = extract_referenced_tweets
+        self.collection_source = collection_source
+        self.stats = resolve_stats(stats)
+        self.fields = resolve_tweet_fields(fields)
+
+        self.includes = {name: LRUCache(cache_size) for name, _, _ in INCLUDES_INDICES}
+        self.memo = LRUCache(cache_size)
+        self.already_seen = LRUCache(cache_size)
+
+    def feed(self, payload):
+        """
+        Method indexing the includes of the given page and returning a
+        generator of its normalized tweets, those already yielded for earlier
+        pages being skipped.
+        """
+        if not validate_payload_v2(payload):
+            raise TypeError("given value is not a Twitter API v2 payload")
+
+        with self.stats.stage("includes_index"):
+            indices = {}
+
+            for name, items in index_includes_v2(payload).items():
+                cache = self.includes[name]
+                cache.update(items)
+
+                # NOTE: the page's own includes are looked up first, so that
+                # they cannot be evicted before being used
+                indices[name] = IncludesIndex(items, cache)
+
+        if "data" not in payload:
+            return iter(())
+
+        return self.generate(get_payload_v2_items(payload), indices)
+
+    def generate(self, items, indices):
+        for item in items:
+            normalized_tweets = normalize_tweet_v2(
+                item,
+                locale=self.locale,
+                collection_source=self.collection_source,
+                extract_referenced_tweets=True,
+                stats=self.stats,
+                fields=self.fields,
+                referenced=self.extract_referenced_tweets,
+                memo=self.memo,
+                **indices,
+            )
+
+            if not self.extract_referenced_tweets:
+                normalized_tweets = normalized_tweets[:1]
+
+            for i, normalized_tweet in enumerate(normalized_tweets):
+                k = int(normalized_tweet["id"])
+
+                if self.already_seen.get(k) is not None:
+                    continue
+
+                self.already_seen[k] = True
+
+                # NOTE: only the item's own tweet is not memoized
+                if i != 0:
+                    normalized_tweet = copy_normalized_tweet(normalized_tweet)
+
+                yield normalized_tweet
@@ -0,0 +1,185 @@
+# =============================================================================
+# Twitwi Parallel Normalization
+# =============================================================================
+#
+# Process pool spreading the normalization of many payloads over several
+# cores. Payloads are sent to the workers in chunks, at most a few chunks per
+# worker being in flight at any time so that lazy inputs are consumed with
+# bounded memory, and errors are sent back as values so that a single broken
+# payload does not kill the whole pool.
+#
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+
+from twitwi.constants import PARALLEL_CHUNK_SIZE
+from twitwi.exceptions import PayloadNormalizationError, TwitwiError
+from twitwi.normalizers import (
+    normalize_tweet,
+    normalize_user,
+    normalize_tweets_payload_v2,
+)
+from twitwi.bluesky.normalizers import (
+    normalize_profile,
+    normalize_partial_profile,
+    normalize_post,
+    normalize_partial_post,
+)
+from twitwi.utils import get_collection_clock, set_collection_clock
+
+NORMALIZERS = {
+    "tweet": normalize_tweet,
+    "user": normalize_user,
+    "tweets_payload_v2": normalize_tweets_payload_v2,
+    "post": normalize_post,
+    "partial_post": normalize_partial_post,
+    "profile": normalize_profile,
+    "partial_profile": normalize_partial_profile,
+}
+
+# Number of chunks per worker submitted in advance
+PENDING_CHUNKS_PER_WORKER = 2
+
+
+def ensure_picklable_error(error):
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return TwitwiError(repr(error))
+
+    return error
+
+
+def normalize_chunk(kind, kwargs, start, chunk):
+    normalize = NORMALIZERS[kind]
+    results = []
+
+    for index, payload in enumerate(chunk, start):
+        try:
+            result = normalize(payload, **kwargs)
+        except Exception as e:
+            result = PayloadNormalizationError(index, ensure_picklable_error(e))
+
+        results.append(result)
+
+    return results
+
+
+def iter_chunks(payloads, chunksize):
+    iterator = iter(payloads)
+    start = 0
+
+    while True:
+        chunk = list(islice(iterator, chunksize))
+
+        if not chunk:
+            return
+
+        yield start, chunk
+
+        start += len(chunk)
+
+
+def normalize_many(
+    payloads,
+    kind: str = "tweet",
+    workers=None,
+    chunksize: int = PARALLEL_CHUNK_SIZE,
+    ordered: bool = True,
+    **kwargs,
+):
+    """
+    Function normalizing an iterable of payloads using a pool of processes.
+
+    The collection clock of the calling process is used by the workers, but
+    stats cannot be collected across processes.
+
+    Args:
+        payloads (iterable): payloads to normalize, possibly lazy.
+        kind (str, optional): kind of the payloads, one of "tweet", "user",
+            "tweets_payload_v2", "post", "partial_post", "profile" or
+            "partial_profile". Defaults to "tweet".
+        workers (int, optional): number of processes. Defaults to the number
+            of cores. With 1 worker, payloads are normalized in the current
+            process.
+        chunksize (int, optional): number of payloads sent to a worker at
+            once. Defaults to `PARALLEL_CHUNK_SIZE`.
+        ordered (bool, optional): whether to yield the results in the order
+            of the payloads. If `False`, results are yielded as soon as they
+            are ready, as `(index, result)` tuples. Defaults to `True`.
+        **kwargs: arguments passed to the normalizer.
+
+    Returns:
+        (generator): the normalizer's results, or a `PayloadNormalizationError`
+            instance for each payload that could not be normalized.
+
+    """
+    if kind not in NORMALIZERS:
+        raise ValueError("kind should be one of %s" % ", ".join(NORMALIZERS))
+
+    if chunksize < 1:
+        raise ValueError("chunksize should be positive")
+
+    if "stats" in kwargs:
+        raise TypeError("stats cannot be collected by normalize_many")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("workers should be positive")
+
+    if workers == 1:
+        generator = generate_normalized_inline(payloads, kind, chunksize, kwargs)
+    else:
+        generator = generate_normalized_in_pool(
+            payloads, kind, workers, chunksize, ordered, kwargs
+        )
+
+    if ordered:
+        return (result for _, result in generator)
+
+    return generator
+
+
+def generate_normalized_inline(payloads, kind, chunksize, kwargs):
+    for start, chunk in iter_chunks(payloads, chunksize):
+        yield from enumerate(normalize_chunk(kind, kwargs, start, chunk), start)
+
+
+def generate_normalized_in_pool(payloads, kind, workers, chunksize, ordered, kwargs):
+    max_pending = workers * PENDING_CHUNKS_PER_WORKER
+    chunks = iter_chunks(payloads, chunksize)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=set_collection_clock,
+        initargs=(get_collection_clock(),),
+    ) as executor:
+        # NOTE: futures are kept in submission order, and the results of
+        # whichever chunk is done first are yielded when unordered
+        pending = deque()
+
+        def submit():
+            for start, chunk in islice(chunks, max_pending - len(pending)):
+                future = executor.submit(normalize_chunk, kind, kwargs, start, chunk)
+                future.start = start
+                pending.append(future)
+
+        submit()
+
+        while pending:
+            if ordered:
+                future = pending[0]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(iter(done))
+
+            pending.remove(future)
+            results = future.result()
+
+            submit()
+
+            yield from enumerate(results, future.start)
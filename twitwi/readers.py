@@ -0,0 +1,747 @@
+# =============================================================================
+# Twitwi Payload Readers
+# =============================================================================
+#
+# Generators reading JSONL files of raw payloads, one payload per line, and
+# lazily yielding their normalized versions. Files are read line by line
+# through large buffers, so that memory usage does not depend on their size,
+# and gzip, bz2 & xz compressed files are transparently decompressed.
+#
+# Huge API v2 payloads, stored as a single JSON document, are also streamed:
+# their includes are decoded at once, but their tweets one at a time.
+#
+# CSV exports of normalized records, as written by the formatters, can also be
+# read back as typed records, decoding each column with a function resolved
+# once from the header.
+#
+import io
+import re
+import csv
+import bz2
+import gzip
+import json
+import lzma
+from contextlib import contextmanager
+from functools import partial
+
+from twitwi.constants import (
+    TWEET_FIELDS,
+    TWEET_PLURAL_FIELDS,
+    TWEET_BOOLEAN_FIELDS,
+    TWEET_INTEGER_FIELDS,
+    TWEET_FLOAT_FIELDS,
+    USER_FIELDS,
+    USER_PLURAL_FIELDS,
+    USER_BOOLEAN_FIELDS,
+    USER_INTEGER_FIELDS,
+    READ_BUFFER_SIZE,
+    REFERENCED_TWEETS_CACHE_SIZE,
+)
+from twitwi.exceptions import PayloadLineError
+from twitwi.normalizers import (
+    normalize_tweet,
+    normalize_user,
+    normalize_tweets_payload_v2,
+    index_includes_v2,
+    PayloadV2Normalizer,
+)
+
+ON_ERROR_MODES = ["raise", "skip", "collect"]
+
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+COMPRESSION_MAGIC_NUMBERS = [
+    (b"\x1f\x8b", lambda f: gzip.GzipFile(fileobj=f, mode="rb")),
+    (b"BZh", lambda f: bz2.BZ2File(f, mode="rb")),
+    (b"\xfd7zXZ\x00", lambda f: lzma.LZMAFile(f, mode="rb")),
+]
+
+
+@contextmanager
+def open_payloads_file(path_or_file, buffer_size: int = READ_BUFFER_SIZE, newline=None):
+    """
+    Context manager opening the given path or file object as a text stream,
+    decompressing it if needed. File objects given by the caller are left
+    open. The `newline` argument is given to the text wrapper, and should be
+    "" for csv files.
+    """
+    if isinstance(path_or_file, io.TextIOBase):
+        yield path_or_file
+        return
+
+    owned = not hasattr(path_or_file, "read")
+
+    if owned:
+        f = open(path_or_file, "rb", buffering=buffer_size)
+    elif hasattr(path_or_file, "peek"):
+        f = path_or_file
+    else:
+        f = io.BufferedReader(path_or_file, buffer_size)
+
+    layers = [f]
+
+    try:
+        magic = f.peek(6)[:6]
+
+        for magic_number, decompressor in COMPRESSION_MAGIC_NUMBERS:
+            if magic.startswith(magic_number):
+                layers.append(decompressor(f))
+                break
+
+        text_file = io.TextIOWrapper(layers[-1], encoding="utf-8", newline=newline)
+        layers.append(text_file)
+
+        yield text_file
+
+    finally:
+        if owned:
+            layers[-1].close()
+
+            # NOTE: decompressors do not close the file they were given
+            f.close()
+        else:
+            # NOTE: detaching wrappers so that the caller's file is not closed
+            for layer in reversed(layers):
+                if layer is path_or_file:
+                    break
+
+                if isinstance(layer, (io.TextIOWrapper, io.BufferedReader)):
+                    layer.detach()
+                else:
+                    layer.close()
+
+
+def validate_on_error(on_error, errors):
+    if on_error not in ON_ERROR_MODES:
+        raise ValueError("on_error should be one of %s" % ", ".join(ON_ERROR_MODES))
+
+    if on_error == "collect" and errors is None:
+        raise TypeError('an errors list must be given when on_error="collect"')
+
+
+def iter_normalized(
+    path_or_file,
+    normalize,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily applying the given normalizer to each payload found in
+    a JSONL file and yielding the normalized records, lists returned by the
+    normalizer being flattened.
+
+    Args:
+        path_or_file (str or file): path or file object of the JSONL file,
+            possibly gzip, bz2 or xz compressed.
+        normalize (callable): function taking a payload and returning a
+            normalized record or a list of normalized records.
+        on_error (str, optional): what to do when a line cannot be parsed
+            or normalized: "raise" a `PayloadLineError`, "skip" the line, or
+            "collect" the errors into the `errors` list. Defaults to "raise".
+        errors (list, optional): list receiving the `PayloadLineError`
+            instances when `on_error` is "collect".
+        buffer_size (int, optional): size of the read buffer in bytes.
+            Defaults to `READ_BUFFER_SIZE`.
+
+    Returns:
+        (generator): normalized records.
+
+    """
+    validate_on_error(on_error, errors)
+
+    return generate_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def generate_normalized(path_or_file, normalize, on_error, errors, buffer_size):
+    with open_payloads_file(path_or_file, buffer_size) as f:
+        for i, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+
+            try:
+                result = normalize(json.loads(line))
+            except Exception as e:
+                error = PayloadLineError(i, line, e)
+
+                if on_error == "raise":
+                    raise error from e
+
+                if on_error == "collect":
+                    errors.append(error)
+
+                continue
+
+            if isinstance(result, list):
+                yield from result
+            else:
+                yield result
+
+
+def iter_normalized_tweets(
+    path_or_file,
+    locale=None,
+    extract_referenced_tweets=False,
+    collection_source=None,
+    source_version: str = "v1",
+    on_error: str = "raise",
+    errors=None,
+    stats=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the tweets (API v1.1 or iframe) of a JSONL
+    file. See `iter_normalized` & `normalize_tweet` for the arguments.
+    """
+    if source_version not in ["v1", "iframe"]:
+        raise Exception("source should be one of v1 or iframe")
+
+    normalize = partial(
+        normalize_tweet,
+        locale=locale,
+        extract_referenced_tweets=extract_referenced_tweets,
+        collection_source=collection_source,
+        source_version=source_version,
+        stats=stats,
+    )
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def iter_normalized_tweets_payloads_v2(
+    path_or_file,
+    locale=None,
+    extract_referenced_tweets=False,
+    collection_source=None,
+    on_error: str = "raise",
+    errors=None,
+    stats=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the tweets of a JSONL file of API v2 payloads,
+    one page per line. See `iter_normalized` & `normalize_tweets_payload_v2`
+    for the arguments.
+    """
+    normalize = partial(
+        normalize_tweets_payload_v2,
+        locale=locale,
+        extract_referenced_tweets=extract_referenced_tweets,
+        collection_source=collection_source,
+        stats=stats,
+    )
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+def iter_normalized_users(
+    path_or_file,
+    locale=None,
+    v2=False,
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the users of a JSONL file. See
+    `iter_normalized` & `normalize_user` for the arguments.
+    """
+    normalize = partial(normalize_user, locale=locale, v2=v2)
+
+    return iter_normalized(path_or_file, normalize, on_error, errors, buffer_size)
+
+
+class JSONStreamScanner(object):
+    """
+    Minimal incremental scanner of a JSON document read from a text stream,
+    decoding its values one at a time, using the standard library's decoder,
+    so that only the value being decoded needs to be held in memory.
+    """
+
+    def __init__(self, f, buffer_size: int = READ_BUFFER_SIZE):
+        self.f = f
+        self.buffer_size = buffer_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+
+    def tell(self):
+        """Number of characters consumed so far."""
+        return self.offset + self.pos
+
+    def fill(self, size):
+        chunk = self.f.read(size)
+
+        if not chunk:
+            self.eof = True
+            return
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+    def peek(self):
+        while True:
+            self.pos = WHITESPACE_PATTERN.match(self.buffer, self.pos).end()
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if self.eof:
+                return ""
+
+            self.fill(self.buffer_size)
+
+    def expect(self, chars):
+        char = self.peek()
+
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                "Expecting one of %r" % chars, self.buffer, self.pos
+            )
+
+        self.pos += 1
+
+        return char
+
+    def decode(self):
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # NOTE: a number ending the buffer may be truncated
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+
+            # NOTE: reading at least as much as what is already buffered, so
+            # that decoding large values remains linear
+            self.fill(max(self.buffer_size, len(self.buffer) - self.pos))
+
+    def iter_items(self):
+        """
+        Yields the items of the array about to be scanned, or the value
+        itself if it is not an array.
+        """
+        if self.peek() != "[":
+            yield self.decode()
+            return
+
+        self.pos += 1
+
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.decode()
+
+            if self.expect(",]") == "]":
+                return
+
+
+def skip_chars(f, n, buffer_size):
+    while n > 0:
+        chunk = f.read(min(n, buffer_size))
+
+        if not chunk:
+            return
+
+        n -= len(chunk)
+
+
+def iter_normalized_large_payload_v2(
+    path_or_file,
+    locale=None,
+    extract_referenced_tweets=False,
+    collection_source=None,
+    cache_size: int = REFERENCED_TWEETS_CACHE_SIZE,
+    stats=None,
+    fields=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily normalizing the tweets of a single, possibly huge, Twitter
+    API v2 payload stored as one JSON document. Its includes are decoded
+    first, then its tweets are decoded and normalized one at a time, so that
+    memory usage depends on the size of the includes rather than of the whole
+    payload.
+
+    When the tweets come before the includes, as returned by the API, the
+    file is read twice, its tweets being skipped the first time. A file
+    object must then be seekable.
+
+    Tweets are deduplicated as done by `PayloadV2Normalizer`. See
+    `normalize_tweets_payload_v2` for the other arguments.
+
+    Args:
+        path_or_file (str or file): path or file object of the JSON file,
+            possibly gzip, bz2 or xz compressed.
+        cache_size (int, optional): number of normalized referenced tweets &
+            authors, and of tweets remembered for deduplication. Defaults to
+            `REFERENCED_TWEETS_CACHE_SIZE`.
+        buffer_size (int, optional): size of the read buffer. Defaults to
+            `READ_BUFFER_SIZE`.
+
+    Returns:
+        (generator): normalized tweet dicts.
+
+    """
+    normalizer = PayloadV2Normalizer(
+        locale=locale,
+        extract_referenced_tweets=extract_referenced_tweets,
+        collection_source=collection_source,
+        cache_size=cache_size,
+        stats=stats,
+        fields=fields,
+    )
+
+    return generate_normalized_large_payload_v2(path_or_file, normalizer, buffer_size)
+
+
+def generate_normalized_large_payload_v2(path_or_file, normalizer, buffer_size):
+    seekable = not hasattr(path_or_file, "read") or path_or_file.seekable()
+    start = path_or_file.tell() if hasattr(path_or_file, "read") and seekable else None
+
+    includes = None
+    indices = None
+    meta = None
+    has_data = False
+    data_offset = None
+
+    with open_payloads_file(path_or_file, buffer_size) as f:
+        scanner = JSONStreamScanner(f, buffer_size)
+
+        if scanner.peek() != "{":
+            raise TypeError("given value is not a Twitter API v2 payload")
+
+        scanner.pos += 1
+
+        if scanner.peek() == "}":
+            scanner.pos += 1
+        else:
+            while True:
+                key = scanner.decode()
+                scanner.expect(":")
+
+                if key == "includes":
+                    includes = scanner.decode()
+
+                    if not isinstance(includes, dict):
+                        raise TypeError("given value is not a Twitter API v2 payload")
+
+                    with normalizer.stats.stage("includes_index"):
+                        indices = index_includes_v2({"includes": includes})
+
+                elif key == "data":
+                    has_data = True
+
+                    if indices is not None:
+                        yield from normalizer.generate(scanner.iter_items(), indices)
+                    else:
+                        # NOTE: tweets are skipped until the includes are known
+                        data_offset = scanner.tell()
+
+                        for _ in scanner.iter_items():
+                            pass
+
+                else:
+                    value = scanner.decode()
+
+                    if key == "meta":
+                        meta = value
+
+                if scanner.expect(",}") == "}":
+                    break
+
+    if not has_data:
+        if meta is not None and meta.get("result_count") == 0:
+            return
+
+        raise TypeError("given value is not a Twitter API v2 payload")
+
+    if includes is None:
+        raise TypeError("given value is not a Twitter API v2 payload")
+
+    if data_offset is None:
+        return
+
+    if not seekable:
+        raise TypeError("a seekable file is needed when data come before includes")
+
+    if start is not None:
+        path_or_file.seek(start)
+
+    with open_payloads_file(path_or_file, buffer_size) as f:
+        skip_chars(f, data_offset, buffer_size)
+
+        scanner = JSONStreamScanner(f, buffer_size)
+
+        yield from normalizer.generate(scanner.iter_items(), indices)
+
+
+BOOLEAN_CELLS = {"1": True, "0": False, "True": True, "False": False}
+
+
+def decode_int_cell(cell):
+    if not cell:
+        return None
+
+    try:
+        return int(cell)
+    except ValueError:
+        # NOTE: some exports hold timestamps formatted as floats, e.g. "1610005273.0"
+        return int(float(cell))
+
+
+def decode_float_cell(cell):
+    return float(cell) if cell else None
+
+
+def decode_boolean_cell(cell):
+    return BOOLEAN_CELLS[cell]
+
+
+def make_decode_plural_cell(plural_separator):
+    def decode_plural_cell(cell):
+        return cell.split(plural_separator) if cell else []
+
+    return decode_plural_cell
+
+
+def make_csv_row_decoder(
+    header,
+    plural_fields=(),
+    boolean_fields=(),
+    integer_fields=(),
+    float_fields=(),
+    fields=None,
+    plural_separator: str = "|",
+):
+    """
+    Function resolving once, from a csv header, the decoder of each column
+    of the rows of a csv export of normalized records, and returning a
+    function turning a row into a typed record.
+
+    Plural fields are split on the separator, empty cells being decoded as
+    empty lists, integer & float fields are cast, empty cells being decoded
+    as None, and boolean fields are decoded from 0 or 1, empty cells being
+    left out of the record. Other fields are kept as strings.
+
+    Args:
+        header (list): names of the columns.
+        plural_fields, boolean_fields, integer_fields, float_fields
+            (iterable, optional): names of the typed fields of the schema.
+        fields (iterable, optional): projection on some columns. Defaults
+            to all the columns.
+        plural_separator (str, optional): separator of the plural fields'
+            elements. Defaults to "|".
+
+    Returns:
+        callable: function taking a row and returning a dict.
+
+    """
+    if fields is None:
+        fields = header
+    elif isinstance(fields, str):
+        raise TypeError("fields should be an iterable of field names")
+
+    indices = {field: i for i, field in enumerate(header)}
+    decode_plural_cell = make_decode_plural_cell(plural_separator)
+
+    columns = []
+
+    for field in fields:
+        if field not in indices:
+            raise TypeError("field %r is missing from the csv header" % field)
+
+        if field in plural_fields:
+            decode = decode_plural_cell
+        elif field in boolean_fields:
+            decode = decode_boolean_cell
+        elif field in integer_fields:
+            decode = decode_int_cell
+        elif field in float_fields:
+            decode = decode_float_cell
+        else:
+            decode = None
+
+        columns.append((field, indices[field], decode))
+
+    def decode_csv_row(row):
+        record = {}
+
+        for field, index, decode in columns:
+            cell = row[index]
+
+            if decode is None:
+                record[field] = cell
+
+            # NOTE: empty boolean cells are written by the formatters for
+            # missing fields
+            elif cell or decode is not decode_boolean_cell:
+                record[field] = decode(cell)
+
+        return record
+
+    return decode_csv_row
+
+
+def iter_records_from_csv(
+    path_or_file,
+    plural_fields=(),
+    boolean_fields=(),
+    integer_fields=(),
+    float_fields=(),
+    fields=None,
+    plural_separator: str = "|",
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized records, whose first
+    row is the header, and yielding them as typed records. See
+    `make_csv_row_decoder` for the decoding of the columns.
+
+    Args:
+        path_or_file (str or file): path or file object of the csv file,
+            possibly gzip, bz2 or xz compressed.
+        plural_fields, boolean_fields, integer_fields, float_fields
+            (iterable, optional): names of the typed fields of the schema.
+        fields (iterable, optional): projection on some columns. Defaults
+            to all the columns.
+        plural_separator (str, optional): separator of the plural fields'
+            elements. Defaults to "|".
+        on_error (str, optional): what to do when a row cannot be decoded:
+            "raise" a `PayloadLineError`, "skip" the row, or "collect" the
+            errors into the `errors` list. Defaults to "raise".
+        errors (list, optional): list receiving the `PayloadLineError`
+            instances when `on_error` is "collect".
+        buffer_size (int, optional): size of the read buffer in bytes.
+            Defaults to `READ_BUFFER_SIZE`.
+
+    Returns:
+        (generator): typed records.
+
+    """
+    validate_on_error(on_error, errors)
+
+    if isinstance(fields, str):
+        raise TypeError("fields should be an iterable of field names")
+
+    return generate_records_from_csv(
+        path_or_file,
+        dict(
+            plural_fields=set(plural_fields),
+            boolean_fields=set(boolean_fields),
+            integer_fields=set(integer_fields),
+            float_fields=set(float_fields),
+            fields=fields,
+            plural_separator=plural_separator,
+        ),
+        on_error,
+        errors,
+        buffer_size,
+    )
+
+
+def generate_records_from_csv(path_or_file, schema, on_error, errors, buffer_size):
+    with open_payloads_file(path_or_file, buffer_size, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+
+        if header is None:
+            return
+
+        decode_csv_row = make_csv_row_decoder(header, **schema)
+
+        for row in reader:
+            if not row:
+                continue
+
+            try:
+                record = decode_csv_row(row)
+            except Exception as e:
+                error = PayloadLineError(reader.line_num, row, e)
+
+                if on_error == "raise":
+                    raise error from e
+
+                if on_error == "collect":
+                    errors.append(error)
+
+                continue
+
+            yield record
+
+
+def validate_csv_fields(fields, schema_fields, kind):
+    if fields is None or isinstance(fields, str):
+        return
+
+    for field in fields:
+        if field not in schema_fields:
+            raise TypeError("unknown %s field %r" % (kind, field))
+
+
+def iter_tweets_from_csv(
+    path_or_file,
+    fields=None,
+    plural_separator: str = "|",
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized tweets, as written by
+    `format_tweet_as_csv_row`. See `iter_records_from_csv` for the arguments.
+    """
+    validate_csv_fields(fields, TWEET_FIELDS, "tweet")
+
+    return iter_records_from_csv(
+        path_or_file,
+        plural_fields=TWEET_PLURAL_FIELDS,
+        boolean_fields=TWEET_BOOLEAN_FIELDS,
+        integer_fields=TWEET_INTEGER_FIELDS,
+        float_fields=TWEET_FLOAT_FIELDS,
+        fields=fields,
+        plural_separator=plural_separator,
+        on_error=on_error,
+        errors=errors,
+        buffer_size=buffer_size,
+    )
+
+
+def iter_users_from_csv(
+    path_or_file,
+    fields=None,
+    plural_separator: str = "|",
+    on_error: str = "raise",
+    errors=None,
+    buffer_size: int = READ_BUFFER_SIZE,
+):
+    """
+    Function lazily reading a csv export of normalized users, as written by
+    `format_user_as_csv_row`. See `iter_records_from_csv` for the arguments.
+    """
+    validate_csv_fields(fields, USER_FIELDS, "user")
+
+    return iter_records_from_csv(
+        path_or_file,
+        plural_fields=USER_PLURAL_FIELDS,
+        boolean_fields=USER_BOOLEAN_FIELDS,
+        integer_fields=USER_INTEGER_FIELDS,
+        fields=fields,
+        plural_separator=plural_separator,
+        on_error=on_error,
+        errors=errors,
+        buffer_size=buffer_size,
+    )
@@ -0,0 +1,128 @@
+# =============================================================================
+# Twitwi Normalization Stats
+# =============================================================================
+#
+# Optional collector of the cumulative time spent in, and number of calls to,
+# each stage of the normalizers, in order to find out where a pipeline spends
+# its time. When no collector is enabled, stages are timed by a no-op object.
+#
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Optional
+
+
+class NullStageTimer(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_STAGE_TIMER = NullStageTimer()
+
+
+class StageTimer(object):
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stats.record(self.name, perf_counter() - self.start)
+        return False
+
+
+class NullStats(object):
+    """
+    Stats collector doing nothing, used when stats are disabled.
+    """
+
+    enabled = False
+
+    def stage(self, name: str):
+        return NULL_STAGE_TIMER
+
+    def record(self, name: str, elapsed: float) -> None:
+        pass
+
+    def as_dict(self) -> Dict[str, Dict]:
+        return {}
+
+
+NULL_STATS = NullStats()
+
+
+class NormalizationStats(NullStats):
+    """
+    Stats collector recording the cumulative time (in seconds) and number of
+    calls of each normalization stage.
+
+    Note that stages can be nested, e.g. a "quote" stage includes the time
+    spent in the stages of the quoted post's own normalization.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+
+    def stage(self, name: str) -> StageTimer:
+        return StageTimer(self, name)
+
+    def record(self, name: str, elapsed: float) -> None:
+        entry = self.stages.get(name)
+
+        if entry is None:
+            self.stages[name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def reset(self) -> None:
+        self.stages.clear()
+
+    def as_dict(self) -> Dict[str, Dict]:
+        return {
+            name: {"calls": calls, "time": elapsed}
+            for name, (calls, elapsed) in self.stages.items()
+        }
+
+
+# NOTE: collectors are enabled in the current context only, so that threads &
+# async tasks do not record their timings in each other's collector
+ACTIVE_STATS = ContextVar("twitwi_active_stats", default=NULL_STATS)
+
+
+def resolve_stats(stats: Optional[NullStats] = None) -> NullStats:
+    if stats is None:
+        return ACTIVE_STATS.get()
+
+    return stats
+
+
+@contextmanager
+def collect_stats(stats: Optional[NormalizationStats] = None):
+    """
+    Context manager enabling the given stats collector (a new one if not
+    given), in the current context, for every normalizer called without an
+    explicit `stats` argument.
+    """
+    if stats is None:
+        stats = NormalizationStats()
+
+    token = ACTIVE_STATS.set(stats)
+
+    try:
+        yield stats
+    finally:
+        ACTIVE_STATS.reset(token)
@@ -4,28 +4,160 @@
 #
 # Miscellaneous utility functions.
 #
-from typing import Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
-from pytz import timezone
-from dateutil.parser import parse as parse_date
-from ural import normalize_url, get_normalized_hostname
-from functools import partial
+from ural import normalize_url, get_normalized_hostname, is_url as ural_is_url
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from time import time
 
 from twitwi.constants import (
-    SOURCE_DATETIME_FORMAT,
-    SOURCE_DATETIME_FORMAT_V2,
     FORMATTED_TWEET_DATETIME_FORMAT,
     FORMATTED_FULL_DATETIME_FORMAT,
     CANONICAL_URL_KWARGS,
     CANONICAL_HOSTNAME_KWARGS,
+    URL_CACHE_SIZE,
     PRE_SNOWFLAKE_LAST_TWEET_ID,
     OFFSET_TIMESTAMP,
 )
+from twitwi.dates import UTC_TIMEZONE, cached_parse_dates
 
-UTC_TIMEZONE = timezone("UTC")
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-custom_normalize_url = partial(normalize_url, **CANONICAL_URL_KWARGS)
+
+class LRUCache(object):
+    """
+    Bounded mapping evicting its least recently used items, and keeping
+    track of its hits, misses & evictions.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, key):
+        try:
+            value = self.items[key]
+        except KeyError:
+            self.misses += 1
+            raise
+
+        self.items.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        if self.maxsize <= 0:
+            return
+
+        items = self.items
+        items[key] = value
+        items.move_to_end(key)
+
+        if len(items) > self.maxsize:
+            items.popitem(last=False)
+            self.evictions += 1
+
+    def __delitem__(self, key):
+        del self.items[key]
+
+    def update(self, other) -> None:
+        if self.maxsize <= 0:
+            return
+
+        items = self.items
+
+        for key, value in other.items():
+            items[key] = value
+            items.move_to_end(key)
+
+        while len(items) > self.maxsize:
+            items.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+
+        while len(self.items) > max(maxsize, 0):
+            self.items.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.items.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            "size": len(self.items),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# NOTE: a single cache is shared by all the url helpers below, which is why
+# its keys are prefixed by the kind of operation performed
+URL_CACHE = LRUCache(maxsize=URL_CACHE_SIZE)
+
+NORMALIZE_URL_KEY = 0
+SAFE_NORMALIZE_URL_KEY = 1
+NORMALIZED_HOSTNAME_KEY = 2
+IS_URL_KEY = 3
+
+MISSING = object()
+
+
+def set_url_cache_size(maxsize: int) -> None:
+    URL_CACHE.resize(maxsize)
+
+
+def clear_url_cache() -> None:
+    URL_CACHE.clear()
+
+
+def get_url_cache_stats():
+    return URL_CACHE.stats()
+
+
+def custom_normalize_url(url, **kwargs):
+    if kwargs:
+        return normalize_url(url, **{**CANONICAL_URL_KWARGS, **kwargs})
+
+    key = (NORMALIZE_URL_KEY, url)
+    normalized = URL_CACHE.get(key, MISSING)
+
+    if normalized is MISSING:
+        normalized = normalize_url(url, **CANONICAL_URL_KWARGS)
+        URL_CACHE[key] = normalized
+
+    return normalized
 
 
 def safe_normalize_url(url):
@@ -35,82 +167,175 @@ def safe_normalize_url(url):
     if "/did:plc:" in url:
         return url
 
-    try:
-        return custom_normalize_url(url)
-    except Exception:
-        # In case of error, return the original URL. Possibly not a valid URL, e.g. url containing double slashes
-        return url
+    key = (SAFE_NORMALIZE_URL_KEY, url)
+    normalized = URL_CACHE.get(key, MISSING)
 
+    if normalized is MISSING:
+        try:
+            normalized = normalize_url(url, **CANONICAL_URL_KWARGS)
+        except Exception:
+            # In case of error, return the original URL. Possibly not a valid URL, e.g. url containing double slashes
+            normalized = url
 
-custom_get_normalized_hostname = partial(
-    get_normalized_hostname, **CANONICAL_HOSTNAME_KWARGS
-)
+        URL_CACHE[key] = normalized
 
+    return normalized
 
-def get_collection_time():
-    return datetime.now().strftime(FORMATTED_FULL_DATETIME_FORMAT)
 
+def custom_get_normalized_hostname(url, **kwargs):
+    if kwargs:
+        return get_normalized_hostname(url, **{**CANONICAL_HOSTNAME_KWARGS, **kwargs})
 
-def get_dates(
-    date_str: str, locale=None, source: str = "v1", millisecond_timestamp: bool = False
-) -> Tuple[int, str]:
-    if source not in ["v1", "v2", "iframe", "bluesky"]:
-        raise Exception("source should be one of v1, v2, iframe or bluesky")
+    key = (NORMALIZED_HOSTNAME_KEY, url)
+    hostname = URL_CACHE.get(key, MISSING)
 
-    if locale is None:
-        locale = UTC_TIMEZONE
+    if hostname is MISSING:
+        hostname = get_normalized_hostname(url, **CANONICAL_HOSTNAME_KWARGS)
+        URL_CACHE[key] = hostname
 
-    # Let's pray we never see a negative year...
-    year_zero = date_str.startswith("0000") or all(
-        c == "0" for c in date_str.split("-")[0]
-    )
+    return hostname
+
+
+def is_url(url) -> bool:
+    key = (IS_URL_KEY, url)
+    result = URL_CACHE.get(key, MISSING)
+
+    if result is MISSING:
+        result = ural_is_url(url)
+        URL_CACHE[key] = result
+
+    return result
+
+
+def format_collection_time(dt: datetime) -> str:
+    return dt.strftime(FORMATTED_FULL_DATETIME_FORMAT)
+
+
+class CollectionClock(object):
+    """
+    Default collection clock, stamping each normalized record with the
+    current local time.
+    """
+
+    def __call__(self) -> str:
+        return format_collection_time(datetime.now())
+
+
+class FixedCollectionClock(CollectionClock):
+    """
+    Collection clock always returning the same injected value, which is
+    useful to produce reproducible output.
+    """
+
+    def __init__(self, value: Union[str, datetime]):
+        if isinstance(value, datetime):
+            value = format_collection_time(value)
+
+        self.value = value
+
+    def __call__(self) -> str:
+        return self.value
+
+
+class BatchCollectionClock(FixedCollectionClock):
+    """
+    Collection clock stamping the time once per batch: the value only changes
+    when `stamp` is called, typically before normalizing a new batch.
+    """
+
+    def __init__(self):
+        self.stamp()
+
+    def stamp(self) -> str:
+        self.value = format_collection_time(datetime.now())
+        return self.value
+
+
+class TickCollectionClock(CollectionClock):
+    """
+    Collection clock caching the current time for the duration of a
+    wall-clock tick (one second by default).
+    """
+
+    def __init__(self, resolution: float = 1.0):
+        if resolution <= 0:
+            raise ValueError("resolution should be positive")
+
+        self.resolution = resolution
+        self.tick = None
+        self.value = None
+
+    def __call__(self) -> str:
+        tick = time() // self.resolution
+
+        if tick != self.tick:
+            self.tick = tick
+            self.value = format_collection_time(
+                datetime.fromtimestamp(tick * self.resolution)
+            )
+
+        return self.value
+
+
+# NOTE: the process-wide default clock, replaced in the current context by
+# `collection_clock` so that threads & async tasks do not interfere
+COLLECTION_CLOCK = CollectionClock()
+CURRENT_COLLECTION_CLOCK = ContextVar("twitwi_collection_clock", default=None)
+
+
+def resolve_collection_clock(clock: Union[CollectionClock, str, datetime]):
+    if not callable(clock):
+        clock = FixedCollectionClock(clock)
+
+    return clock
+
+
+def set_collection_clock(clock: Union[CollectionClock, str, datetime]):
+    """
+    Replace the process-wide default clock used to fill the `collection_time`
+    field of normalized records, when no clock was set for the current
+    context by `collection_clock`. A string or a datetime will be used as a
+    fixed value. Returns the previous default clock.
+    """
+    global COLLECTION_CLOCK
+
+    previous_clock = COLLECTION_CLOCK
+    COLLECTION_CLOCK = resolve_collection_clock(clock)
+
+    return previous_clock
+
+
+def get_collection_clock() -> CollectionClock:
+    """
+    Returns the clock of the current context, or the process-wide default one.
+    """
+    clock = CURRENT_COLLECTION_CLOCK.get()
+
+    return COLLECTION_CLOCK if clock is None else clock
+
+
+@contextmanager
+def collection_clock(clock: Union[CollectionClock, str, datetime]):
+    clock = resolve_collection_clock(clock)
+    token = CURRENT_COLLECTION_CLOCK.set(clock)
 
     try:
-        parsed_datetime = datetime.strptime(
-            date_str,
-            SOURCE_DATETIME_FORMAT if source == "v1" else SOURCE_DATETIME_FORMAT_V2,
-        )
-    except ValueError as e:
-        if source != "bluesky":
-            raise e
-        # Yes, it seems that some people were active in year 0...
-        # see by yourself: https://bsky.app/profile/koro.icu/post/3kbpuogc6fz2o
-        if year_zero:
-            date_str_fixed = "0001" + date_str[4:]
-            parsed_datetime = parse_date(date_str_fixed)
-        else:
-            parsed_datetime = parse_date(date_str)
-
-    utc_datetime = parsed_datetime
-    if not parsed_datetime.tzinfo:
-        utc_datetime = UTC_TIMEZONE.localize(parsed_datetime)
-    locale_datetime = utc_datetime.astimezone(locale)
-
-    formatted_date_str = datetime.strftime(
-        locale_datetime,
-        FORMATTED_FULL_DATETIME_FORMAT
-        if source == "bluesky"
-        else FORMATTED_TWEET_DATETIME_FORMAT,
-    )
+        yield clock
+    finally:
+        CURRENT_COLLECTION_CLOCK.reset(token)
 
-    timestamp = int(utc_datetime.timestamp())
 
-    if year_zero:
-        # Subtract one year (year 0001 is not a leap year) in seconds
-        timestamp -= 31536000
-        # Doing like so using split because on ubuntu, datetime.strftime on year with less than 4 digits
-        # only returns 1 digit for year 0 (e.g. "0-05-12...") instead of 4 digits ("0000-05-12..."),
-        # whereas on macOS and Windows it returns 4 digits.
-        formatted_date_str = "0000-" + formatted_date_str.split("-", 1)[1]
+def get_collection_time() -> str:
+    return get_collection_clock()()
 
-    if millisecond_timestamp:
-        timestamp *= 1000
-        timestamp += utc_datetime.microsecond / 1000
 
-    return (
-        int(timestamp),
-        formatted_date_str,
-    )
+def get_dates(
+    date_str: str, locale=None, source: str = "v1", millisecond_timestamp: bool = False
+) -> Tuple[int, str]:
+    if source not in ["v1", "v2", "iframe", "bluesky"]:
+        raise Exception("source should be one of v1, v2, iframe or bluesky")
+
+    return cached_parse_dates(date_str, locale, source, millisecond_timestamp)
 
 
 def validate_payload_v2(payload):
@@ -163,5 +388,138 @@ def get_dates_from_id(tweet_id, locale=None):
     )
 
 
+# NOTE: number of bits used by the worker, process & sequence parts of a
+# snowflake id, below its millisecond timestamp
+SNOWFLAKE_TIMESTAMP_SHIFT = 22
+
+
+def is_numpy_array(value) -> bool:
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def get_timestamps_from_ids(tweet_ids):
+    """
+    Batch version of `get_timestamp_from_id`.
+
+    Given a NumPy array, returns a masked int64 array where ids predating
+    snowflake are masked. Given any other iterable, returns a list where
+    those ids are mapped to None.
+    """
+    if is_numpy_array(tweet_ids):
+        tweet_ids = tweet_ids.astype(np.int64, copy=False)
+        timestamps = (
+            (tweet_ids >> SNOWFLAKE_TIMESTAMP_SHIFT) + OFFSET_TIMESTAMP
+        ) // 1000
+
+        return np.ma.masked_array(
+            timestamps, mask=tweet_ids <= PRE_SNOWFLAKE_LAST_TWEET_ID
+        )
+
+    timestamps = []
+
+    for tweet_id in tweet_ids:
+        tweet_id = int(tweet_id)
+
+        if tweet_id > PRE_SNOWFLAKE_LAST_TWEET_ID:
+            timestamps.append(
+                ((tweet_id >> SNOWFLAKE_TIMESTAMP_SHIFT) + OFFSET_TIMESTAMP) // 1000
+            )
+        else:
+            timestamps.append(None)
+
+    return timestamps
+
+
+def format_timestamps(timestamps: Iterable[Optional[int]], locale=None) -> List:
+    if locale is None:
+        locale = UTC_TIMEZONE
+
+    # NOTE: ids being sorted most of the time, consecutive ones are likely
+    # to share the same second
+    last_timestamp = None
+    last_formatted = None
+
+    formatted = []
+
+    for timestamp in timestamps:
+        if timestamp is None:
+            formatted.append(None)
+            continue
+
+        if timestamp != last_timestamp:
+            last_timestamp = timestamp
+            last_formatted = datetime.strftime(
+                datetime.fromtimestamp(timestamp, locale),
+                FORMATTED_TWEET_DATETIME_FORMAT,
+            )
+
+        formatted.append(last_formatted)
+
+    return formatted
+
+
+def get_dates_from_ids(tweet_ids, locale=None):
+    """
+    Batch version of `get_dates_from_id`, returning a tuple of timestamps
+    (as returned by `get_timestamps_from_ids`) and formatted local dates.
+
+    Given a NumPy array, dates are returned as a masked array of strings.
+    Ids predating snowflake are masked, or mapped to None, instead of
+    raising.
+    """
+    timestamps = get_timestamps_from_ids(tweet_ids)
+
+    if not is_numpy_array(timestamps):
+        return timestamps, format_timestamps(timestamps, locale)
+
+    if locale is None or locale is UTC_TIMEZONE:
+        dates = np.datetime_as_string(
+            timestamps.filled(0).astype("datetime64[s]"), unit="s"
+        )
+    else:
+        dates = np.array(format_timestamps(timestamps.filled(0).tolist(), locale))
+
+    return timestamps, np.ma.masked_array(dates, mask=np.ma.getmaskarray(timestamps))
+
+
+def get_timestamp_in_milliseconds(value: Union[datetime, int, float]) -> int:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = UTC_TIMEZONE.localize(value)
+
+        value = value.timestamp()
+
+    return int(round(value * 1000))
+
+
+def get_id_range_from_dates(
+    start: Union[datetime, int, float], end: Union[datetime, int, float]
+) -> Tuple[int, int]:
+    """
+    Return the inclusive range of snowflake ids, as a (min_id, max_id) tuple,
+    that tweets posted between start and end (both inclusive, at the
+    millisecond) can have. Dates can be given as datetimes (naive ones being
+    considered as UTC) or UNIX timestamps in seconds.
+
+    Since ids predating snowflake cannot be dated, min_id is never lower than
+    PRE_SNOWFLAKE_LAST_TWEET_ID + 1, and max_id never lower than
+    PRE_SNOWFLAKE_LAST_TWEET_ID, meaning that min_id > max_id when the range
+    is entirely anterior to snowflake.
+    """
+    start_ms = get_timestamp_in_milliseconds(start)
+    end_ms = get_timestamp_in_milliseconds(end)
+
+    if end_ms < start_ms:
+        raise ValueError("end should not be anterior to start")
+
+    min_id = max(start_ms - OFFSET_TIMESTAMP, 0) << SNOWFLAKE_TIMESTAMP_SHIFT
+    max_id = ((end_ms - OFFSET_TIMESTAMP + 1) << SNOWFLAKE_TIMESTAMP_SHIFT) - 1
+
+    return (
+        max(min_id, PRE_SNOWFLAKE_LAST_TWEET_ID + 1),
+        max(max_id, PRE_SNOWFLAKE_LAST_TWEET_ID),
+    )
+
+
 def format_profile_url(user_screen_name):
     return f"https://twitter.com/{user_screen_name}"
@@ -0,0 +1,201 @@
+# =============================================================================
+# Twitwi CSV Writers
+# =============================================================================
+#
+# Buffered writers formatting normalized records as csv rows, using the
+# compiled row formatters of `twitwi.formatters`, and writing them in large
+# chunks to a path or file object, optionally gzip compressed.
+#
+import io
+import csv
+import gzip
+from itertools import islice
+
+from twitwi.constants import (
+    TWEET_FIELDS,
+    TWEET_FIELDS_TCAT,
+    TWEET_PLURAL_FIELDS,
+    TWEET_BOOLEAN_FIELDS,
+    USER_FIELDS,
+    USER_PLURAL_FIELDS,
+    USER_BOOLEAN_FIELDS,
+    WRITE_BUFFER_SIZE,
+    WRITE_BATCH_SIZE,
+)
+from twitwi.formatters import compile_csv_row_formatter, TCAT_SOURCES
+
+
+class CSVWriter(object):
+    """
+    Buffered csv writer of normalized records, whose schema is given by the
+    `fields`, `plural_fields` & `boolean_fields` class attributes of its
+    subclasses, and optionally by a `sources` mapping, see
+    `compile_csv_row_formatter`.
+
+    Args:
+        path_or_file (str or file): path or file object, binary or text, to
+            write to. File objects given by the caller are flushed but left
+            open when the writer is closed.
+        write_header (bool, optional): whether to write the header row.
+            Defaults to `True`.
+        compress (bool, optional): whether to gzip the output. Defaults to
+            `None`, meaning only paths ending with ".gz" are compressed.
+        plural_separator (str, optional): separator of the plural fields'
+            elements. Defaults to "|".
+        allow_erroneous_plurals (bool, optional): whether to write None
+            elements of plural fields as empty strings. Defaults to `False`.
+        encoding (str, optional): encoding of the output. Defaults to "utf-8".
+        buffer_size (int, optional): number of characters buffered before
+            being written. Defaults to `WRITE_BUFFER_SIZE`.
+        delimiter (str, optional): delimiter of the cells, e.g. "\\t" to
+            write tsv files. Defaults to ",".
+
+    Attributes:
+        rows_written (int): number of rows written, header excluded.
+        bytes_written (int): number of bytes written, before compression.
+
+    """
+
+    fields = []
+    plural_fields = []
+    boolean_fields = []
+    sources = None
+
+    def __init__(
+        self,
+        path_or_file,
+        write_header: bool = True,
+        compress=None,
+        plural_separator: str = "|",
+        allow_erroneous_plurals: bool = False,
+        encoding: str = "utf-8",
+        buffer_size: int = WRITE_BUFFER_SIZE,
+        delimiter: str = ",",
+    ):
+        owned = not hasattr(path_or_file, "write")
+
+        if compress is None:
+            compress = owned and str(path_or_file).endswith(".gz")
+
+        if compress and isinstance(path_or_file, io.TextIOBase):
+            raise TypeError("cannot compress into a text file")
+
+        self.owned = owned
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self.bytes_written = 0
+        self.closed = False
+
+        self.file = open(path_or_file, "wb") if owned else path_or_file
+        self.output = self.file
+        self.text = isinstance(self.output, io.TextIOBase)
+
+        if compress:
+            self.output = gzip.GzipFile(fileobj=self.file, mode="wb")
+
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, delimiter=delimiter)
+        self.format_row = compile_csv_row_formatter(
+            self.fields,
+            self.plural_fields,
+            self.boolean_fields,
+            plural_separator=plural_separator,
+            allow_erroneous_plurals=allow_erroneous_plurals,
+            sources=self.sources,
+        )
+
+        if write_header:
+            self.writer.writerow(self.fields)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def writerow(self, item, item_id=None) -> None:
+        self.writer.writerow(self.format_row(item, item_id))
+        self.rows_written += 1
+
+        if self.buffer.tell() >= self.buffer_size:
+            self.flush_buffer()
+
+    def writerows(self, items) -> None:
+        iterator = iter(items)
+        format_row = self.format_row
+
+        while True:
+            batch = list(islice(iterator, WRITE_BATCH_SIZE))
+
+            if not batch:
+                return
+
+            self.writer.writerows(map(format_row, batch))
+            self.rows_written += len(batch)
+
+            if self.buffer.tell() >= self.buffer_size:
+                self.flush_buffer()
+
+    def flush_buffer(self):
+        data = self.buffer.getvalue()
+
+        if not data:
+            return
+
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+        encoded = data.encode(self.encoding)
+        self.bytes_written += len(encoded)
+
+        self.output.write(data if self.text else encoded)
+
+    def flush(self) -> None:
+        self.flush_buffer()
+        self.output.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.flush_buffer()
+
+        # NOTE: the gzip layer must always be closed to write its trailer
+        if self.output is not self.file:
+            self.output.close()
+
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+        self.closed = True
+
+
+class TweetCSVWriter(CSVWriter):
+    """Buffered csv writer of normalized tweets, see `CSVWriter`."""
+
+    fields = TWEET_FIELDS
+    plural_fields = TWEET_PLURAL_FIELDS
+    boolean_fields = TWEET_BOOLEAN_FIELDS
+
+
+class TweetTCATWriter(CSVWriter):
+    """
+    Buffered csv writer of normalized tweets in DMI-TCAT's format, filling
+    every column of `TWEET_FIELDS_TCAT`, see `CSVWriter`.
+    """
+
+    fields = TWEET_FIELDS_TCAT
+    plural_fields = TWEET_PLURAL_FIELDS
+    boolean_fields = TWEET_BOOLEAN_FIELDS
+    sources = TCAT_SOURCES
+
+
+class UserCSVWriter(CSVWriter):
+    """Buffered csv writer of normalized Twitter users, see `CSVWriter`."""
+
+    fields = USER_FIELDS
+    plural_fields = USER_PLURAL_FIELDS
+    boolean_fields = USER_BOOLEAN_FIELDS